@@ -0,0 +1,100 @@
+"""Startup scenarios run by benchmarks/startup.py in a fresh interpreter.
+
+Usage: python -X importtime benchmarks/drivers.py <scenario>
+
+Each scenario runs a CLI entry point the way a user would and exits as soon
+as startup is over. Toolchain probes are replaced with canned results so
+the numbers don't depend on whether Flutter or FVM is installed.
+"""
+
+import sys
+
+SCENARIOS = ("help", "theme-list", "start")
+
+_PLATFORM_INFO = {
+    "system": "Windows",
+    "release": "10",
+    "version": "10.0.22631",
+    "machine": "AMD64",
+    "python_version": "3.12.0",
+}
+_FLUTTER_INFO = {
+    "installed": True,
+    "current_version": "3.24.0",
+    "latest_version": "3.24.0",
+    "update_available": False,
+}
+_FVM_INFO = {"installed": True, "version": "3.2.1"}
+
+
+def run_cli(args):
+    from fluttercraft.main import app
+
+    try:
+        app(args=args, prog_name="fluttercraft")
+    except SystemExit:
+        pass
+
+
+def run_start():
+    """Run 'fluttercraft start' up to the first prompt."""
+    import platform
+
+    import fluttercraft.commands.start as start
+    from fluttercraft.commands.fvm.version_completions import VersionCompletions
+    from fluttercraft.utils.command_history import PersistentHistory
+    from fluttercraft.utils.themes.service import ThemeDisplayService
+
+    class MockProbes:
+        def start(self):
+            return self
+
+        def wait_fast(self, timeout=None):
+            return dict(_PLATFORM_INFO), dict(_FVM_INFO)
+
+        def result(self, name, default):
+            return dict(_FLUTTER_INFO)
+
+        def on_complete(self, name, callback):
+            callback(dict(_FLUTTER_INFO))
+
+    def load_history(self):
+        # Start from an empty history instead of reading the user's file
+        self._loaded = True
+        return self
+
+    def first_prompt(completer, history):
+        # Reaching the prompt ends startup; EOF makes the REPL exit
+        raise EOFError
+
+    # The interactive shell is only enabled on Windows for now
+    platform.system = lambda: "Windows"
+    start.StartupProbes = MockProbes
+    # Clearing spawns 'cls'/'clear', which isn't what is being measured
+    start.clear_screen = lambda: None
+    ThemeDisplayService.clear_screen = lambda self: None
+    start.prompt_user_with_border = first_prompt
+    # Background work that would race with the measurement: the history
+    # file, the installed-SDK scan and the release index. The release-cache
+    # refresh is only started by the version completions loader, so with
+    # start() stubbed it never runs (and release_cache isn't imported).
+    PersistentHistory.start_loading = load_history
+    VersionCompletions.start = lambda self: self
+    start.start_command()
+
+
+def main(argv):
+    if len(argv) != 2 or argv[1] not in SCENARIOS:
+        sys.exit(f"usage: drivers.py {{{','.join(SCENARIOS)}}}")
+
+    scenario = argv[1]
+    if scenario == "help":
+        run_cli(["--help"])
+    elif scenario == "theme-list":
+        run_cli(["theme", "list"])
+    else:
+        run_start()
+
+
+if __name__ == "__main__":
+    main(sys.argv)
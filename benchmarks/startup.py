@@ -0,0 +1,329 @@
+"""Startup benchmarks for the fluttercraft CLI.
+
+Measures cold and warm startup of 'fluttercraft --help', 'fluttercraft theme
+list' and 'fluttercraft start' (up to the first prompt, with the toolchain
+probes mocked), breaks the import cost down by module, and checks the
+results against the budgets stored in benchmarks/baselines.json.
+
+    python benchmarks/startup.py                    # run and check budgets
+    python benchmarks/startup.py --update-baseline  # store new baselines
+    python benchmarks/startup.py --scenario start --top 30
+
+"Cold" runs start with an empty bytecode cache (a fresh PYTHONPYCACHEPREFIX),
+so every module is compiled; "warm" runs reuse a primed cache. Exits with
+status 1 when a median exceeds its baseline by more than the tolerance.
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from rich.console import Console
+from rich.table import Table
+
+from drivers import SCENARIOS
+
+console = Console()
+
+BENCHMARK_DIR = Path(__file__).resolve().parent
+REPO_ROOT = BENCHMARK_DIR.parent
+BASELINE_FILE = BENCHMARK_DIR / "baselines.json"
+DRIVER = BENCHMARK_DIR / "drivers.py"
+
+# Allowed slowdown over the stored baseline before a run fails
+DEFAULT_TOLERANCE = 0.20
+
+DEFAULT_RUNS = 5
+
+# "import time:     self [us] | cumulative | imported package"
+_IMPORTTIME_LINE = re.compile(
+    r"^import time:\s+(?P<self>\d+)\s+\|\s+(?P<cumulative>\d+)\s+\|(?P<name>.*)$"
+)
+
+
+@dataclass(slots=True)
+class RunResult:
+    """Timings from one interpreter run of a scenario."""
+
+    wall_ms: float
+    # Self import time per module, in microseconds
+    imports: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def import_ms(self) -> float:
+        return sum(self.imports.values()) / 1000
+
+
+@dataclass(slots=True)
+class ScenarioResult:
+    """Median timings of a scenario across several runs."""
+
+    scenario: str
+    cold: List[RunResult]
+    warm: List[RunResult]
+
+    @property
+    def cold_ms(self) -> float:
+        return statistics.median(run.wall_ms for run in self.cold)
+
+    @property
+    def warm_ms(self) -> float:
+        return statistics.median(run.wall_ms for run in self.warm)
+
+    @property
+    def warm_import_ms(self) -> float:
+        return statistics.median(run.import_ms for run in self.warm)
+
+    def module_costs(self) -> Dict[str, float]:
+        """Median self import time per module across warm runs, in ms."""
+        samples = defaultdict(list)
+        for run in self.warm:
+            for module, micros in run.imports.items():
+                samples[module].append(micros)
+        return {
+            module: statistics.median(values + [0] * (len(self.warm) - len(values)))
+            / 1000
+            for module, values in samples.items()
+        }
+
+
+def parse_importtime(stderr: str) -> Dict[str, int]:
+    """Map module name to self import time (us) from -X importtime output."""
+    imports = {}
+    for line in stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            imports[match["name"].strip()] = int(match["self"])
+    return imports
+
+
+def run_once(scenario: str, pycache_prefix: str, home: str) -> RunResult:
+    env = dict(os.environ)
+    env.update(
+        {
+            "PYTHONPATH": os.pathsep.join(
+                filter(None, [str(REPO_ROOT), env.get("PYTHONPATH")])
+            ),
+            "PYTHONPYCACHEPREFIX": pycache_prefix,
+            # Keep the user's theme and caches out of the measurement
+            "HOME": home,
+            "USERPROFILE": home,
+            "COLUMNS": "100",
+        }
+    )
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", str(DRIVER), scenario],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        env=env,
+        check=False,
+    )
+    wall_ms = (time.perf_counter() - started) * 1000
+
+    if completed.returncode != 0:
+        tail = "\n".join(
+            line
+            for line in completed.stderr.splitlines()
+            if not line.startswith("import time:")
+        )[-2000:]
+        raise RuntimeError(f"Scenario '{scenario}' failed:\n{tail}")
+
+    return RunResult(wall_ms=wall_ms, imports=parse_importtime(completed.stderr))
+
+
+def run_scenario(scenario: str, runs: int) -> ScenarioResult:
+    cold, warm = [], []
+    with tempfile.TemporaryDirectory(prefix="fluttercraft-bench-") as workdir:
+        home = os.path.join(workdir, "home")
+        os.makedirs(home)
+
+        for index in range(runs):
+            # A fresh prefix means nothing has been byte-compiled yet
+            cold_prefix = os.path.join(workdir, f"cold-{index}")
+            cold.append(run_once(scenario, cold_prefix, home))
+
+        warm_prefix = os.path.join(workdir, "warm")
+        run_once(scenario, warm_prefix, home)  # prime the bytecode cache
+        for _ in range(runs):
+            warm.append(run_once(scenario, warm_prefix, home))
+
+    return ScenarioResult(scenario=scenario, cold=cold, warm=warm)
+
+
+def aggregate_by_package(costs: Dict[str, float]) -> Dict[str, float]:
+    """Sum module costs by top-level package (fluttercraft.utils, rich, ...)."""
+    packages = defaultdict(float)
+    for module, ms in costs.items():
+        parts = module.split(".")
+        # fluttercraft is split one level deeper, that's where the work is
+        depth = 2 if parts[0] == "fluttercraft" else 1
+        packages[".".join(parts[:depth])] += ms
+    return dict(packages)
+
+
+def load_baselines() -> dict:
+    try:
+        with open(BASELINE_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def save_baselines(results: List[ScenarioResult], baselines: dict) -> None:
+    for result in results:
+        baselines[result.scenario] = {
+            "cold_ms": round(result.cold_ms, 1),
+            "warm_ms": round(result.warm_ms, 1),
+            "warm_import_ms": round(result.warm_import_ms, 1),
+        }
+    temp_file = BASELINE_FILE.with_suffix(".tmp")
+    with open(temp_file, "w", encoding="utf-8") as f:
+        json.dump(baselines, f, indent=2, sort_keys=True)
+        f.write("\n")
+    os.replace(temp_file, BASELINE_FILE)
+
+
+def check_budgets(
+    results: List[ScenarioResult], baselines: dict, tolerance: float
+) -> List[str]:
+    """Return a description of every metric that is over budget."""
+    failures = []
+    for result in results:
+        baseline = baselines.get(result.scenario)
+        if not baseline:
+            continue
+        for metric in ("cold_ms", "warm_ms", "warm_import_ms"):
+            budget = baseline.get(metric)
+            if budget is None:
+                continue
+            measured = getattr(result, metric)
+            if measured > budget * (1 + tolerance):
+                failures.append(
+                    f"{result.scenario} {metric}: {measured:.1f} ms "
+                    f"> {budget:.1f} ms + {tolerance:.0%}"
+                )
+    return failures
+
+
+def _change(measured: float, budget: Optional[float]) -> str:
+    if not budget:
+        return "[dim]-[/]"
+    change = measured / budget - 1
+    style = "red" if change > 0.05 else "green" if change < -0.05 else "dim"
+    return f"[{style}]{change:+.0%}[/]"
+
+
+def print_summary(results: List[ScenarioResult], baselines: dict) -> None:
+    table = Table(title="Startup time (median)", header_style="bold magenta")
+    table.add_column("Scenario", style="cyan")
+    table.add_column("Cold", justify="right")
+    table.add_column("Warm", justify="right")
+    table.add_column("Imports (warm)", justify="right")
+    table.add_column("vs. baseline (warm)", justify="right")
+    for result in results:
+        baseline = baselines.get(result.scenario, {})
+        table.add_row(
+            result.scenario,
+            f"{result.cold_ms:.1f} ms",
+            f"{result.warm_ms:.1f} ms",
+            f"{result.warm_import_ms:.1f} ms",
+            _change(result.warm_ms, baseline.get("warm_ms")),
+        )
+    console.print(table)
+
+
+def print_import_costs(result: ScenarioResult, top: int) -> None:
+    costs = result.module_costs()
+
+    packages = Table(
+        title=f"Import cost by package: {result.scenario}",
+        header_style="bold magenta",
+    )
+    packages.add_column("Package", style="cyan")
+    packages.add_column("Self time", justify="right")
+    for package, ms in sorted(
+        aggregate_by_package(costs).items(), key=lambda item: item[1], reverse=True
+    )[:top]:
+        packages.add_row(package, f"{ms:.1f} ms")
+    console.print(packages)
+
+    modules = Table(
+        title=f"Slowest modules: {result.scenario}", header_style="bold magenta"
+    )
+    modules.add_column("Module", style="cyan")
+    modules.add_column("Self time", justify="right")
+    for module, ms in sorted(costs.items(), key=lambda item: item[1], reverse=True)[
+        :top
+    ]:
+        modules.add_row(module, f"{ms:.1f} ms")
+    console.print(modules)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=SCENARIOS,
+        help="Scenario to run (repeatable; default: all)",
+    )
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help="Allowed slowdown over the baseline, e.g. 0.2 for 20%%",
+    )
+    parser.add_argument(
+        "--top", type=int, default=15, help="Rows in the import cost tables"
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Store this run's medians as the new baselines",
+    )
+    args = parser.parse_args(argv)
+
+    results = []
+    for scenario in args.scenario or SCENARIOS:
+        with console.status(f"Running '{scenario}' ({args.runs} cold, {args.runs} warm)"):
+            results.append(run_scenario(scenario, max(1, args.runs)))
+
+    baselines = load_baselines()
+    for result in results:
+        print_import_costs(result, args.top)
+    print_summary(results, baselines)
+
+    if args.update_baseline:
+        save_baselines(results, baselines)
+        console.print(f"[green]Baselines written to {BASELINE_FILE}[/]")
+        return 0
+
+    failures = check_budgets(results, baselines, args.tolerance)
+    if failures:
+        console.print("[bold red]Startup budget exceeded:[/]")
+        for failure in failures:
+            console.print(f"  {failure}")
+        return 1
+
+    console.print("[bold green]All scenarios within budget.[/]")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,21 +1,23 @@
 """FlutterCraft CLI commands package."""
 
-from fluttercraft.commands.start import start_command
-from fluttercraft.commands.flutter import check_flutter_version
-from fluttercraft.commands.fvm import (
-    check_fvm_version,
-    fvm_install_command,
-    fvm_uninstall_command,
-    fvm_releases_command,
-    fvm_list_command,
-)
-from fluttercraft.commands.help import (
-    show_global_help,
-    show_fvm_help,
-    show_fvm_install_help,
-    show_fvm_uninstall_help,
-    show_fvm_releases_help,
-    show_fvm_list_help,
-    show_clear_help,
-    handle_help_command,
-)
+from fluttercraft.utils.lazy_import import lazy_exports
+
+_EXPORTS = {
+    "start_command": "fluttercraft.commands.start",
+    "check_flutter_version": "fluttercraft.commands.flutter",
+    "check_fvm_version": "fluttercraft.commands.fvm",
+    "fvm_install_command": "fluttercraft.commands.fvm",
+    "fvm_uninstall_command": "fluttercraft.commands.fvm",
+    "fvm_releases_command": "fluttercraft.commands.fvm",
+    "fvm_list_command": "fluttercraft.commands.fvm",
+    "show_global_help": "fluttercraft.commands.help",
+    "show_fvm_help": "fluttercraft.commands.help",
+    "show_fvm_install_help": "fluttercraft.commands.help",
+    "show_fvm_uninstall_help": "fluttercraft.commands.help",
+    "show_fvm_releases_help": "fluttercraft.commands.help",
+    "show_fvm_list_help": "fluttercraft.commands.help",
+    "show_clear_help": "fluttercraft.commands.help",
+    "handle_help_command": "fluttercraft.commands.help",
+}
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, _EXPORTS)
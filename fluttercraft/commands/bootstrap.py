@@ -2,32 +2,69 @@ from __future__ import annotations
 
 from rich.console import Console
 
-from .core import CommandRegistry, CommandExecutor
-from .slash_commands import (
-    AboutSlashCommand,
-    ClearSlashCommand,
-    HelpSlashCommand,
-    QuitSlashCommand,
-    ThemeSlashCommand,
+from .core import CommandRegistry, CommandExecutor, CommandMetadata
+
+_SLASH_MODULE = "fluttercraft.commands.slash_commands"
+
+# Slash commands: (name, help text, class in slash_commands.py)
+_SLASH_COMMANDS = (
+    ("/quit", "Exit FlutterCraft CLI", "QuitSlashCommand"),
+    ("/clear", "Clear the screen and redraw the header", "ClearSlashCommand"),
+    ("/help", "Show help information", "HelpSlashCommand"),
+    ("/about", "Show information about FlutterCraft", "AboutSlashCommand"),
+    ("/theme", "Launch the interactive theme selector", "ThemeSlashCommand"),
+    ("/jobs", "List background jobs", "JobsSlashCommand"),
+    (
+        "/fg",
+        "Follow a background job's output until it finishes",
+        "FgSlashCommand",
+    ),
+    ("/kill", "Stop a background job", "KillSlashCommand"),
+    ("/wait", "Wait for background jobs to finish", "WaitSlashCommand"),
+)
+
+# Core command families
+_COMMAND_FAMILIES = (
+    (
+        CommandMetadata(
+            name="fvm",
+            help_text="Manage Flutter SDK versions through FVM",
+            category="fvm",
+            keywords=("flutter", "sdk", "version", "manager"),
+        ),
+        "fluttercraft.commands.fvm_command:FVMCommand",
+    ),
+    (
+        CommandMetadata(
+            name="flutter",
+            help_text="Run Flutter-related operations",
+            category="flutter",
+            keywords=("flutter", "upgrade", "sdk"),
+        ),
+        "fluttercraft.commands.flutter_command:FlutterCommand",
+    ),
 )
-from .fvm_command import FVMCommand
-from .flutter_command import FlutterCommand
 
 
 def build_command_system(console: Console) -> CommandExecutor:
-    """Create the default command registry and executor."""
+    """Create the default command registry and executor.
+
+    Commands are registered by import path; each implementation module is
+    only imported the first time its command is dispatched.
+    """
 
     registry = CommandRegistry()
 
-    # Slash commands
-    registry.register(QuitSlashCommand())
-    registry.register(ClearSlashCommand())
-    registry.register(HelpSlashCommand())
-    registry.register(AboutSlashCommand())
-    registry.register(ThemeSlashCommand())
+    for name, help_text, class_name in _SLASH_COMMANDS:
+        metadata = CommandMetadata(
+            name=name,
+            help_text=help_text,
+            category="slash",
+            keywords=("slash", "utility"),
+        )
+        registry.register_lazy(metadata, f"{_SLASH_MODULE}:{class_name}")
 
-    # Core command families
-    registry.register(FVMCommand())
-    registry.register(FlutterCommand())
+    for metadata, target in _COMMAND_FAMILIES:
+        registry.register_lazy(metadata, target)
 
     return CommandExecutor(registry=registry, console=console)
@@ -1,5 +1,6 @@
 from .models import CommandContext, CommandResult, CommandMetadata
 from .base import Command
+from .lazy import LazyCommand
 from .registry import CommandRegistry
 from .executor import CommandExecutor
 
@@ -8,6 +9,7 @@ __all__ = [
     "CommandResult",
     "CommandMetadata",
     "Command",
+    "LazyCommand",
     "CommandRegistry",
     "CommandExecutor",
 ]
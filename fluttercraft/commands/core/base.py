@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Iterable
 
@@ -40,5 +41,24 @@ class Command(ABC):
     def execute(self, context: CommandContext, args: list[str]) -> CommandResult:
         """Execute the command and return a standardized result."""
 
+    async def execute_async(
+        self, context: CommandContext, args: list[str]
+    ) -> CommandResult:
+        """Execute the command without blocking the event loop.
+
+        Background jobs run commands through this. The default runs
+        ``execute`` on a worker thread; commands that drive subprocesses
+        through ``run_with_loading_async`` override it to await them directly.
+        """
+        return await asyncio.to_thread(self.execute, context, args)
+
+    def supports_background(self, args: list[str]) -> bool:
+        """Whether ``args`` can run as a background job (``command &``).
+
+        Commands that prompt for input must return False, since a job has
+        no terminal to read from.
+        """
+        return True
+
     def get_metadata(self) -> CommandMetadata:
         return self.metadata
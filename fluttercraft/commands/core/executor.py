@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import asyncio
+import shlex
 from dataclasses import dataclass
 from typing import Callable, Optional
 
 from rich.console import Console
 
 from .base import Command
+from .jobs import get_job_manager
 from .models import CommandContext, CommandResult
 from .registry import CommandRegistry
 
@@ -18,11 +21,52 @@ class CommandExecutor:
     console: Console
 
     def dispatch(self, raw_command: str, context: CommandContext) -> CommandResult:
+        resolved = self._prepare(raw_command)
+        if isinstance(resolved, CommandResult):
+            return resolved
+
+        command, command_token, args, background = resolved
+        if background:
+            return self._start_job(command, command_token, args, context)
+        try:
+            return command.execute(context, args)
+        except Exception as exc:  # noqa: BLE001
+            return self._report_error(command_token, exc)
+
+    async def dispatch_async(
+        self, raw_command: str, context: CommandContext
+    ) -> CommandResult:
+        """Like dispatch(), but awaits ``Command.execute_async``.
+
+        Background jobs run their command through this on the job's own
+        event loop.
+        """
+        resolved = self._prepare(raw_command)
+        if isinstance(resolved, CommandResult):
+            return resolved
+
+        command, command_token, args, background = resolved
+        if background:
+            return self._start_job(command, command_token, args, context)
+        try:
+            return await command.execute_async(context, args)
+        except Exception as exc:  # noqa: BLE001
+            return self._report_error(command_token, exc)
+
+    def _prepare(self, raw_command: str):
+        """Resolve a raw command line to ``(command, token, args, background)``.
+
+        ``background`` is True when the line ends with ``&``. Returns a
+        CommandResult instead when there is nothing to execute.
+        """
         normalized = raw_command.strip()
+        background = normalized.endswith("&") and not normalized.endswith("&&")
+        if background:
+            normalized = normalized[:-1].rstrip()
         if not normalized:
             return CommandResult(success=True)
 
-        tokens = normalized.split()
+        tokens = self._tokenize(normalized)
         command_token = tokens[0]
         args = tokens[1:]
 
@@ -33,14 +77,56 @@ class CommandExecutor:
                 message=f"✗ Unknown command: {command_token}",
                 should_continue=True,
             )
+        return command, command_token, args, background
 
-        try:
-            return command.execute(context, args)
-        except Exception as exc:  # noqa: BLE001
-            self.console.print(
-                f"\n[bold red]An error occurred while running '{command_token}': {exc}[/]"
+    def _start_job(
+        self,
+        command: Command,
+        command_token: str,
+        args: list[str],
+        context: CommandContext,
+    ) -> CommandResult:
+        if not command.supports_background(args):
+            return CommandResult(
+                success=False,
+                message=f"✗ '{command_token}' can't run in the background",
             )
-            return CommandResult(success=False, should_continue=True)
+
+        line = shlex.join([command_token, *args])
+
+        def run() -> CommandResult:
+            # Each job thread runs its own event loop
+            result = asyncio.run(self.dispatch_async(line, context))
+            if result.message:
+                self.console.print(result.message)
+            return result
+
+        job = get_job_manager().start(line, run)
+        return CommandResult(
+            success=True,
+            message=f"[cyan]\\[{job.id}][/] Started in the background: {line}\n"
+            "[dim]Use /jobs to list jobs, /fg to follow output, /kill to stop[/]",
+            payload={"job_id": job.id},
+        )
+
+    def _report_error(self, command_token: str, exc: Exception) -> CommandResult:
+        self.console.print(
+            f"\n[bold red]An error occurred while running '{command_token}': {exc}[/]"
+        )
+        return CommandResult(success=False, should_continue=True)
+
+    @staticmethod
+    def _tokenize(command: str) -> list[str]:
+        """Split on whitespace, keeping quoted arguments such as ">=3.16 <3.22"."""
+        lexer = shlex.shlex(command, posix=True)
+        lexer.whitespace_split = True
+        # Leave backslashes alone so Windows paths survive
+        lexer.escape = ""
+        try:
+            return list(lexer)
+        except ValueError:
+            # Unbalanced quotes; fall back to plain splitting
+            return command.split()
 
     def _resolve_command(self, token: str) -> Optional[Command]:
         # For slash commands we accept exact token
@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+import contextvars
+import io
+import os
+import itertools
+import signal
+import subprocess
+import sys
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+from fluttercraft.utils.terminal_utils import process_observer
+
+from .models import CommandResult
+
+# Lines of output kept per job; older lines are dropped
+JOB_OUTPUT_LINES = 1000
+
+# Job the current thread (or task) is running on behalf of, if any
+_current_job: contextvars.ContextVar[Optional["Job"]] = contextvars.ContextVar(
+    "fluttercraft_current_job", default=None
+)
+
+
+class JobOutput:
+    """Ring buffer of a job's output lines, readable while it grows."""
+
+    def __init__(self, max_lines: int = JOB_OUTPUT_LINES) -> None:
+        self._lines: Deque[str] = deque(maxlen=max_lines)
+        self._partial = ""
+        self._total = 0
+        self._changed = threading.Condition()
+
+    def write(self, text: str) -> None:
+        with self._changed:
+            *lines, self._partial = (self._partial + text).split("\n")
+            for line in lines:
+                self._lines.append(line)
+                self._total += 1
+            self._changed.notify_all()
+
+    def close(self) -> None:
+        with self._changed:
+            if self._partial:
+                self._lines.append(self._partial)
+                self._total += 1
+                self._partial = ""
+            self._changed.notify_all()
+
+    def read_since(self, cursor: int) -> Tuple[List[str], int]:
+        """Return lines written after ``cursor`` and the new cursor.
+
+        Lines that already fell out of the buffer are skipped.
+        """
+        with self._changed:
+            first = self._total - len(self._lines)
+            start = max(cursor, first) - first
+            return list(itertools.islice(self._lines, start, None)), self._total
+
+    def wait(self, timeout: float) -> None:
+        """Block until more output is written or ``timeout`` passes."""
+        with self._changed:
+            self._changed.wait(timeout)
+
+    @property
+    def last_line(self) -> str:
+        with self._changed:
+            return self._partial or (self._lines[-1] if self._lines else "")
+
+
+@dataclass(slots=True)
+class Job:
+    """A command running detached from the prompt."""
+
+    id: int
+    command: str
+    status: str = "running"  # running, done, failed, killed
+    started_at: float = field(default_factory=time.monotonic)
+    finished_at: Optional[float] = None
+    result: Optional[CommandResult] = None
+    output: JobOutput = field(default_factory=JobOutput)
+    _processes: List[object] = field(default_factory=list)
+    _finished: threading.Event = field(default_factory=threading.Event)
+
+    @property
+    def is_running(self) -> bool:
+        return self.status == "running"
+
+    @property
+    def is_finished(self) -> bool:
+        """Whether the command has returned; a killed job may still be exiting."""
+        return self._finished.is_set()
+
+    @property
+    def elapsed(self) -> float:
+        return (self.finished_at or time.monotonic()) - self.started_at
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the job to finish; returns True if it has."""
+        return self._finished.wait(timeout)
+
+    def track_process(self, process) -> None:
+        """Remember a child process so /kill can stop it."""
+        self._processes.append(process)
+
+    def kill(self) -> None:
+        """Terminate the job's child processes and mark it killed.
+
+        The command's own thread can't be interrupted; it finishes once its
+        subprocesses exit, and anything it prints afterwards is discarded.
+        """
+        if not self.is_running:
+            return
+        self.status = "killed"
+        for process in self._processes:
+            if process.returncode is None:
+                _kill_process_tree(process.pid)
+
+
+class _JobAwareStream(io.TextIOBase):
+    """stdout replacement that sends writes from job threads to their job."""
+
+    def __init__(self, stream) -> None:
+        self._stream = stream
+
+    def write(self, text: str) -> int:
+        job = _current_job.get()
+        if job is None:
+            return self._stream.write(text)
+        if job.is_running:
+            job.output.write(text)
+        return len(text)
+
+    def flush(self) -> None:
+        if _current_job.get() is None:
+            self._stream.flush()
+
+    def isatty(self) -> bool:
+        # Jobs render like a pipe: no live redraws, just the final output
+        if _current_job.get() is not None:
+            return False
+        return self._stream.isatty()
+
+    def fileno(self) -> int:
+        return self._stream.fileno()
+
+    @property
+    def encoding(self) -> str:
+        return getattr(self._stream, "encoding", "utf-8")
+
+    def __getattr__(self, name):
+        # Only reached for names we don't define; '_stream' itself can be
+        # missing while the interpreter tears objects down at exit
+        if name == "_stream":
+            raise AttributeError(name)
+        return getattr(self._stream, name)
+
+
+class JobManager:
+    """Runs commands in the background and tracks their output."""
+
+    def __init__(self) -> None:
+        self._jobs: Dict[int, Job] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self.notify: Callable[[str], None] = print
+
+    def start(self, command: str, runner: Callable[[], CommandResult]) -> Job:
+        """Run ``runner`` on a background thread as a new job."""
+        _install_stdout_router()
+
+        with self._lock:
+            job = Job(id=next(self._ids), command=command)
+            self._jobs[job.id] = job
+
+        def run() -> None:
+            _current_job.set(job)
+            process_observer.set(job.track_process)
+            try:
+                result = runner()
+            except BaseException as exc:  # noqa: BLE001
+                job.output.write(f"\nError: {exc}\n")
+                result = CommandResult(success=False)
+            job.output.close()
+            job.result = result
+            job.finished_at = time.monotonic()
+            if job.status == "running":
+                job.status = "done" if result.success else "failed"
+            job._finished.set()
+            # The notice is for the terminal, not the job's own output
+            _current_job.set(None)
+            self.notify(
+                f"[{job.id}] {job.status.capitalize()}  {job.command} "
+                f"({format_elapsed(job.elapsed)})"
+            )
+
+        threading.Thread(
+            target=run, name=f"fluttercraft-job-{job.id}", daemon=True
+        ).start()
+        return job
+
+    def get(self, job_id: int) -> Optional[Job]:
+        return self._jobs.get(job_id)
+
+    def list_jobs(self) -> List[Job]:
+        with self._lock:
+            return list(self._jobs.values())
+
+    def running(self) -> List[Job]:
+        return [job for job in self.list_jobs() if not job.is_finished]
+
+    def prune(self) -> None:
+        """Forget finished jobs."""
+        with self._lock:
+            self._jobs = {
+                i: j for i, j in self._jobs.items() if not j.is_finished
+            }
+
+
+def current_job() -> Optional[Job]:
+    """Return the job the caller is running inside, if any."""
+    return _current_job.get()
+
+
+def format_elapsed(seconds: float) -> str:
+    minutes, seconds = divmod(int(seconds), 60)
+    return f"{minutes}m {seconds:02d}s" if minutes else f"{seconds}s"
+
+
+def _kill_process_tree(pid: int) -> None:
+    # Shell commands leave the real work to grandchildren, so kill them too
+    try:
+        if os.name == "nt":
+            subprocess.run(
+                ["taskkill", "/F", "/T", "/PID", str(pid)],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                check=False,
+            )
+        elif os.getpgid(pid) == pid:
+            os.killpg(pid, signal.SIGKILL)
+        else:
+            os.kill(pid, signal.SIGKILL)
+    except (OSError, subprocess.SubprocessError):
+        pass
+
+
+def _install_stdout_router() -> None:
+    if not isinstance(sys.stdout, _JobAwareStream):
+        sys.stdout = _JobAwareStream(sys.stdout)
+
+
+# Global job manager instance
+_job_manager: Optional[JobManager] = None
+
+
+def get_job_manager() -> JobManager:
+    """Get the global job manager instance.
+
+    Returns:
+        Global JobManager instance
+    """
+    global _job_manager
+    if _job_manager is None:
+        _job_manager = JobManager()
+    return _job_manager
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import importlib
+import threading
+from typing import Optional
+
+from .base import Command
+from .models import CommandContext, CommandMetadata, CommandResult
+
+
+class LazyCommand(Command):
+    """Placeholder that imports and builds the real command on first use.
+
+    ``target`` is an import path such as
+    ``"fluttercraft.commands.fvm_command:FVMCommand"``; the class is
+    instantiated without arguments.
+    """
+
+    def __init__(self, metadata: CommandMetadata, target: str) -> None:
+        super().__init__(metadata)
+        module_name, _, attribute = target.partition(":")
+        if not module_name or not attribute:
+            raise ValueError(f"Invalid command target '{target}'")
+        self.target = target
+        self._command: Optional[Command] = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._command is not None
+
+    def load(self) -> Command:
+        """Import the command's module and instantiate it (once)."""
+        with self._lock:
+            if self._command is None:
+                module_name, _, attribute = self.target.partition(":")
+                module = importlib.import_module(module_name)
+                command = getattr(module, attribute)()
+                # Lookups and help use the registered metadata until now
+                if command.metadata != self.metadata:
+                    raise ValueError(
+                        f"'{self.target}' provides {command.metadata!r}, "
+                        f"but it was registered as {self.metadata!r}"
+                    )
+                self._command = command
+            return self._command
+
+    def execute(self, context: CommandContext, args: list[str]) -> CommandResult:
+        return self.load().execute(context, args)
+
+    async def execute_async(
+        self, context: CommandContext, args: list[str]
+    ) -> CommandResult:
+        return await self.load().execute_async(context, args)
+
+    def supports_background(self, args: list[str]) -> bool:
+        return self.load().supports_background(args)
@@ -4,6 +4,7 @@ from collections import defaultdict
 from typing import Dict, Iterable, List, Optional
 
 from .base import Command
+from .lazy import LazyCommand
 from .models import CommandMetadata
 
 
@@ -28,6 +29,14 @@ class CommandRegistry:
 
         self._by_category[command.category].append(command)
 
+    def register_lazy(self, metadata: CommandMetadata, target: str) -> None:
+        """Register a command by import path, e.g. ``"package.module:Class"``.
+
+        The module is imported on first dispatch; until then only ``metadata``
+        is used, for lookup and completions.
+        """
+        self.register(LazyCommand(metadata, target))
+
     def get(self, token: str) -> Optional[Command]:
         return self._commands.get(token.lower())
 
@@ -2,15 +2,18 @@
 
 import re
 from fluttercraft.utils.terminal_utils import run_with_loading
+from fluttercraft.utils.probe_cache import get_probe_cache
 
 
-def check_flutter_version(silent=False):
+def check_flutter_version(silent=False, use_cache=False):
     """Check if Flutter is installed and get version information.
 
     Uses only 'flutter upgrade --verify-only' to check both installation and updates.
+    Every completed check is written to the probe cache.
 
     Args:
         silent: If True, suppress all loading indicators and output
+        use_cache: If True, return a still-valid cached result without running Flutter
 
     Returns:
         dict: {
@@ -20,10 +23,16 @@ def check_flutter_version(silent=False):
             "update_available": bool
         }
     """
+    if use_cache:
+        cached = get_probe_cache().get("flutter")
+        if cached is not None:
+            return cached
+
     flutter_installed = False
     current_version = None
     latest_version = None
     update_available = False
+    probe_completed = False
 
     try:
         # Use only 'flutter upgrade --verify-only' to check everything at once
@@ -61,6 +70,8 @@ def check_flutter_version(silent=False):
                 show_output_on_failure=False,
             )
 
+        probe_completed = True
+
         if upgrade_process.returncode == 0:
             flutter_installed = True
             output = upgrade_process.stdout
@@ -94,6 +105,7 @@ def check_flutter_version(silent=False):
     except FileNotFoundError:
         # Flutter command not found
         flutter_installed = False
+        probe_completed = True
     except Exception as e:
         # Catch any other exceptions (timeout, etc.)
         if not silent:
@@ -102,9 +114,15 @@ def check_flutter_version(silent=False):
             console = Console()
             console.print(f"[dim]Note: Could not check Flutter version: {str(e)}[/]")
 
-    return {
+    flutter_info = {
         "installed": flutter_installed,
         "current_version": current_version,
         "latest_version": latest_version,
         "update_available": update_available,
     }
+
+    # Only remember definitive answers, not timeouts or other failures
+    if probe_completed:
+        get_probe_cache().set("flutter", flutter_info)
+
+    return flutter_info
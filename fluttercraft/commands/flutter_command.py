@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from typing import List
 
 from rich.console import Console
@@ -11,12 +12,13 @@ from fluttercraft.commands.core.models import (
     CommandResult,
 )
 from fluttercraft.commands.flutter.version import check_flutter_version
-from fluttercraft.utils.terminal_utils import run_with_loading
+from fluttercraft.utils.terminal_utils import run_with_loading_async
 from fluttercraft.utils.themed_display import (
     display_themed_help,
     format_text,
 )
 from fluttercraft.utils.beautiful_display import update_system_info
+from fluttercraft.utils.probe_cache import get_probe_cache
 
 
 class FlutterCommand(Command):
@@ -45,7 +47,7 @@ class FlutterCommand(Command):
         remaining = args[1:]
 
         if subcommand == "upgrade":
-            return self._handle_upgrade(context, remaining)
+            return asyncio.run(self._handle_upgrade(context, remaining))
 
         if subcommand in {"help", "--help", "-h"}:
             display_themed_help()
@@ -62,7 +64,15 @@ class FlutterCommand(Command):
             ),
         )
 
-    def _handle_upgrade(
+    async def execute_async(
+        self, context: CommandContext, args: List[str]
+    ) -> CommandResult:
+        if args and args[0].lower() == "upgrade":
+            return await self._handle_upgrade(context, args[1:])
+        # Everything else only prints
+        return self.execute(context, args)
+
+    async def _handle_upgrade(
         self, context: CommandContext, args: List[str]
     ) -> CommandResult:
         console: Console = context.console
@@ -87,7 +97,7 @@ class FlutterCommand(Command):
             else format_text("warning", "Upgrading Flutter...", bold=True)
         )
 
-        result = run_with_loading(
+        result = await run_with_loading_async(
             cmd,
             status_message=status_message,
             should_display_command=True,
@@ -96,6 +106,10 @@ class FlutterCommand(Command):
             show_status_message=True,
         )
 
+        # An upgrade (even a failed one) may have changed the installed SDK
+        if not is_verify_only:
+            get_probe_cache().invalidate("flutter")
+
         if result.returncode != 0:
             console.print(
                 format_text("error", "✗ Flutter upgrade command failed!", bold=True)
@@ -113,7 +127,7 @@ class FlutterCommand(Command):
                 )
             )
 
-        updated_info = check_flutter_version(silent=True)
+        updated_info = await asyncio.to_thread(check_flutter_version, silent=True)
         if updated_info != context.flutter_info:
             context.flutter_info = updated_info
             console.print(
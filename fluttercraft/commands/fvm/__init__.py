@@ -1,15 +1,14 @@
 """FVM commands for FlutterCraft CLI."""
 
-from fluttercraft.commands.fvm.version import check_fvm_version
-from fluttercraft.commands.fvm.install import fvm_install_command
-from fluttercraft.commands.fvm.uninstall import fvm_uninstall_command
-from fluttercraft.commands.fvm.releases import fvm_releases_command
-from fluttercraft.commands.fvm.list import fvm_list_command
+from fluttercraft.utils.lazy_import import lazy_exports
 
-__all__ = [
-    "check_fvm_version",
-    "fvm_install_command",
-    "fvm_uninstall_command",
-    "fvm_releases_command",
-    "fvm_list_command",
-]
+_EXPORTS = {
+    "check_fvm_version": "fluttercraft.commands.fvm.version",
+    "fvm_install_command": "fluttercraft.commands.fvm.install",
+    "fvm_uninstall_command": "fluttercraft.commands.fvm.uninstall",
+    "fvm_releases_command": "fluttercraft.commands.fvm.releases",
+    "fvm_list_command": "fluttercraft.commands.fvm.list",
+    "fvm_install_sdks_command": "fluttercraft.commands.fvm.sdk_install",
+}
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,545 @@
+"""Data backend for FVM release and installed-version listings.
+
+Installed SDKs are read straight from the FVM cache directory when it can be
+located. Otherwise, and for releases, this prefers FVM's machine-readable
+``fvm api`` commands (FVM 3+) and falls back to scraping the box-drawn tables
+printed by ``fvm releases``/``fvm list`` on older installations.
+"""
+
+import json
+import os
+import platform
+import re
+import subprocess
+from contextlib import nullcontext
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+from rich.console import Console
+
+from fluttercraft.utils.terminal_utils import run_with_loading
+from fluttercraft.commands.fvm.semver import sort_by_version
+from fluttercraft.commands.fvm.models import (
+    FlutterRelease,
+    ReleaseCatalog,
+    InstalledVersion,
+    InstalledCatalog,
+)
+
+console = Console()
+
+CHANNELS = ("stable", "beta", "dev")
+
+_ANSI_ESCAPE = re.compile(r"\x1b\[[0-9;]*[mK]")
+
+# Whether the installed FVM understands 'fvm api'; None until first probed
+_api_supported: Optional[bool] = None
+
+
+class FVMCommandError(Exception):
+    """Raised when FVM data could not be retrieved by any backend."""
+
+    def __init__(self, message: str, stderr: str = ""):
+        super().__init__(message)
+        self.stderr = stderr
+
+
+def fetch_releases(
+    channel: Optional[str] = None, quiet: bool = False
+) -> ReleaseCatalog:
+    """Fetch Flutter releases known to FVM.
+
+    Args:
+        channel: 'stable', 'beta', 'dev' or 'all'. Only used by the table
+                 fallback; the JSON backend always returns every channel.
+        quiet: If True, run without any loading indicator or output
+
+    Returns:
+        ReleaseCatalog with typed release records
+    """
+    status_message = "[bold yellow]Fetching Flutter release versions...[/]"
+
+    data = _run_fvm_api(["releases", "--compress"], status_message, quiet)
+    if data is not None:
+        return parse_releases_json(data)
+
+    command = "fvm releases"
+    if channel and channel.lower() in ["stable", "beta", "dev", "all"]:
+        command += f" --channel {channel.lower()}"
+
+    stdout = _run_fvm_table(command, status_message, quiet)
+    return parse_releases_table(stdout.splitlines())
+
+
+def fetch_installed(use_fvm: bool = False) -> InstalledCatalog:
+    """Fetch the Flutter SDK versions installed in the FVM cache.
+
+    Args:
+        use_fvm: If True, ask FVM instead of scanning the cache directory
+    """
+    if not use_fvm:
+        catalog = scan_installed()
+        if catalog is not None:
+            return catalog
+
+    data = _run_fvm_api(
+        ["list", "--compress"],
+        "[bold yellow]Fetching installed Flutter versions...[/]",
+    )
+    if data is not None:
+        return parse_installed_json(data)
+
+    stdout = _run_fvm_table(
+        "fvm list", "[bold yellow]Fetching installed Flutter versions...[/]"
+    )
+    return parse_installed_table(stdout.splitlines())
+
+
+# ----------------------------------------------------------------------
+# Filesystem backend
+# ----------------------------------------------------------------------
+def find_versions_dir() -> Optional[Path]:
+    """Locate the directory FVM installs SDKs into, if it exists.
+
+    Honours FVM_CACHE_PATH (FVM 3) and FVM_HOME (FVM 2) before falling back
+    to FVM's default location.
+    """
+    candidates = []
+    for variable in ("FVM_CACHE_PATH", "FVM_HOME"):
+        if os.environ.get(variable):
+            candidates.append(Path(os.environ[variable]).expanduser())
+
+    if platform.system() == "Windows" and os.environ.get("LOCALAPPDATA"):
+        candidates.append(Path(os.environ["LOCALAPPDATA"]) / "fvm")
+    candidates.append(Path.home() / "fvm")
+
+    for root in candidates:
+        versions_dir = root / "versions"
+        if versions_dir.is_dir():
+            return versions_dir
+    return None
+
+
+def scan_installed(versions_dir: Optional[Path] = None) -> Optional[InstalledCatalog]:
+    """Build an InstalledCatalog by reading the FVM cache directly.
+
+    Reads each SDK's version metadata without spawning FVM or measuring
+    directory sizes. Returns None if the cache directory can't be found.
+    """
+    if versions_dir is None:
+        versions_dir = find_versions_dir()
+    if versions_dir is None:
+        return None
+
+    try:
+        entries = [
+            entry
+            for entry in os.scandir(versions_dir)
+            if entry.is_dir() and not entry.name.startswith(".")
+        ]
+    except OSError:
+        return None
+
+    cache_dir = str(versions_dir)
+    global_version = _detect_global_version(cache_dir)
+    local_version = _detect_local_version()
+
+    versions = []
+    for entry in entries:
+        sdk = _read_sdk_metadata(Path(entry.path))
+        channel = sdk.get("channel") or ""
+        if entry.name in CHANNELS:
+            channel = entry.name
+
+        versions.append(
+            InstalledVersion(
+                name=entry.name,
+                channel=channel,
+                flutter_version=sdk.get("flutter_version") or "",
+                dart_version=sdk.get("dart_version") or "",
+                release_date=normalize_release_date(sdk.get("release_date") or ""),
+                is_global=entry.name == global_version,
+                is_local=entry.name == local_version,
+                directory=entry.path,
+            )
+        )
+
+    return InstalledCatalog(versions=versions, cache_dir=cache_dir, source="fs")
+
+
+def _read_sdk_metadata(sdk_dir: Path) -> dict:
+    """Read version details that a Flutter SDK checkout keeps on disk."""
+    metadata = {}
+
+    # Written by the tool since Flutter 3.13; only present once set up
+    version_json = sdk_dir / "bin" / "cache" / "flutter.version.json"
+    try:
+        with open(version_json, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        metadata["flutter_version"] = _field(data, "frameworkVersion", "flutterVersion")
+        metadata["channel"] = _field(data, "channel")
+        metadata["dart_version"] = _field(data, "dartSdkVersion")
+        metadata["release_date"] = _field(data, "frameworkCommitDate")
+    except (OSError, ValueError, AttributeError):
+        pass
+
+    if not metadata.get("flutter_version"):
+        metadata["flutter_version"] = _read_first_line(sdk_dir / "version")
+    if not metadata.get("dart_version"):
+        metadata["dart_version"] = _read_first_line(
+            sdk_dir / "bin" / "cache" / "dart-sdk" / "version"
+        )
+    return metadata
+
+
+def _read_first_line(path: Path) -> Optional[str]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return f.readline().strip() or None
+    except OSError:
+        return None
+
+
+# ----------------------------------------------------------------------
+# JSON backend
+# ----------------------------------------------------------------------
+def parse_releases_json(data: dict) -> ReleaseCatalog:
+    """Build a ReleaseCatalog from 'fvm api releases' output."""
+    releases = sort_by_version(
+        (_release_from_json(item) for item in data.get("versions", [])),
+        lambda r: r.version,
+    )
+
+    channels = {}
+    for name, item in (data.get("channels") or {}).items():
+        if isinstance(item, dict) and name.lower() in CHANNELS:
+            channels[name.lower()] = _release_from_json(item)
+
+    return ReleaseCatalog(releases=releases, channels=channels, source="api")
+
+
+def parse_installed_json(data: dict) -> InstalledCatalog:
+    """Build an InstalledCatalog from 'fvm api list' output."""
+    versions = []
+    cache_dir = None
+
+    global_version = None
+    local_version = _detect_local_version()
+
+    for item in data.get("versions", []):
+        name = _field(item, "name")
+        directory = _field(item, "directory")
+        if not name:
+            continue
+
+        if directory and cache_dir is None:
+            cache_dir = str(Path(directory).parent)
+            global_version = _detect_global_version(cache_dir)
+
+        channel = _field(item, "releaseFromChannel", "release_from_channel") or ""
+        if not channel and _field(item, "type") == "channel":
+            channel = name
+
+        versions.append(
+            InstalledVersion(
+                name=name,
+                channel=channel,
+                flutter_version=_field(item, "flutterSdkVersion", "flutter_sdk_version")
+                or "",
+                dart_version=_field(item, "dartSdkVersion", "dart_sdk_version") or "",
+                is_global=name == global_version,
+                is_local=name == local_version,
+                directory=directory,
+            )
+        )
+
+    return InstalledCatalog(
+        versions=versions,
+        cache_dir=cache_dir,
+        cache_size=_field(data, "size"),
+        source="api",
+    )
+
+
+def _release_from_json(item: dict) -> FlutterRelease:
+    return FlutterRelease(
+        version=_field(item, "version") or "",
+        channel=(_field(item, "channel") or "").lower(),
+        release_date=normalize_release_date(
+            _field(item, "release_date", "releaseDate") or ""
+        ),
+        dart_sdk_version=_field(item, "dart_sdk_version", "dartSdkVersion"),
+        hash=_field(item, "hash"),
+        is_channel_head=bool(_field(item, "active_channel", "activeChannel")),
+    )
+
+
+def _field(item: dict, *keys: str):
+    """Return the first present key; FVM has used both snake and camel case."""
+    for key in keys:
+        if key in item:
+            return item[key]
+    return None
+
+
+def _run_fvm_api(
+    args: List[str], status_message: str, quiet: bool = False
+) -> Optional[dict]:
+    """Run 'fvm api <args>' and decode its JSON, or return None if unavailable."""
+    global _api_supported
+
+    if _api_supported is False:
+        return None
+
+    try:
+        with nullcontext() if quiet else console.status(status_message):
+            process = subprocess.run(
+                ["fvm", "api", *args],
+                capture_output=True,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+                shell=(platform.system() == "Windows"),
+            )
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+    # Skip any banner FVM prints before the JSON document
+    stdout = process.stdout
+    start = stdout.find("{")
+    data = None
+    if process.returncode == 0 and start >= 0:
+        try:
+            data, _ = json.JSONDecoder().raw_decode(stdout[start:])
+        except ValueError:
+            data = None
+
+    if not isinstance(data, dict):
+        # FVM ran but doesn't speak the api command (FVM 2.x exits with
+        # "Could not find a command named 'api'"); use the table from now on
+        _api_supported = False
+        return None
+
+    _api_supported = True
+    return data
+
+
+# ----------------------------------------------------------------------
+# Table scraping fallback
+# ----------------------------------------------------------------------
+def _run_fvm_table(command: str, status_message: str, quiet: bool = False) -> str:
+    """Run an FVM command whose pretty-printed output we have to scrape."""
+    # Try with our standard method first
+    if not quiet:
+        result = run_with_loading(
+            command,
+            status_message=status_message,
+            should_display_command=False,
+            clear_on_success=True,
+            show_output_on_failure=False,
+            shell=True,
+        )
+        if result.returncode == 0:
+            return result.stdout
+
+    # Try with direct subprocess call as fallback
+    try:
+        process = subprocess.run(command, shell=True, text=True, capture_output=True)
+    except Exception as e:
+        raise FVMCommandError(str(e)) from e
+
+    if process.returncode != 0:
+        raise FVMCommandError(
+            f"'{command}' exited with code {process.returncode}", process.stderr
+        )
+    return process.stdout
+
+
+def parse_releases_table(lines: Iterable[str]) -> ReleaseCatalog:
+    """Parse the table printed by 'fvm releases'."""
+    catalog = ReleaseCatalog(source="table")
+
+    # Track if we're in the main list or in the Channel section
+    in_channel_section = False
+
+    for line in lines:
+        # Check if we've reached the Channel section
+        if "Channel:" in line:
+            in_channel_section = True
+            continue
+
+        if "│" not in line:
+            continue
+
+        line = _ANSI_ESCAPE.sub("", line)
+        parts = [p.strip() for p in line.split("│") if p.strip()]
+        if len(parts) < 3:
+            continue
+
+        if in_channel_section:
+            # Record the current channel version info, skipping the header
+            if parts[0].lower() in CHANNELS:
+                channel = parts[0].lower()
+                catalog.channels[channel] = FlutterRelease(
+                    version=parts[1],
+                    channel=channel,
+                    release_date=normalize_release_date(parts[2]),
+                    is_channel_head=True,
+                )
+            continue
+
+        # Skip rows that contain 'Channel' as these are headers
+        if any("channel" == p.lower() for p in parts):
+            continue
+
+        version = parts[0]
+        if version.lower() in ("stable", "channel"):
+            continue
+
+        catalog.releases.append(
+            FlutterRelease(
+                version=version,
+                channel=parts[2].replace("✓", "").strip().lower(),
+                release_date=normalize_release_date(parts[1]),
+                # A checkmark flags the current release of its channel
+                is_channel_head="✓" in line,
+            )
+        )
+
+    catalog.releases = sort_by_version(catalog.releases, lambda r: r.version)
+    return catalog
+
+
+def parse_installed_table(lines: Iterable[str]) -> InstalledCatalog:
+    """Parse the table printed by 'fvm list'."""
+    catalog = InstalledCatalog(source="table")
+
+    in_table = False
+    headers: List[str] = []
+
+    for line in lines:
+        if "Cache directory:" in line:
+            catalog.cache_dir = line.replace("Cache directory:", "").strip()
+            continue
+        if "Directory Size:" in line:
+            catalog.cache_size = line.replace("Directory Size:", "").strip()
+            continue
+
+        # Skip until we find the table header divider
+        if "├─────────┼" in line or "┌─────────┬" in line:
+            in_table = True
+            continue
+        if "┼─────────┼" in line:
+            continue
+        if "└─────────┴" in line:
+            in_table = False
+            continue
+
+        if not in_table or "│" not in line:
+            continue
+
+        line = _ANSI_ESCAPE.sub("", line)
+
+        # Preserve empty cells to maintain alignment, minus the outer borders
+        parts = [p.strip() for p in line.split("│")]
+        if parts and parts[0] == "":
+            parts = parts[1:]
+        if parts and parts[-1] == "":
+            parts = parts[:-1]
+
+        if len(parts) < 3:
+            continue
+
+        if not headers and any("Version" in p for p in parts):
+            headers = [h.lower() for h in parts]
+            continue
+
+        if len(parts) < len(headers) or any("Version" in p for p in parts):
+            continue
+
+        row = dict(zip(headers, parts))
+        if "version" not in row:
+            continue
+
+        catalog.versions.append(
+            InstalledVersion(
+                name=row["version"],
+                channel=row.get("channel", ""),
+                flutter_version=row.get("flutter version", ""),
+                dart_version=row.get("dart version", ""),
+                release_date=normalize_release_date(row.get("release date", "")),
+                # Global/local cells are marked with ● or ✓
+                is_global=any(mark in row.get("global", "") for mark in "●✓"),
+                is_local=any(mark in row.get("local", "") for mark in "●✓"),
+            )
+        )
+
+    return catalog
+
+
+# ----------------------------------------------------------------------
+# Helpers
+# ----------------------------------------------------------------------
+_DATE_FORMATS = ("%Y-%m-%d", "%b %d, %Y", "%B %d, %Y", "%m/%d/%Y", "%d/%m/%Y")
+
+
+def normalize_release_date(value: str) -> str:
+    """Normalize FVM's assorted date formats to YYYY-MM-DD where possible."""
+    value = value.strip()
+    if not value:
+        return ""
+
+    # ISO timestamps such as 2024-02-15T18:38:24.000Z
+    if len(value) >= 10 and value[4] == "-" and value[7] == "-":
+        return value[:10]
+
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(value, fmt).strftime("%Y-%m-%d")
+        except ValueError:
+            continue
+    return value
+
+
+def _detect_global_version(cache_dir: str) -> Optional[str]:
+    """Return the SDK the FVM 'default' link points to, if any."""
+    link = Path(cache_dir).parent / "default"
+    if not os.path.lexists(link):
+        return None
+    return Path(os.path.realpath(link)).name
+
+
+def _detect_local_version(start: Optional[Path] = None) -> Optional[str]:
+    """Return the SDK pinned by the nearest project config, if any."""
+    directory = (start or Path.cwd()).resolve()
+    for candidate in (directory, *directory.parents):
+        for config_file, keys in (
+            (candidate / ".fvmrc", ("flutter", "flutterSdkVersion")),
+            (candidate / ".fvm" / "fvm_config.json", ("flutterSdkVersion", "flutter")),
+        ):
+            if not config_file.is_file():
+                continue
+            try:
+                with open(config_file, "r", encoding="utf-8") as f:
+                    config = json.load(f)
+            except (json.JSONDecodeError, OSError):
+                continue
+            for key in keys:
+                if isinstance(config, dict) and config.get(key):
+                    return str(config[key])
+    return None
+
+
+__all__ = [
+    "FVMCommandError",
+    "fetch_releases",
+    "fetch_installed",
+    "find_versions_dir",
+    "scan_installed",
+    "parse_releases_json",
+    "parse_releases_table",
+    "parse_installed_json",
+    "parse_installed_table",
+    "normalize_release_date",
+]
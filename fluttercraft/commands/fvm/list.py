@@ -1,19 +1,28 @@
 """FVM list command functionality."""
 
-import re
-import subprocess
 from rich.console import Console
 from rich.table import Table
 from rich.box import ROUNDED
-from fluttercraft.utils.terminal_utils import run_with_loading, OutputCapture
+from fluttercraft.utils.terminal_utils import OutputCapture
+from fluttercraft.commands.fvm.backend import FVMCommandError, fetch_installed
+from fluttercraft.commands.fvm.semver import sort_by_version
+from fluttercraft.commands.fvm.sdk_sizes import format_size, get_sdk_size_index
 
 console = Console()
 
 
-def fvm_list_command():
+def fvm_list_command(use_fvm=False, measure_sizes=False):
     """
-    Run the 'fvm list' command and display the output in a better format.
-    Shows all installed Flutter SDK versions on the system through FVM.
+    Fetch the installed Flutter SDK versions and display them in a better
+    format. Shows all installed Flutter SDK versions on the system.
+
+    The FVM cache directory is read directly when it can be found, which
+    avoids starting FVM and its directory-size computation.
+
+    Args:
+        use_fvm (bool): Query 'fvm list' instead of scanning the cache directory.
+        measure_sizes (bool): Walk SDKs whose size isn't cached yet or has
+                              changed. Otherwise only cached sizes are shown.
 
     Returns:
         Captured output during the command
@@ -22,136 +31,44 @@ def fvm_list_command():
     with OutputCapture() as output:
         console.print("[bold blue]Listing installed Flutter versions from FVM...[/]")
 
-        # Prepare command to list installed versions
-        command = "fvm list"
-
-        # Try with our standard method first
-        result = run_with_loading(
-            command,
-            status_message="[bold yellow]Fetching installed Flutter versions...[/]",
-            should_display_command=False,
-            clear_on_success=True,
-            show_output_on_failure=False,
-            shell=True,
-        )
-
-        if result.returncode != 0:
-            # Try with direct subprocess call as fallback
-            try:
-                # Use subprocess directly to get output
-                process = subprocess.run(
-                    command, shell=True, text=True, capture_output=True
-                )
+        try:
+            catalog = fetch_installed(use_fvm=use_fvm)
+        except FVMCommandError as e:
+            console.print("[bold red]Error fetching installed Flutter versions.[/]")
+            if e.stderr:
+                console.print(f"[red]{e.stderr}[/]")
+            else:
+                console.print("[red]Make sure FVM is installed correctly.[/]")
+            return output.get_output()
+
+        # Per-SDK sizes come from the incremental size index
+        sdk_dirs = [v.directory for v in catalog.versions if v.directory]
+        size_index = get_sdk_size_index()
+        if measure_sizes and sdk_dirs:
+            with console.status("[bold yellow]Measuring Flutter SDK sizes...[/]"):
+                sizes = size_index.measure(sdk_dirs)
+        else:
+            sizes = size_index.cached_sizes(sdk_dirs)
+        unmeasured = len(sdk_dirs) - len(sizes)
 
-                if process.returncode == 0:
-                    result = process
-                else:
-                    console.print(
-                        "[bold red]Error fetching installed Flutter versions.[/]"
-                    )
-                    if process.stderr:
-                        console.print(f"[red]{process.stderr}[/]")
-                    else:
-                        console.print("[red]Make sure FVM is installed correctly.[/]")
-                    return output.get_output()
-            except Exception as e:
-                console.print(f"[bold red]Error: {str(e)}[/]")
-                return output.get_output()
-
-        # Process the output - parse the table data from the command output
-        lines = result.stdout.strip().split("\n")
-
-        # Extract cache directory and size information
-        cache_dir = None
-        cache_size = None
-
-        for line in lines:
-            if "Cache directory:" in line:
-                cache_dir = line.replace("Cache directory:", "").strip()
-            elif "Directory Size:" in line:
-                cache_size = line.replace("Directory Size:", "").strip()
+        cache_size = catalog.cache_size
+        if sizes and not unmeasured:
+            cache_size = format_size(sum(s.size_bytes for s in sizes.values()))
 
         # Display cache information in a better format
         console.print()
-        if cache_dir:
-            console.print(f"[bold cyan]Cache Directory:[/] [green]{cache_dir}[/]")
+        if catalog.cache_dir:
+            console.print(
+                f"[bold cyan]Cache Directory:[/] [green]{catalog.cache_dir}[/]"
+            )
         if cache_size:
             console.print(f"[bold cyan]Cache Size:[/] [green]{cache_size}[/]")
         console.print()
 
-        # Create a list to store the installed versions
-        installed_versions = []
-
-        # Track if we're in the table section
-        in_table = False
-        headers = []
-
-        # Parse the installed versions from the table
-        for line in lines:
-            # Skip until we find the table header divider
-            if "├─────────┼" in line or "┌─────────┬" in line:
-                in_table = True
-                continue
-
-            # Skip divider lines
-            if "┼─────────┼" in line:
-                continue
-
-            # End of table
-            if "└─────────┴" in line:
-                in_table = False
-                continue
-
-            # If we're in the table section, parse the row
-            if in_table and "│" in line:
-                # Clean up the line by removing ANSI escape codes
-                line = re.sub(r"\x1b\[[0-9;]*[mK]", "", line)
-
-                # Split by the pipe character and preserve empty cells to maintain alignment
-                raw_parts = [p.strip() for p in line.split("│")]
-
-                # Remove outer borders if present
-                if raw_parts and raw_parts[0] == "":
-                    raw_parts = raw_parts[1:]
-                if raw_parts and raw_parts[-1] == "":
-                    raw_parts = raw_parts[:-1]
-
-                parts = raw_parts
-
-                # Ensure we have the expected number of columns (at least version info)
-                if len(parts) < 3:
-                    continue
-
-                # Store headers if this is the first row containing column names
-                if not headers and any("Version" in p for p in parts):
-                    headers = parts
-                    continue
-
-                # Skip if we don't have enough parts or this is the header row
-                if len(parts) < len(headers) or any("Version" in p for p in parts):
-                    continue
-
-                # Create a dictionary for this version
-                version_info = {}
-                for i, header in enumerate(headers):
-                    if i >= len(parts):
-                        continue
-
-                    key = header.lower().strip()
-                    value = parts[i].strip()
-
-                    # Check for global/local indicators (● symbol)
-                    if key in {"global", "local"}:
-                        version_info[key] = "●" in value or "✓" in value
-                    else:
-                        version_info[key] = value
-
-                # Add to our list if it's a valid entry
-                if "version" in version_info:
-                    installed_versions.append(version_info)
-
-        # Sort installed versions by date (newest first)
-        installed_versions.sort(key=lambda v: v.get("release date", ""), reverse=True)
+        # Sort installed versions newest first; channels like "stable" go last
+        installed_versions = sort_by_version(
+            catalog.versions, lambda v: v.flutter_version or v.name, reverse=True
+        )
 
         # Create a rich table for display with improved styling
         table = Table(
@@ -171,6 +88,8 @@ def fvm_list_command():
         table.add_column("Flutter Ver", style="green")
         table.add_column("Dart Ver", style="blue")
         table.add_column("Release Date", style="magenta")
+        if sdk_dirs:
+            table.add_column("Size", style="bright_cyan", justify="right", no_wrap=True)
         table.add_column("Global", style="red", justify="center")
         table.add_column("Local", style="red", justify="center")
 
@@ -178,34 +97,41 @@ def fvm_list_command():
         if not installed_versions:
             # Add a centered message if no versions are installed
             table.add_row(
-                "[yellow]No Flutter versions installed yet[/]", "", "", "", "", "", ""
+                "[yellow]No Flutter versions installed yet[/]",
+                *[""] * (len(table.columns) - 1),
             )
         else:
             # Add rows with improved styling
             for version in installed_versions:
                 # Highlight the global version
-                if version.get("global", False):
-                    name = f"[bold bright_green]{version.get('version')} ← Global[/]"
+                if version.is_global:
+                    name = f"[bold bright_green]{version.name} ← Global[/]"
                     global_mark = "[bright_green]✓[/]"
                     local_mark = ""
-                elif version.get("local", False):
-                    name = f"[bold bright_yellow]{version.get('version')} ← Local[/]"
+                elif version.is_local:
+                    name = f"[bold bright_yellow]{version.name} ← Local[/]"
                     global_mark = ""
                     local_mark = "[bright_yellow]✓[/]"
                 else:
-                    name = f"[white]{version.get('version')}[/]"
+                    name = f"[white]{version.name}[/]"
                     global_mark = ""
                     local_mark = ""
 
-                table.add_row(
+                cells = [
                     name,
-                    f"[yellow]{version.get('channel', '')}[/]",
-                    f"[green]{version.get('flutter version', '')}[/]",
-                    f"[blue]{version.get('dart version', '')}[/]",
-                    f"[magenta]{version.get('release date', '')}[/]",
-                    global_mark if version.get("global", False) else "",
-                    local_mark if version.get("local", False) else "",
-                )
+                    f"[yellow]{version.channel}[/]",
+                    f"[green]{version.flutter_version}[/]",
+                    f"[blue]{version.dart_version}[/]",
+                    f"[magenta]{version.release_date}[/]",
+                ]
+                if sdk_dirs:
+                    size = sizes.get(version.directory)
+                    cells.append(format_size(size.size_bytes) if size else "[dim]?[/]")
+                cells += [
+                    global_mark if version.is_global else "",
+                    local_mark if version.is_local else "",
+                ]
+                table.add_row(*cells)
 
         # Display the table
         console.print(table)
@@ -224,6 +150,11 @@ def fvm_list_command():
             console.print(
                 f"\n[bold bright_green]Found {version_count} installed Flutter {'version' if version_count == 1 else 'versions'}.[/]"
             )
+            if unmeasured:
+                console.print(
+                    f"[dim]{unmeasured} SDK size(s) not measured yet or changed; "
+                    "run [cyan]fvm list --sizes[/] to update them.[/]"
+                )
 
             # Show helpful usage instructions with improved formatting
             console.print("\n[bold bright_blue]Helpful commands:[/]")
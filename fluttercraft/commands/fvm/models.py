@@ -0,0 +1,81 @@
+"""Typed records for FVM release and installed-version data."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from fluttercraft.commands.fvm.semver import FlutterVersion, newest
+
+
+@dataclass(slots=True)
+class FlutterRelease:
+    """A Flutter SDK release available through FVM."""
+
+    version: str
+    channel: str
+    release_date: str = ""
+    dart_sdk_version: Optional[str] = None
+    hash: Optional[str] = None
+    is_channel_head: bool = False
+
+    @property
+    def parsed_version(self) -> Optional[FlutterVersion]:
+        return FlutterVersion.parse(self.version)
+
+
+@dataclass(slots=True)
+class ReleaseCatalog:
+    """All known releases plus the current head of each channel.
+
+    ``releases`` is kept in ascending version order by the backend.
+    """
+
+    releases: List[FlutterRelease] = field(default_factory=list)
+    channels: Dict[str, FlutterRelease] = field(default_factory=dict)
+    source: str = "table"
+
+    def newest(
+        self, channel: Optional[str] = None, series: Optional[str] = None
+    ) -> Optional[FlutterRelease]:
+        """Return the newest release, e.g. newest("beta") or newest(series="3.x")."""
+        releases = self.releases
+        if channel is not None:
+            releases = [r for r in releases if r.channel == channel.lower()]
+        return newest(releases, lambda r: r.version, series=series)
+
+
+@dataclass(slots=True)
+class InstalledVersion:
+    """A Flutter SDK installed in the FVM cache."""
+
+    name: str
+    channel: str = ""
+    flutter_version: str = ""
+    dart_version: str = ""
+    release_date: str = ""
+    is_global: bool = False
+    is_local: bool = False
+    directory: Optional[str] = None
+
+    @property
+    def parsed_version(self) -> Optional[FlutterVersion]:
+        return FlutterVersion.parse(self.flutter_version or self.name)
+
+
+@dataclass(slots=True)
+class InstalledCatalog:
+    """Installed SDKs together with the cache location and size."""
+
+    versions: List[InstalledVersion] = field(default_factory=list)
+    cache_dir: Optional[str] = None
+    cache_size: Optional[str] = None
+    source: str = "table"
+
+
+__all__ = [
+    "FlutterRelease",
+    "ReleaseCatalog",
+    "InstalledVersion",
+    "InstalledCatalog",
+]
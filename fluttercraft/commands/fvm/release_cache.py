@@ -0,0 +1,196 @@
+"""Local cache of the Flutter release index.
+
+Keeps the full release list fetched from FVM under ~/.fluttercraft so that
+'fvm releases' can answer instantly, filter channels locally and work offline.
+"""
+
+import json
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable, List, Optional
+
+from fluttercraft.commands.fvm.backend import fetch_releases
+from fluttercraft.commands.fvm.models import FlutterRelease, ReleaseCatalog
+from fluttercraft.commands.fvm.release_index import ReleaseIndex
+from fluttercraft.commands.fvm.semver import sort_by_version
+
+# Default age, in seconds, after which the cached index is refreshed (1 day)
+DEFAULT_RELEASES_TTL = 24 * 60 * 60
+
+# Environment variable that overrides the refresh age
+RELEASES_TTL_ENV = "FLUTTERCRAFT_RELEASES_TTL"
+
+
+@dataclass(slots=True)
+class CachedReleaseIndex:
+    """A release catalog together with the time it was fetched."""
+
+    catalog: ReleaseCatalog
+    fetched_at: float
+    is_stale: bool
+    _index: Optional[ReleaseIndex] = field(default=None, repr=False)
+
+    def index(self) -> ReleaseIndex:
+        """Return the query index for this catalog, building it on first use."""
+        if self._index is None:
+            self._index = ReleaseIndex(self.catalog)
+        return self._index
+
+
+class ReleaseIndexCache:
+    """Persists the Flutter release index and refreshes it when stale."""
+
+    def __init__(self, config_dir: Optional[Path] = None, ttl: Optional[float] = None):
+        """Initialize the release index cache.
+
+        Args:
+            config_dir: Directory to store the cache file.
+                       Defaults to ~/.fluttercraft/
+            ttl: Seconds before the cached index is considered stale. Defaults
+                 to the FLUTTERCRAFT_RELEASES_TTL environment variable, or 1 day.
+        """
+        if config_dir is None:
+            config_dir = Path.home() / ".fluttercraft"
+
+        self.config_dir = config_dir
+        self.cache_file = self.config_dir / "releases.json"
+        self.ttl = self._resolve_ttl(ttl)
+        self._lock = threading.Lock()
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._memory: Optional[CachedReleaseIndex] = None
+        self._listeners: List[Callable[[CachedReleaseIndex], None]] = []
+
+        # Ensure config directory exists
+        self.config_dir.mkdir(parents=True, exist_ok=True)
+
+    def on_change(self, callback: Callable[[CachedReleaseIndex], None]) -> None:
+        """Call ``callback`` with the new index after every successful fetch."""
+        self._listeners.append(callback)
+
+    def load(self) -> Optional[CachedReleaseIndex]:
+        """Return the cached index, or None if nothing has been cached yet."""
+        with self._lock:
+            if self._memory is None:
+                self._memory = self._read()
+            cached = self._memory
+
+        if cached is None:
+            return None
+
+        cached.is_stale = time.time() - cached.fetched_at > self.ttl
+        return cached
+
+    def fetch(self, quiet: bool = False) -> CachedReleaseIndex:
+        """Fetch the full release index from FVM and store it.
+
+        Raises:
+            FVMCommandError: If FVM could not be queried
+        """
+        catalog = fetch_releases("all", quiet=quiet)
+        cached = CachedReleaseIndex(
+            catalog=catalog, fetched_at=time.time(), is_stale=False
+        )
+
+        with self._lock:
+            self._memory = cached
+            self._write(cached)
+
+        for callback in self._listeners:
+            try:
+                callback(cached)
+            except Exception:  # noqa: BLE001
+                pass
+        return cached
+
+    def refresh_in_background(self) -> bool:
+        """Start a silent background refresh unless one is already running.
+
+        Returns:
+            True if a new refresh was started
+        """
+        with self._lock:
+            if self._refresh_thread is not None and self._refresh_thread.is_alive():
+                return False
+
+            def refresh() -> None:
+                try:
+                    self.fetch(quiet=True)
+                except Exception:  # noqa: BLE001
+                    # Offline or FVM missing; keep serving the cached index
+                    pass
+
+            self._refresh_thread = threading.Thread(
+                target=refresh, name="fluttercraft-release-refresh", daemon=True
+            )
+            self._refresh_thread.start()
+            return True
+
+    @staticmethod
+    def _resolve_ttl(ttl: Optional[float]) -> float:
+        if ttl is not None:
+            return ttl
+        try:
+            return float(os.environ.get(RELEASES_TTL_ENV, DEFAULT_RELEASES_TTL))
+        except ValueError:
+            return DEFAULT_RELEASES_TTL
+
+    def _read(self) -> Optional[CachedReleaseIndex]:
+        if not self.cache_file.exists():
+            return None
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            catalog = ReleaseCatalog(
+                releases=sort_by_version(
+                    (FlutterRelease(**item) for item in data["releases"]),
+                    lambda r: r.version,
+                ),
+                channels={
+                    name: FlutterRelease(**item)
+                    for name, item in data["channels"].items()
+                },
+                source=data.get("source", "table"),
+            )
+            return CachedReleaseIndex(
+                catalog=catalog, fetched_at=float(data["fetched_at"]), is_stale=True
+            )
+        except (json.JSONDecodeError, OSError, KeyError, TypeError, ValueError):
+            return None
+
+    def _write(self, cached: CachedReleaseIndex) -> None:
+        data = {
+            "fetched_at": cached.fetched_at,
+            "source": cached.catalog.source,
+            "releases": [asdict(release) for release in cached.catalog.releases],
+            "channels": {
+                name: asdict(release)
+                for name, release in cached.catalog.channels.items()
+            },
+        }
+        try:
+            temp_file = self.cache_file.with_suffix(".tmp")
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(temp_file, self.cache_file)
+        except OSError:
+            # Silently fail if we can't save the cache
+            pass
+
+
+# Global release index cache instance
+_release_cache: Optional[ReleaseIndexCache] = None
+
+
+def get_release_cache() -> ReleaseIndexCache:
+    """Get the global release index cache instance.
+
+    Returns:
+        Global ReleaseIndexCache instance
+    """
+    global _release_cache
+    if _release_cache is None:
+        _release_cache = ReleaseIndexCache()
+    return _release_cache
@@ -0,0 +1,210 @@
+"""Indexed queries over the Flutter release catalog.
+
+Builds, once per catalog, a version-sorted array, a date-sorted index, and
+channel and Dart SDK maps so that 'fvm releases' filters such as
+``--since 2024-01 --range ">=3.16 <3.22" --dart 3.3`` are answered with
+bisects and set lookups instead of rescanning every release.
+"""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+
+from fluttercraft.commands.fvm.models import FlutterRelease, ReleaseCatalog
+from fluttercraft.commands.fvm.semver import FlutterVersion
+
+_DATE_PATTERN = re.compile(r"^\d{4}(-\d{2}(-\d{2})?)?$")
+_CONSTRAINT_PATTERN = re.compile(r"^(>=|<=|>|<|==|=)?\s*(v?\d[0-9A-Za-z.\-+]*)$")
+
+# Sorts after every character used in a YYYY-MM-DD date
+_DATE_CEILING = "\uffff"
+
+
+@dataclass(slots=True)
+class ReleaseQuery:
+    """Filters accepted by ReleaseIndex.query(); None means unfiltered."""
+
+    channel: Optional[str] = None
+    version_range: Optional[str] = None
+    since: Optional[str] = None
+    until: Optional[str] = None
+    dart: Optional[str] = None
+    # Case-insensitive text matched against version, release date and channel
+    search: Optional[str] = None
+
+    def is_empty(self) -> bool:
+        return not any(
+            (
+                self.channel,
+                self.version_range,
+                self.since,
+                self.until,
+                self.dart,
+                self.search,
+            )
+        )
+
+
+class ReleaseIndex:
+    """In-memory indexes over a ReleaseCatalog."""
+
+    def __init__(self, catalog: ReleaseCatalog):
+        # Releases with a parseable version, in ascending version order
+        versioned = [
+            (release.parsed_version, release)
+            for release in catalog.releases
+            if release.parsed_version is not None
+        ]
+        versioned.sort(key=lambda pair: pair[0].sort_key)
+
+        self.releases: List[FlutterRelease] = [release for _, release in versioned]
+        self._version_keys = [version.sort_key for version, _ in versioned]
+
+        dated = sorted(
+            (release.release_date, position)
+            for position, release in enumerate(self.releases)
+            if release.release_date
+        )
+        self._dates = [date for date, _ in dated]
+        self._date_positions = [position for _, position in dated]
+
+        self._by_channel: Dict[str, Set[int]] = {}
+        self._by_dart: Dict[str, Set[int]] = {}
+        for position, release in enumerate(self.releases):
+            self._by_channel.setdefault(release.channel, set()).add(position)
+            if release.dart_sdk_version:
+                for prefix in _dart_prefixes(release.dart_sdk_version):
+                    self._by_dart.setdefault(prefix, set()).add(position)
+
+    @property
+    def has_dart_versions(self) -> bool:
+        return bool(self._by_dart)
+
+    def query(self, query: ReleaseQuery) -> List[FlutterRelease]:
+        """Return matching releases in ascending version order.
+
+        Raises:
+            ValueError: If a date or version constraint can't be parsed
+        """
+        lo, hi = self._version_bounds(query.version_range)
+        candidates: Optional[Set[int]] = None
+
+        if query.since or query.until:
+            candidates = self._intersect(candidates, self._date_range(query))
+        if query.channel and query.channel.lower() != "all":
+            channel = self._by_channel.get(query.channel.lower(), set())
+            candidates = self._intersect(candidates, channel)
+        if query.dart:
+            dart = self._by_dart.get(query.dart.strip().lstrip("v"), set())
+            candidates = self._intersect(candidates, dart)
+
+        if candidates is None:
+            releases = self.releases[lo:hi]
+        else:
+            releases = [self.releases[p] for p in sorted(candidates) if lo <= p < hi]
+
+        if query.search:
+            needle = query.search.lower()
+            releases = [
+                r
+                for r in releases
+                if needle in r.version.lower()
+                or needle in r.release_date
+                or needle in r.channel
+            ]
+        return releases
+
+    def _version_bounds(self, version_range: Optional[str]) -> Tuple[int, int]:
+        lo, hi = 0, len(self.releases)
+        if not version_range:
+            return lo, hi
+
+        for constraint in _split_constraints(version_range):
+            # "3.x" and "3.19.*" are the same as the bare series
+            constraint = re.sub(r"(\.[x*])+$", "", constraint)
+            match = _CONSTRAINT_PATTERN.match(constraint)
+            version = FlutterVersion.parse(match.group(2)) if match else None
+            if version is None:
+                raise ValueError(f"Invalid version constraint: {constraint}")
+
+            operator = match.group(1) or "="
+            floor, ceiling = _series_bounds(match.group(2), version)
+            if operator == ">=":
+                lo = max(lo, bisect_left(self._version_keys, floor))
+            elif operator == ">":
+                lo = max(lo, bisect_left(self._version_keys, ceiling))
+            elif operator == "<":
+                hi = min(hi, bisect_left(self._version_keys, floor))
+            elif operator == "<=":
+                hi = min(hi, bisect_left(self._version_keys, ceiling))
+            else:
+                lo = max(lo, bisect_left(self._version_keys, floor))
+                hi = min(hi, bisect_left(self._version_keys, ceiling))
+
+        return lo, max(lo, hi)
+
+    def _date_range(self, query: ReleaseQuery) -> Set[int]:
+        start, end = 0, len(self._dates)
+        if query.since:
+            start = bisect_left(self._dates, _validate_date(query.since))
+        if query.until:
+            end = bisect_right(self._dates, _validate_date(query.until) + _DATE_CEILING)
+        return set(self._date_positions[start:end])
+
+    @staticmethod
+    def _intersect(current: Optional[Set[int]], other: Set[int]) -> Set[int]:
+        return set(other) if current is None else current & other
+
+
+def _split_constraints(version_range: str) -> List[str]:
+    # Accept ">=3.16 <3.22", ">=3.16,<3.22" and ">= 3.16 < 3.22"
+    tokens = re.findall(r"(?:>=|<=|==|>|<|=)?\s*[^\s,<>=]+", version_range)
+    return [token.replace(" ", "") for token in tokens]
+
+
+def _series_bounds(text: str, version: FlutterVersion) -> Tuple[tuple, tuple]:
+    """Sort keys bracketing every release of the version or series written.
+
+    "3.16" covers 3.16.0-0.1.pre up to (not including) 3.17.0-0.0.pre, so
+    ">=3.16" includes the 3.16 betas and "<3.22" excludes the 3.22 ones.
+    """
+    if version.prerelease or version.build:
+        return version.sort_key, _successor(version.sort_key)
+
+    given = len(text.lstrip("v").split("+")[0].split("-")[0].split("."))
+    parts = [version.major, version.minor, version.patch]
+    floor = (*parts, 0, (), ())
+
+    bumped = parts[:given]
+    bumped[-1] += 1
+    bumped += [0] * (3 - len(bumped))
+    ceiling = (*bumped, 0, (), ())
+    return floor, ceiling
+
+
+def _successor(sort_key: tuple) -> tuple:
+    # The smallest key strictly greater than sort_key and all its equals
+    return (*sort_key[:-1], (*sort_key[-1], (2, "")))
+
+
+def _validate_date(value: str) -> str:
+    value = value.strip()
+    if not _DATE_PATTERN.match(value):
+        raise ValueError(f"Invalid date '{value}'; use YYYY, YYYY-MM or YYYY-MM-DD")
+    return value
+
+
+def _dart_prefixes(version: str) -> List[str]:
+    """Keys under which a Dart SDK version is indexed: "3", "3.3", "3.3.0"."""
+    core = version.strip().lstrip("v").split(" ")[0]
+    parts = core.split("-")[0].split(".")
+    prefixes = [".".join(parts[: i + 1]) for i in range(len(parts))]
+    if core not in prefixes:
+        prefixes.append(core)
+    return prefixes
+
+
+__all__ = ["ReleaseIndex", "ReleaseQuery"]
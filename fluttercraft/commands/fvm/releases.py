@@ -1,134 +1,170 @@
 """FVM releases command functionality."""
 
-import re
-import subprocess
+from datetime import datetime
 from rich.console import Console
 from rich.table import Table
-from fluttercraft.utils.terminal_utils import run_with_loading, OutputCapture
+from fluttercraft.utils.terminal_utils import OutputCapture
+from fluttercraft.commands.fvm.backend import FVMCommandError
+from fluttercraft.commands.fvm.release_cache import get_release_cache
+from fluttercraft.commands.fvm.release_index import ReleaseQuery
 
 console = Console()
 
+# Rows shown per page unless --limit is given; 0 shows every match
+DEFAULT_PAGE_SIZE = 50
 
-def fvm_releases_command(channel=None):
+
+def _page_footer(start, end, total, offset, page_size):
+    """
+    Describe the visible page of releases and how to reach the others.
+
+    Args:
+        start (int): Index of the first visible release
+        end (int): Index after the last visible release
+        total (int): Number of matching releases
+        offset (int): Newest matches skipped
+        page_size (int): Rows per page; 0 means no limit
+
+    Returns:
+        str: Footer text, or None when every match is visible
     """
-    Run the 'fvm releases' command and display the output in a better format.
+    if end - start >= total:
+        return None
+
+    hints = [f"Showing {start + 1}-{end} of {total}, newest last."]
+    if start > 0:
+        hints.append(f"Older: --offset {total - start}.")
+    if offset:
+        # Without a limit everything older is already shown; newer starts at 0
+        newer = max(offset - page_size, 0) if page_size else 0
+        hints.append(f"Newer: --offset {newer}.")
+    hints.append("Use --limit 0 to show all, or --search to narrow down.")
+    return " ".join(hints)
+
+
+def fvm_releases_command(
+    channel=None,
+    refresh=False,
+    since=None,
+    until=None,
+    version_range=None,
+    dart=None,
+    search=None,
+    limit=None,
+    offset=0,
+):
+    """
+    Display Flutter releases available through FVM in a better format.
+
+    Releases are served from the local release index cache; FVM is only
+    queried when nothing is cached yet or a refresh is forced. A stale index
+    is shown immediately and refreshed in the background.
 
     Args:
         channel (str, optional): Filter releases by channel ('stable', 'beta', 'dev', 'all').
                                 Defaults to None which will use FVM's default (stable).
+        refresh (bool): Force a fresh fetch from FVM before displaying.
+        since (str, optional): Only releases on or after this date (YYYY[-MM[-DD]]).
+        until (str, optional): Only releases on or before this date (YYYY[-MM[-DD]]).
+        version_range (str, optional): Version constraints, e.g. ">=3.16 <3.22".
+        dart (str, optional): Only releases bundling this Dart SDK version or series.
+        search (str, optional): Case-insensitive text to match against the
+                                version, release date or channel.
+        limit (int, optional): Rows per page. Defaults to DEFAULT_PAGE_SIZE;
+                               0 shows every match.
+        offset (int): Number of newest matches to skip, for paging back.
 
     Returns:
         Captured output during the command
     """
     # Capture all output during this command
     with OutputCapture() as output:
-        console.print("[bold blue]Fetching Flutter releases from FVM...[/]")
-
-        # Prepare command with optional channel parameter
-        command = "fvm releases"
-        if channel and channel.lower() in ["stable", "beta", "dev", "all"]:
-            command += f" --channel {channel.lower()}"
-
-        # Try with our standard method first
-        result = run_with_loading(
-            command,
-            status_message="[bold yellow]Fetching Flutter release versions...[/]",
-            should_display_command=False,
-            clear_on_success=True,
-            show_output_on_failure=False,
-            shell=True,
-        )
+        release_cache = get_release_cache()
+        cached = None if refresh else release_cache.load()
+        refreshing = False
 
-        if result.returncode != 0:
-            # Try with direct subprocess call as fallback
+        if cached is None:
+            console.print("[bold blue]Fetching Flutter releases from FVM...[/]")
             try:
-                # Use subprocess directly to get output
-                process = subprocess.run(
-                    command, shell=True, text=True, capture_output=True
-                )
-
-                if process.returncode == 0:
-                    result = process
-                else:
+                cached = release_cache.fetch()
+            except FVMCommandError as e:
+                # Fall back to whatever we have when offline
+                cached = release_cache.load()
+                if cached is None:
                     console.print("[bold red]Error fetching Flutter releases.[/]")
-                    if process.stderr:
-                        console.print(f"[red]{process.stderr}[/]")
+                    if e.stderr:
+                        console.print(f"[red]{e.stderr}[/]")
                     else:
                         console.print("[red]Make sure FVM is installed correctly.[/]")
                     return output.get_output()
-            except Exception as e:
-                console.print(f"[bold red]Error: {str(e)}[/]")
-                return output.get_output()
-
-        # Process the output - parse the table data from the command output
-        lines = result.stdout.strip().split("\n")
-
-        # Create stable releases table
-        stable_releases = []
-        current_channel_info = {}
-
-        # Track if we're in the main list or in the Channel section
-        in_channel_section = False
-
-        # Simpler parsing approach - look for lines with stable versions
-        for line in lines:
-            # Check if we've reached the Channel section
-            if "Channel:" in line:
-                in_channel_section = True
-                continue
-
-            if "│" in line:
-                # Clean up the line by removing ANSI escape codes
-                line = re.sub(r"\x1b\[[0-9;]*[mK]", "", line)
-
-                # Split by the pipe character and clean up
-                parts = [p.strip() for p in line.split("│") if p.strip()]
-
-                # Make sure we have enough parts
-                if len(parts) >= 3:
-                    if in_channel_section:
-                        # This is part of the Channel section
-                        # Record the current channel version info
-                        if parts[0].lower() == "channel":  # This is the header
-                            continue
-                        elif parts[0].lower() in ["stable", "beta", "dev"]:
-                            current_channel_info[parts[0].lower()] = {
-                                "channel": parts[0],
-                                "version": parts[1],
-                                "date": parts[2] if len(parts) > 2 else "",
-                            }
-                    else:
-                        # This is a regular version
-                        # Skip rows that contain 'Channel' as these are headers
-                        if any("channel" == p.lower() for p in parts):
-                            continue
-
-                        # The first part should be the version
-                        version = parts[0]
-                        # The second part should be the release date
-                        date = parts[1]
-                        # The third part should be the channel
-                        release_channel = parts[2].replace("✓", "").strip()
-
-                        # Check if this is the current version (has checkmark)
-                        is_current = "✓" in line
-
-                        # Skip entries that look like they might be channel indicators
-                        # or the Channel section
-                        if version.lower() == "stable" or version.lower() == "channel":
-                            continue
-
-                        stable_releases.append(
-                            {
-                                "version": version,
-                                "date": date,
-                                "channel": release_channel,
-                                "is_current": is_current,
-                            }
-                        )
+                console.print(
+                    "[yellow]Could not reach FVM; showing the cached release list.[/]"
+                )
+        elif cached.is_stale:
+            # False only when a refresh is already running, which still counts
+            release_cache.refresh_in_background()
+            refreshing = True
+
+        if cached.is_stale:
+            fetched = datetime.fromtimestamp(cached.fetched_at).strftime(
+                "%Y-%m-%d %H:%M"
+            )
+            if refreshing:
+                console.print(
+                    f"[dim]Release list cached on {fetched}; "
+                    "refreshing in the background (use --refresh to force).[/]"
+                )
+            else:
+                console.print(
+                    f"[dim]Release list cached on {fetched} "
+                    "(use --refresh to try again).[/]"
+                )
+
+        catalog = cached.catalog
 
-        # Get the current channel name for display in title
         channel_name = channel.lower() if channel else "stable"
+        query = ReleaseQuery(
+            channel=channel_name,
+            version_range=version_range,
+            since=since,
+            until=until,
+            dart=dart,
+            search=search,
+        )
+
+        index = cached.index()
+        if dart and not index.has_dart_versions:
+            console.print(
+                "[yellow]This FVM version doesn't report Dart SDK versions; "
+                "--dart needs FVM 3 or newer.[/]"
+            )
+            return output.get_output()
+
+        try:
+            # The index keeps releases in ascending version order
+            sorted_releases = index.query(query)
+        except ValueError as e:
+            console.print(f"[bold red]{e}[/]")
+            return output.get_output()
+
+        # Only the visible window is rendered. Pages count back from the
+        # newest match and are shown oldest-first like the full list, so the
+        # latest releases stay next to the prompt.
+        total = len(sorted_releases)
+        page_size = DEFAULT_PAGE_SIZE if limit is None else max(limit, 0)
+        offset = max(offset, 0)
+        if total and offset >= total:
+            console.print(
+                f"[yellow]No releases at offset {offset} ({total} total).[/]"
+            )
+            return output.get_output()
+        end = total - offset
+        start = max(end - page_size, 0) if page_size else 0
+        visible_releases = sorted_releases[start:end]
+
+        current_channel_info = catalog.channels
+
+        # Get the current channel name for display in title
         if channel_name == "all":
             title = "[bold cyan]All Flutter Versions Available Through FVM[/]"
         else:
@@ -141,77 +177,67 @@ def fvm_releases_command(channel=None):
         table.add_column("Version", style="cyan bold", no_wrap=True)
         table.add_column("Release Date", style="green")
         table.add_column("Channel", style="yellow")
-
-        # Function to extract version number components for proper sorting
-        def version_key(release):
-            version = release["version"]
-            # Remove leading 'v' if present
-            if version.startswith("v"):
-                version = version[1:]
-
-            # Split by dots and extract components
-            components = []
-            # First split by special characters
-            parts = re.split(r"[\.\+\-]", version)
-            for part in parts:
-                # Try to convert to number if possible
-                if not part:  # Skip empty parts
-                    continue
-                try:
-                    components.append((0, int(part)))  # Numbers come first
-                except ValueError:
-                    # If not a number, keep as string but ensure consistent comparison types
-                    components.append((1, part))  # Strings come after numbers
-
-            return components  # Python can compare tuples element by element
-
-        # Sort releases by version number (ascending order)
-        sorted_releases = sorted(stable_releases, key=version_key)
+        if dart:
+            table.add_column("Dart SDK", style="blue")
+
+        # Describe any filters beyond the channel under the table
+        filters = [
+            f"{label} {value}"
+            for label, value in (
+                ("range", version_range),
+                ("since", since),
+                ("until", until),
+                ("dart", dart),
+                ("search", search),
+            )
+            if value
+        ]
+        if filters:
+            table.caption = f"[dim]Filtered by {', '.join(filters)}[/]"
 
         # Get the latest versions by channel from current_channel_info
-        latest_versions = {}
-        for ch, info in current_channel_info.items():
-            latest_versions[ch] = info.get("version", "").strip()
+        latest_versions = {
+            ch: info.version.strip() for ch, info in current_channel_info.items()
+        }
 
         # Add rows
-        for release in sorted_releases:
-            version = release["version"].strip()
-            release_channel = release["channel"].lower()
+        for release in visible_releases:
+            version = release.version.strip()
+            release_channel = release.channel
 
-            # Highlight if this is the latest version in its channel
+            # Highlight the latest version in its channel
             if (
-                release_channel in latest_versions
-                and version == latest_versions[release_channel]
+                latest_versions.get(release_channel) == version
+                or release.is_channel_head
             ):
-                table.add_row(
+                cells = [
                     f"[bold green]{version} ← Latest {release_channel}[/]",
-                    release["date"],
-                    release["channel"],
-                )
-            # Or if it has the checkmark in the original output
-            elif release.get("is_current", False):
-                table.add_row(
-                    f"[bold green]{version} ← Latest {release_channel}[/]",
-                    release["date"],
-                    release["channel"],
-                )
+                    release.release_date,
+                    release_channel,
+                ]
             else:
-                table.add_row(version, release["date"], release["channel"])
+                cells = [version, release.release_date, release_channel]
+            if dart:
+                cells.append(release.dart_sdk_version or "")
+            table.add_row(*cells)
 
         # Display the table
         console.print(table)
 
         # Show a count of available versions and usage instructions
         console.print(
-            f"\n[bold green]Found {len(sorted_releases)} Flutter versions available through FVM.[/]"
+            f"\n[bold green]Found {total} Flutter versions available through FVM.[/]"
         )
+        footer = _page_footer(start, end, total, offset, page_size)
+        if footer:
+            console.print(f"[dim]{footer}[/]")
 
         # Show current channel information
         if current_channel_info:
             console.print(f"\n[bold cyan]Current Channels:[/]")
             for ch, info in current_channel_info.items():
                 console.print(
-                    f"  [bold green]{info['channel']}:[/] {info['version']} ({info['date']})"
+                    f"  [bold green]{ch}:[/] {info.version} ({info.release_date})"
                 )
 
         # Show helpful usage instructions
@@ -0,0 +1,294 @@
+"""Batch installation of Flutter SDK versions through FVM.
+
+Runs ``fvm install <version>`` for several versions at once on a bounded
+worker pool and shows one live row per version.
+"""
+
+import os
+import platform
+import queue
+import subprocess
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Deque, Dict, List, Optional
+
+from rich.console import Console
+from rich.live import Live
+from rich.table import Table
+from rich.text import Text
+
+from fluttercraft.commands.fvm.version_completions import get_version_completions
+from fluttercraft.utils.progress_parser import ProgressParser
+from fluttercraft.utils.terminal_utils import (
+    LOADING_FRAMES,
+    MIN_REDRAW_INTERVAL,
+    SPINNER_INTERVAL,
+    live_console,
+    process_observer,
+)
+
+console = Console()
+
+# Installs running at once unless --jobs is given
+DEFAULT_INSTALL_JOBS = 3
+
+# Output lines kept per version for the failure report
+_TAIL_LINES = 10
+
+
+@dataclass(slots=True)
+class SdkInstallResult:
+    """Progress and outcome of installing one SDK version."""
+
+    version: str
+    status: str = "queued"  # queued, running, installed, failed, cancelled
+    returncode: Optional[int] = None
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    last_line: str = ""
+    tail: Deque[str] = field(default_factory=lambda: deque(maxlen=_TAIL_LINES))
+
+    @property
+    def elapsed(self) -> float:
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.monotonic()) - self.started_at
+
+    @property
+    def succeeded(self) -> bool:
+        return self.status == "installed"
+
+
+class SdkInstaller:
+    """Installs several SDK versions concurrently with a concurrency limit."""
+
+    def __init__(self, versions: List[str], jobs: int = DEFAULT_INSTALL_JOBS):
+        # Keep the order given but install each version only once
+        self.versions = list(dict.fromkeys(versions))
+        self.jobs = max(1, min(jobs, len(self.versions) or 1))
+        self.results: Dict[str, SdkInstallResult] = {
+            version: SdkInstallResult(version) for version in self.versions
+        }
+        self._updates: "queue.Queue[str]" = queue.Queue()
+        self._cancelled = threading.Event()
+        self._processes: Dict[str, subprocess.Popen] = {}
+        self._lock = threading.Lock()
+        # Worker threads don't inherit context, so capture it here
+        self._observer = process_observer.get()
+
+    def run(self) -> List[SdkInstallResult]:
+        """Install every version and return the results in request order."""
+        frame = 0
+        with ThreadPoolExecutor(
+            max_workers=self.jobs, thread_name_prefix="fluttercraft-sdk-install"
+        ) as pool:
+            futures = [pool.submit(self._install, v) for v in self.versions]
+            try:
+                with Live(
+                    self._render(frame), console=live_console(), auto_refresh=False
+                ) as live:
+                    next_frame_at = time.monotonic() + SPINNER_INTERVAL
+                    last_redraw_at = 0.0
+                    needs_redraw = False
+
+                    while not all(future.done() for future in futures):
+                        # Sleep until output arrives or the next redraw is due
+                        deadline = next_frame_at
+                        if needs_redraw:
+                            deadline = min(deadline, last_redraw_at + MIN_REDRAW_INTERVAL)
+                        if self._drain_updates(max(0, deadline - time.monotonic())):
+                            needs_redraw = True
+
+                        now = time.monotonic()
+                        if now >= next_frame_at:
+                            frame += 1
+                            next_frame_at = now + SPINNER_INTERVAL
+                            needs_redraw = True
+
+                        if needs_redraw and now - last_redraw_at >= MIN_REDRAW_INTERVAL:
+                            live.update(self._render(frame), refresh=True)
+                            last_redraw_at = now
+                            needs_redraw = False
+                    live.update(self._render(frame), refresh=True)
+            except KeyboardInterrupt:
+                self.cancel()
+                raise
+
+        return [self.results[v] for v in self.versions]
+
+    def cancel(self) -> None:
+        """Stop queued installs and terminate the running ones."""
+        self._cancelled.set()
+        with self._lock:
+            processes = list(self._processes.values())
+        for process in processes:
+            try:
+                process.terminate()
+            except OSError:
+                pass
+
+    def _drain_updates(self, timeout: float) -> bool:
+        """Wait up to ``timeout`` for an update, then take every queued one."""
+        try:
+            self._updates.get(timeout=timeout)
+        except queue.Empty:
+            return False
+        while True:
+            try:
+                self._updates.get_nowait()
+            except queue.Empty:
+                return True
+
+    def _install(self, version: str) -> None:
+        result = self.results[version]
+        if self._cancelled.is_set():
+            result.status = "cancelled"
+            self._updates.put(version)
+            return
+
+        result.status = "running"
+        result.started_at = time.monotonic()
+        self._updates.put(version)
+
+        try:
+            process = subprocess.Popen(
+                ["fvm", "install", version],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+                shell=(platform.system() == "Windows"),
+                # Detach from the terminal when running as a background job
+                start_new_session=self._observer is not None and os.name == "posix",
+            )
+        except OSError as e:
+            result.tail.append(str(e))
+            result.last_line = str(e)
+            self._finish(result, "failed", None)
+            return
+
+        with self._lock:
+            self._processes[version] = process
+        if self._observer is not None:
+            self._observer(process)
+
+        # Universal newlines also splits git's carriage-return progress lines
+        parser = ProgressParser()
+        for line in process.stdout:
+            line = line.rstrip()
+            if not line:
+                continue
+            event = parser.parse(line)
+            if event is not None and not event.is_stage:
+                # Summarise progress reports instead of keeping them
+                result.last_line = event.describe()
+            else:
+                result.tail.append(line)
+                result.last_line = line
+            self._updates.put(version)
+
+        returncode = process.wait()
+        with self._lock:
+            self._processes.pop(version, None)
+
+        if self._cancelled.is_set() and returncode != 0:
+            self._finish(result, "cancelled", returncode)
+        else:
+            status = "installed" if returncode == 0 else "failed"
+            self._finish(result, status, returncode)
+
+    def _finish(
+        self, result: SdkInstallResult, status: str, returncode: Optional[int]
+    ) -> None:
+        result.status = status
+        result.returncode = returncode
+        result.finished_at = time.monotonic()
+        self._updates.put(result.version)
+
+    def _render(self, frame: int) -> Table:
+        done = sum(1 for r in self.results.values() if r.finished_at is not None)
+        table = Table(
+            title=f"[bold cyan]Installing Flutter SDKs[/] "
+            f"[dim]({done}/{len(self.versions)} done, {self.jobs} at a time)[/]",
+            show_header=True,
+            header_style="bold magenta",
+            expand=True,
+        )
+        table.add_column("Version", style="cyan bold", no_wrap=True)
+        table.add_column("Status", no_wrap=True)
+        table.add_column("Time", justify="right", no_wrap=True)
+        table.add_column(
+            "Output", style="dim", no_wrap=True, overflow="ellipsis", ratio=1
+        )
+
+        spinner = LOADING_FRAMES[frame % len(LOADING_FRAMES)]
+        for version in self.versions:
+            result = self.results[version]
+            status = {
+                "queued": "[dim]queued[/]",
+                "running": f"[yellow]{spinner} installing[/]",
+                "installed": "[bold green]✓ installed[/]",
+                "failed": "[bold red]✗ failed[/]",
+                "cancelled": "[yellow]cancelled[/]",
+            }[result.status]
+            elapsed = f"{result.elapsed:.0f}s" if result.started_at else ""
+            table.add_row(version, status, elapsed, Text(result.last_line))
+        return table
+
+
+def fvm_install_sdks_command(versions, jobs=DEFAULT_INSTALL_JOBS):
+    """
+    Install one or more Flutter SDK versions through FVM concurrently.
+
+    Args:
+        versions (list): Versions, channels or commits accepted by 'fvm install'
+        jobs (int): Maximum number of installs running at once
+
+    Returns:
+        list: SdkInstallResult for each requested version
+    """
+    installer = SdkInstaller(versions, jobs=jobs)
+    try:
+        results = installer.run()
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Installation cancelled.[/]")
+        return list(installer.results.values())
+    finally:
+        # Some versions may have been installed even if others failed
+        get_version_completions().invalidate_installed()
+
+    installed = [r for r in results if r.succeeded]
+    failed = [r for r in results if not r.succeeded]
+
+    if not failed:
+        console.print(
+            f"\n[bold green]Installed {len(installed)} Flutter "
+            f"{'SDK' if len(installed) == 1 else 'SDKs'} successfully.[/]"
+        )
+    else:
+        console.print(
+            f"\n[bold yellow]Installed {len(installed)} of {len(results)} "
+            "Flutter SDKs.[/]"
+        )
+        for result in failed:
+            console.print(
+                f"\n[bold red]✗ {result.version}[/] "
+                f"[dim](exit code {result.returncode})[/]"
+            )
+            for line in result.tail:
+                console.print(f"  {line}", style="red", markup=False, highlight=False)
+
+    return results
+
+
+__all__ = [
+    "DEFAULT_INSTALL_JOBS",
+    "SdkInstallResult",
+    "SdkInstaller",
+    "fvm_install_sdks_command",
+]
@@ -0,0 +1,224 @@
+"""Incremental disk-usage accounting for SDKs in the FVM cache.
+
+Measuring a Flutter SDK means walking hundreds of thousands of files, so
+sizes are stored in ~/.fluttercraft/sdk_sizes.json together with a cheap
+signature of each SDK's top-level metadata. Only SDKs whose signature has
+changed are walked again, in parallel across a thread pool.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+# Directories, relative to an SDK, whose entries make up its signature.
+# Engine downloads and pub caches land in bin/cache, git updates in .git.
+_SIGNATURE_DIRS = ("", "bin/cache", ".git")
+
+
+@dataclass(slots=True)
+class SdkSize:
+    """Disk usage of one installed SDK."""
+
+    path: str
+    size_bytes: int
+    file_count: int
+    from_cache: bool = False
+
+
+class SdkSizeIndex:
+    """Caches per-SDK directory sizes keyed on an mtime/inode summary."""
+
+    def __init__(self, config_dir: Optional[Path] = None):
+        """Initialize the size index.
+
+        Args:
+            config_dir: Directory to store the index file.
+                       Defaults to ~/.fluttercraft/
+        """
+        if config_dir is None:
+            config_dir = Path.home() / ".fluttercraft"
+
+        self.config_dir = config_dir
+        self.index_file = self.config_dir / "sdk_sizes.json"
+        self._lock = threading.Lock()
+
+        # Ensure config directory exists
+        self.config_dir.mkdir(parents=True, exist_ok=True)
+
+    def cached_sizes(self, sdk_dirs: Iterable[str]) -> Dict[str, SdkSize]:
+        """Return sizes that are still valid, without walking any SDK."""
+        entries = self._read()
+        sizes = {}
+        for path in sdk_dirs:
+            entry = entries.get(path)
+            if entry and entry.get("signature") == signature(path):
+                sizes[path] = SdkSize(
+                    path=path,
+                    size_bytes=entry["size"],
+                    file_count=entry["files"],
+                    from_cache=True,
+                )
+        return sizes
+
+    def measure(
+        self, sdk_dirs: Iterable[str], max_workers: Optional[int] = None
+    ) -> Dict[str, SdkSize]:
+        """Return the size of every SDK, walking only those that changed.
+
+        Args:
+            sdk_dirs: SDK directories to account for
+            max_workers: Thread pool size; defaults to one per stale SDK,
+                         capped at the CPU count
+        """
+        sdk_dirs = list(sdk_dirs)
+        sizes = self.cached_sizes(sdk_dirs)
+        stale = [path for path in sdk_dirs if path not in sizes]
+
+        if stale:
+            workers = max_workers or min(len(stale), os.cpu_count() or 4)
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="fluttercraft-sdk-size"
+            ) as pool:
+                for path, (size_bytes, file_count, sdk_signature) in zip(
+                    stale, pool.map(_measure_with_signature, stale)
+                ):
+                    sizes[path] = SdkSize(
+                        path=path, size_bytes=size_bytes, file_count=file_count
+                    )
+                    self._store(path, size_bytes, file_count, sdk_signature)
+
+        return sizes
+
+    def _store(
+        self, path: str, size_bytes: int, file_count: int, sdk_signature: str
+    ) -> None:
+        with self._lock:
+            entries = self._read()
+            # Forget SDKs that have been removed since they were measured
+            entries = {p: e for p, e in entries.items() if os.path.isdir(p)}
+            entries[path] = {
+                "signature": sdk_signature,
+                "size": size_bytes,
+                "files": file_count,
+                "measured_at": time.time(),
+            }
+            self._write(entries)
+
+    def _read(self) -> dict:
+        if not self.index_file.exists():
+            return {}
+        try:
+            with open(self.index_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+                return data if isinstance(data, dict) else {}
+        except (json.JSONDecodeError, OSError):
+            return {}
+
+    def _write(self, entries: dict) -> None:
+        try:
+            temp_file = self.index_file.with_suffix(".tmp")
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(entries, f, indent=2)
+            os.replace(temp_file, self.index_file)
+        except OSError:
+            # Silently fail if we can't save the index
+            pass
+
+
+def signature(sdk_dir: str) -> str:
+    """Summarise the names, inodes and mtimes of an SDK's top-level entries."""
+    digest = hashlib.sha1()
+    for relative in _SIGNATURE_DIRS:
+        directory = os.path.join(sdk_dir, relative) if relative else sdk_dir
+        try:
+            entries = sorted(os.scandir(directory), key=lambda e: e.name)
+        except OSError:
+            digest.update(f"{relative}:missing;".encode("utf-8"))
+            continue
+        for entry in entries:
+            try:
+                stat = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            digest.update(
+                f"{relative}/{entry.name}:{stat.st_ino}:{stat.st_mtime_ns};".encode(
+                    "utf-8"
+                )
+            )
+    return digest.hexdigest()
+
+
+def directory_size(path: str) -> tuple:
+    """Walk ``path`` without following symlinks.
+
+    Returns:
+        tuple: (total bytes, file count)
+    """
+    total = 0
+    files = 0
+    pending: List[str] = [path]
+    while pending:
+        directory = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        else:
+                            total += entry.stat(follow_symlinks=False).st_size
+                            files += 1
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return total, files
+
+
+def _measure_with_signature(path: str) -> tuple:
+    # Take the signature first so changes made during the walk aren't masked
+    sdk_signature = signature(path)
+    size_bytes, file_count = directory_size(path)
+    return size_bytes, file_count, sdk_signature
+
+
+def format_size(size_bytes: int) -> str:
+    """Format a byte count the way FVM does, e.g. '1.52 GB'."""
+    size = float(size_bytes)
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.2f} {unit}"
+        size /= 1024
+    return f"{size:.2f} GB"
+
+
+# Global size index instance
+_size_index: Optional[SdkSizeIndex] = None
+
+
+def get_sdk_size_index() -> SdkSizeIndex:
+    """Get the global SDK size index instance.
+
+    Returns:
+        Global SdkSizeIndex instance
+    """
+    global _size_index
+    if _size_index is None:
+        _size_index = SdkSizeIndex()
+    return _size_index
+
+
+__all__ = [
+    "SdkSize",
+    "SdkSizeIndex",
+    "directory_size",
+    "format_size",
+    "get_sdk_size_index",
+    "signature",
+]
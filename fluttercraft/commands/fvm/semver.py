@@ -0,0 +1,188 @@
+"""Flutter SDK version parsing and ordering.
+
+Flutter versions are semver-like strings such as ``3.19.0``,
+``3.20.0-1.2.pre`` (beta/dev pre-releases) and ``v1.12.13+hotfix.9``
+(old hotfix releases). Parsing happens once per distinct string and the
+resulting sort key is reused for every comparison.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache, total_ordering
+from typing import Iterable, List, Optional, Tuple, TypeVar, Union
+
+_VERSION_PATTERN = re.compile(
+    r"^v?(\d+)(?:\.(\d+))?(?:\.(\d+))?"
+    r"(?:-([0-9A-Za-z.\-]+))?"
+    r"(?:\+([0-9A-Za-z.\-]+))?$"
+)
+
+# Distinct version strings kept parsed; comfortably above the release index size
+_PARSE_CACHE_SIZE = 4096
+
+T = TypeVar("T")
+
+_KeyPart = Tuple[int, Union[int, str]]
+
+
+@total_ordering
+@dataclass(frozen=True, slots=True)
+class FlutterVersion:
+    """A parsed Flutter SDK version.
+
+    Pre-releases sort before their release (``3.20.0-1.2.pre`` < ``3.20.0``)
+    and hotfix builds sort after it (``1.12.13`` < ``1.12.13+hotfix.9``).
+    """
+
+    major: int
+    minor: int
+    patch: int
+    prerelease: Tuple[Union[int, str], ...] = ()
+    build: Tuple[Union[int, str], ...] = ()
+    raw: str = field(default="", compare=False)
+    sort_key: tuple = field(default=(), compare=False, repr=False)
+
+    @staticmethod
+    def parse(text: str) -> Optional["FlutterVersion"]:
+        """Parse a version string, or return None if it isn't a version.
+
+        Results are cached, so repeated parses of the same string are free.
+        """
+        return _parse(text.strip())
+
+    @property
+    def is_prerelease(self) -> bool:
+        return bool(self.prerelease)
+
+    def in_series(self, series: str) -> bool:
+        """Check membership of a series such as "3", "3.x" or "3.19"."""
+        parts = [
+            p
+            for p in series.strip().lstrip("v").split(".")
+            if p not in ("", "x", "*")
+        ]
+        try:
+            wanted = [int(p) for p in parts]
+        except ValueError:
+            return False
+        return [self.major, self.minor, self.patch][: len(wanted)] == wanted
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FlutterVersion):
+            return NotImplemented
+        return self.sort_key == other.sort_key
+
+    def __lt__(self, other: object) -> bool:
+        if not isinstance(other, FlutterVersion):
+            return NotImplemented
+        return self.sort_key < other.sort_key
+
+    def __hash__(self) -> int:
+        return hash(self.sort_key)
+
+    def __str__(self) -> str:
+        return self.raw
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _parse(text: str) -> Optional[FlutterVersion]:
+    match = _VERSION_PATTERN.match(text)
+    if not match:
+        return None
+
+    major, minor, patch, prerelease, build = match.groups()
+    major, minor, patch = int(major), int(minor or 0), int(patch or 0)
+    prerelease_parts = _split_identifiers(prerelease)
+    build_parts = _split_identifiers(build)
+
+    sort_key = (
+        major,
+        minor,
+        patch,
+        # Releases (1) sort after any of their pre-releases (0)
+        0 if prerelease_parts else 1,
+        tuple(_key_part(p) for p in prerelease_parts),
+        tuple(_key_part(p) for p in build_parts),
+    )
+    return FlutterVersion(
+        major=major,
+        minor=minor,
+        patch=patch,
+        prerelease=prerelease_parts,
+        build=build_parts,
+        raw=text,
+        sort_key=sort_key,
+    )
+
+
+def _split_identifiers(value: Optional[str]) -> Tuple[Union[int, str], ...]:
+    if not value:
+        return ()
+    return tuple(
+        int(part) if part.isdigit() else part
+        for part in re.split(r"[.\-]", value)
+        if part
+    )
+
+
+def _key_part(part: Union[int, str]) -> _KeyPart:
+    # Numeric identifiers sort before alphanumeric ones, as in semver
+    return (0, part) if isinstance(part, int) else (1, part)
+
+
+def version_sort_key(text: str) -> tuple:
+    """Sort key for arbitrary SDK names; non-versions sort before versions.
+
+    Installed SDKs may be channels ("stable") or commit hashes rather than
+    versions, so this never raises for unparseable names.
+    """
+    parsed = FlutterVersion.parse(text)
+    if parsed is None:
+        return (0, text.strip().lower())
+    return (1, parsed.sort_key)
+
+
+def sort_by_version(items: Iterable[T], version_of, reverse: bool = False) -> List[T]:
+    """Sort ``items`` by the version string returned from ``version_of(item)``."""
+    return sorted(
+        items, key=lambda item: version_sort_key(version_of(item)), reverse=reverse
+    )
+
+
+def newest(
+    items: Iterable[T],
+    version_of,
+    series: Optional[str] = None,
+    include_prereleases: bool = True,
+) -> Optional[T]:
+    """Return the item with the highest version, optionally within a series.
+
+    Args:
+        items: Records to search
+        version_of: Callable returning the version string of a record
+        series: Restrict to a series such as "3.x" or "3.19"
+        include_prereleases: If False, skip pre-release versions
+    """
+    best = None
+    best_version = None
+    for item in items:
+        version = FlutterVersion.parse(version_of(item))
+        if version is None:
+            continue
+        if not include_prereleases and version.is_prerelease:
+            continue
+        if series is not None and not version.in_series(series):
+            continue
+        if best_version is None or version > best_version:
+            best, best_version = item, version
+    return best
+
+
+__all__ = [
+    "FlutterVersion",
+    "version_sort_key",
+    "sort_by_version",
+    "newest",
+]
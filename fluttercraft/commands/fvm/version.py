@@ -3,18 +3,29 @@
 import subprocess
 from rich.console import Console
 from fluttercraft.utils.terminal_utils import run_with_loading
+from fluttercraft.utils.probe_cache import get_probe_cache
 
 console = Console()
 
 
-def check_fvm_version(silent=False):
+def check_fvm_version(silent=False, use_cache=False):
     """Check if FVM is installed and get version information.
 
+    Only definitive results (FVM ran successfully, or isn't installed) are
+    written to the probe cache; timeouts and failed runs are re-checked.
+
     Args:
         silent: If True, suppress all loading indicators and output
+        use_cache: If True, return a still-valid cached result without running FVM
     """
+    if use_cache:
+        cached = get_probe_cache().get("fvm")
+        if cached is not None:
+            return cached
+
     fvm_installed = False
     fvm_version = None
+    probe_completed = False
 
     try:
         # Check if FVM is installed and get version
@@ -47,7 +58,18 @@ def check_fvm_version(silent=False):
             fvm_installed = True
             # Clean up version string (remove whitespace)
             fvm_version = fvm_version_process.stdout.strip()
+            probe_completed = True
     except FileNotFoundError:
         fvm_installed = False
+        probe_completed = True
+    except subprocess.TimeoutExpired:
+        # A slow or stuck FVM; report it as unavailable for now
+        fvm_installed = False
+
+    fvm_info = {"installed": fvm_installed, "version": fvm_version}
+
+    # Only remember definitive answers, not timeouts or failed runs
+    if probe_completed:
+        get_probe_cache().set("fvm", fvm_info)
 
-    return {"installed": fvm_installed, "version": fvm_version}
+    return fvm_info
@@ -0,0 +1,208 @@
+"""Completion data for Flutter SDK version arguments.
+
+Installed SDKs (for 'fvm use'/'fvm remove'), known releases (for 'fvm
+install') and channel names (for '--channel') are kept in prebuilt
+CompletionIndex objects. They are loaded once per session on a background
+thread and swapped in whole when a refresh finishes, so the prompt only ever
+reads memory: no disk scan, FVM subprocess or network call runs on a
+keystroke.
+
+The FVM backend and release cache are imported by the loader thread, so
+registering the completions at startup doesn't load them.
+"""
+
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, List, Optional
+
+from fluttercraft.utils.completion_index import ArgumentCompleter, CompletionIndex
+
+if TYPE_CHECKING:
+    from fluttercraft.commands.fvm.models import InstalledVersion
+    from fluttercraft.commands.fvm.release_cache import (
+        CachedReleaseIndex,
+        ReleaseIndexCache,
+    )
+
+# Seconds before the installed SDKs are re-scanned in the background
+INSTALLED_TTL = float(os.environ.get("FLUTTERCRAFT_INSTALLED_TTL", 30))
+
+_CHANNEL_DESCRIPTIONS = {
+    "stable": "Stable channel",
+    "beta": "Beta channel",
+    "dev": "Dev channel",
+    "all": "Every channel",
+}
+
+
+class VersionCompletions:
+    """Installed, release and channel indexes for argument completion."""
+
+    def __init__(self, release_cache: Optional["ReleaseIndexCache"] = None):
+        self._release_cache = release_cache
+        self._installed = CompletionIndex()
+        self._releases = CompletionIndex()
+        self._channels = CompletionIndex(_CHANNEL_DESCRIPTIONS)
+        # monotonic time of the last installed scan; None forces a rescan
+        self._installed_at: Optional[float] = None
+        self._scanning = False
+        self._started = False
+        self._lock = threading.Lock()
+        self._listeners: List[Callable[[], None]] = []
+
+    def on_change(self, callback: Callable[[], None]) -> None:
+        """Call ``callback`` (on a worker thread) when an index is replaced."""
+        self._listeners.append(callback)
+
+    def start(self) -> "VersionCompletions":
+        """Load every index in the background; later calls do nothing."""
+        with self._lock:
+            if self._started:
+                return self
+            self._started = True
+
+        threading.Thread(
+            target=self._load, name="fluttercraft-version-completions", daemon=True
+        ).start()
+        return self
+
+    def installed(self) -> CompletionIndex:
+        """Installed SDK names, newest first; rescans them when out of date."""
+        installed_at = self._installed_at
+        if installed_at is None or time.monotonic() - installed_at >= INSTALLED_TTL:
+            self._scan_in_background()
+        return self._installed
+
+    def releases(self) -> CompletionIndex:
+        """Channel names, then release versions newest first."""
+        return self._releases
+
+    def channels(self) -> CompletionIndex:
+        return self._channels
+
+    def invalidate_installed(self) -> None:
+        """Re-scan installed SDKs, e.g. after one was installed or removed."""
+        self._installed_at = None
+        self._scan_in_background()
+
+    def _load(self) -> None:
+        from fluttercraft.commands.fvm.release_cache import get_release_cache
+
+        release_cache = self._release_cache or get_release_cache()
+        release_cache.on_change(self._index_releases)
+
+        self._scan_installed()
+
+        cached = release_cache.load()
+        if cached is not None:
+            self._index_releases(cached)
+        if cached is None or cached.is_stale:
+            # The rebuilt index arrives through on_change
+            release_cache.refresh_in_background()
+
+    def _scan_in_background(self) -> None:
+        with self._lock:
+            if self._scanning or not self._started:
+                return
+            self._scanning = True
+
+        threading.Thread(
+            target=self._scan_installed, name="fluttercraft-installed-scan", daemon=True
+        ).start()
+
+    def _scan_installed(self) -> None:
+        from fluttercraft.commands.fvm.backend import scan_installed
+        from fluttercraft.commands.fvm.semver import sort_by_version
+
+        with self._lock:
+            self._scanning = True
+        try:
+            catalog = scan_installed()
+            index = CompletionIndex()
+            if catalog is not None:
+                for version in sort_by_version(
+                    catalog.versions, lambda v: v.name, reverse=True
+                ):
+                    index.add(version.name, _describe_installed(version))
+            changed = _entries(index) != _entries(self._installed)
+            self._installed = index
+            self._installed_at = time.monotonic()
+        finally:
+            with self._lock:
+                self._scanning = False
+
+        if changed:
+            self._notify()
+
+    def _index_releases(self, cached: "CachedReleaseIndex") -> None:
+        from fluttercraft.commands.fvm.backend import CHANNELS
+
+        index = CompletionIndex()
+        for name in CHANNELS:
+            release = cached.catalog.channels.get(name)
+            if release is not None:
+                index.add(name, f"Latest {name} release ({release.version})")
+        for release in reversed(cached.index().releases):
+            detail = " · ".join(filter(None, (release.channel, release.release_date)))
+            index.add(release.version, detail)
+
+        self._releases = index
+        self._notify()
+
+    def _notify(self) -> None:
+        for callback in self._listeners:
+            try:
+                callback()
+            except Exception:  # noqa: BLE001
+                pass
+
+
+def _describe_installed(version: "InstalledVersion") -> str:
+    details = [version.channel or "", version.flutter_version or ""]
+    if version.name in details:
+        details.remove(version.name)
+    if version.is_global:
+        details.append("global")
+    if version.is_local:
+        details.append("this project")
+    return " · ".join(filter(None, details))
+
+
+def _entries(index: CompletionIndex) -> List[tuple]:
+    return [(entry.text, entry.description) for entry in index.prefix_matches("")]
+
+
+def register_version_completions(
+    completer: ArgumentCompleter, completions: "VersionCompletions"
+) -> None:
+    """Register the FVM version arguments with ``completer``."""
+    completer.register("fvm use", completions.installed)
+    completer.register("fvm remove", completions.installed)
+    completer.register("fvm install", completions.releases, repeat=True)
+    for option in ("--channel", "-c"):
+        completer.register("fvm releases", completions.channels, option=option)
+
+
+# Global version completions instance
+_version_completions: Optional[VersionCompletions] = None
+
+
+def get_version_completions() -> VersionCompletions:
+    """Get the global version completions instance.
+
+    Returns:
+        Global VersionCompletions instance
+    """
+    global _version_completions
+    if _version_completions is None:
+        _version_completions = VersionCompletions()
+    return _version_completions
+
+
+__all__ = [
+    "INSTALLED_TTL",
+    "VersionCompletions",
+    "get_version_completions",
+    "register_version_completions",
+]
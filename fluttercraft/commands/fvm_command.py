@@ -10,12 +10,15 @@ from fluttercraft.commands.core.models import (
     CommandMetadata,
     CommandResult,
 )
-from fluttercraft.commands.fvm import (
-    fvm_install_command,
-    fvm_list_command,
-    fvm_releases_command,
-    fvm_uninstall_command,
+from fluttercraft.commands.fvm.install import fvm_install_command
+from fluttercraft.commands.fvm.list import fvm_list_command
+from fluttercraft.commands.fvm.releases import fvm_releases_command
+from fluttercraft.commands.fvm.sdk_install import (
+    DEFAULT_INSTALL_JOBS,
+    fvm_install_sdks_command,
 )
+from fluttercraft.commands.fvm.uninstall import fvm_uninstall_command
+from fluttercraft.commands.fvm.version_completions import get_version_completions
 from fluttercraft.commands.help import (
     show_fvm_help,
     show_fvm_install_help,
@@ -24,11 +27,18 @@ from fluttercraft.commands.help import (
     show_fvm_uninstall_help,
 )
 from fluttercraft.utils.beautiful_display import update_system_info
+from fluttercraft.utils.probe_cache import get_probe_cache
+from fluttercraft.utils.terminal_utils import run_with_loading
 
 
 class FVMCommand(Command):
     """Aggregates FVM-related subcommands under a single entry point."""
 
+    # 'fvm releases' options that take a value
+    VALUE_OPTIONS = frozenset(
+        {"--since", "--until", "--range", "--dart", "--search", "--limit", "--offset"}
+    )
+
     def __init__(self) -> None:
         metadata = CommandMetadata(
             name="fvm",
@@ -47,42 +57,108 @@ class FVMCommand(Command):
         subcommand = args[0].lower()
         remaining = args[1:]
 
+        # Contextual help: e.g. "fvm install help"
+        if len(remaining) == 1 and remaining[0] in {"help", "--help", "-h"}:
+            return self._handle_help_for_subcommand(subcommand)
+
         if subcommand == "install":
-            return self._handle_install(context)
+            return self._handle_install(context, remaining)
         if subcommand == "uninstall":
             return self._handle_uninstall(context)
         if subcommand == "releases":
             return self._handle_releases(context.console, remaining)
         if subcommand == "list":
-            return self._handle_list(context.console)
+            return self._handle_list(context.console, remaining)
+        if subcommand in {"use", "remove"}:
+            return self._handle_passthrough(context, subcommand, remaining)
         if subcommand in {"help", "--help", "-h"}:
             show_fvm_help()
             return CommandResult(success=True)
 
-        # Contextual help: e.g. "fvm install help"
-        if len(remaining) == 1 and remaining[0] in {"help", "--help", "-h"}:
-            return self._handle_help_for_subcommand(subcommand)
-
         return CommandResult(
             success=False,
             message=f"✗ Unknown FVM command: {' '.join([subcommand, *remaining]).strip()}\n"
-            "Available: install, uninstall, releases, list",
+            "Available: install, uninstall, releases, list, use, remove",
         )
 
-    def _handle_install(self, context: CommandContext) -> CommandResult:
-        updated_info, _ = fvm_install_command(
-            context.platform_info, context.flutter_info, context.fvm_info
-        )
+    def supports_background(self, args: List[str]) -> bool:
+        # Installing or removing FVM itself, and 'fvm use', ask questions
+        # along the way
+        subcommand = args[0].lower() if args else ""
+        if subcommand in {"uninstall", "use"}:
+            return False
+        if subcommand == "install":
+            return bool(self._positional_args(args[1:], {"--jobs", "-j"}))
+        return True
+
+    def _handle_install(
+        self, context: CommandContext, args: Optional[List[str]] = None
+    ) -> CommandResult:
+        versions = self._positional_args(args or [], {"--jobs", "-j"})
+        if versions:
+            return self._handle_install_sdks(context, args, versions)
+
+        try:
+            updated_info, _ = fvm_install_command(
+                context.platform_info, context.flutter_info, context.fvm_info
+            )
+        finally:
+            # FVM's binary may have changed even if the install failed midway
+            get_probe_cache().invalidate("fvm")
         context.fvm_info = updated_info
         update_system_info(
             context.platform_info, context.flutter_info, context.fvm_info
         )
         return CommandResult(success=True)
 
-    def _handle_uninstall(self, context: CommandContext) -> CommandResult:
-        updated_info, _ = fvm_uninstall_command(
-            context.platform_info, context.flutter_info, context.fvm_info
+    def _handle_install_sdks(
+        self, context: CommandContext, args: List[str], versions: List[str]
+    ) -> CommandResult:
+        if not context.fvm_info.get("installed"):
+            return CommandResult(
+                success=False,
+                message="✗ FVM is not installed. Run 'fvm install' first.",
+            )
+
+        try:
+            jobs = self._parse_int_option(args, "--jobs")
+            if jobs is None:
+                jobs = self._parse_int_option(args, "-j")
+        except ValueError as exc:
+            return CommandResult(success=False, message=f"✗ {exc}")
+
+        results = fvm_install_sdks_command(versions, jobs=jobs or DEFAULT_INSTALL_JOBS)
+        return CommandResult(success=all(r.succeeded for r in results))
+
+    def _handle_passthrough(
+        self, context: CommandContext, subcommand: str, args: List[str]
+    ) -> CommandResult:
+        """Run 'fvm use <version>' or 'fvm remove <version>' through FVM."""
+        if not context.fvm_info.get("installed"):
+            return CommandResult(
+                success=False,
+                message="✗ FVM is not installed. Run 'fvm install' first.",
+            )
+        if not self._positional_args(args, set()):
+            return CommandResult(
+                success=False, message=f"✗ Usage: fvm {subcommand} <version>"
+            )
+
+        result = run_with_loading(
+            ["fvm", subcommand, *args],
+            clear_on_success=False,
+            show_output_on_failure=True,
         )
+        get_version_completions().invalidate_installed()
+        return CommandResult(success=result.returncode == 0)
+
+    def _handle_uninstall(self, context: CommandContext) -> CommandResult:
+        try:
+            updated_info, _ = fvm_uninstall_command(
+                context.platform_info, context.flutter_info, context.fvm_info
+            )
+        finally:
+            get_probe_cache().invalidate("fvm")
         context.fvm_info = updated_info
         update_system_info(
             context.platform_info, context.flutter_info, context.fvm_info
@@ -91,16 +167,34 @@ class FVMCommand(Command):
 
     def _handle_releases(self, console: Console, args: List[str]) -> CommandResult:
         channel = self._parse_channel(args)
+        refresh = "--refresh" in args
         try:
-            fvm_releases_command(channel)
+            limit = self._parse_int_option(args, "--limit")
+            offset = self._parse_int_option(args, "--offset") or 0
+        except ValueError as exc:
+            console.print(f"[bold red]{exc}[/]")
+            return CommandResult(success=False)
+
+        try:
+            fvm_releases_command(
+                channel,
+                refresh=refresh,
+                since=self._parse_option(args, "--since"),
+                until=self._parse_option(args, "--until"),
+                version_range=self._parse_option(args, "--range"),
+                dart=self._parse_option(args, "--dart"),
+                search=self._parse_option(args, "--search"),
+                limit=limit,
+                offset=offset,
+            )
             return CommandResult(success=True)
         except Exception as exc:  # noqa: BLE001
             console.print(f"[bold red]Error fetching Flutter releases: {exc}[/]")
             return CommandResult(success=False)
 
-    def _handle_list(self, console: Console) -> CommandResult:
+    def _handle_list(self, console: Console, args: List[str]) -> CommandResult:
         try:
-            fvm_list_command()
+            fvm_list_command(use_fvm="--fvm" in args, measure_sizes="--sizes" in args)
             return CommandResult(success=True)
         except Exception as exc:  # noqa: BLE001
             console.print(
@@ -122,19 +216,49 @@ class FVMCommand(Command):
         return CommandResult(success=True)
 
     @staticmethod
-    def _parse_channel(args: List[str]) -> Optional[str]:
-        if not args:
-            return None
+    def _parse_option(args: List[str], flag: str) -> Optional[str]:
+        """Return the value of ``flag value`` or ``flag=value``, if present."""
+        for index, token in enumerate(args):
+            if token.startswith(f"{flag}="):
+                return token.split("=", 1)[1]
+            if token == flag and index + 1 < len(args):
+                return args[index + 1]
+
+        return None
+
+    @staticmethod
+    def _positional_args(args: List[str], value_options: set) -> List[str]:
+        """Return arguments that are neither flags nor flag values."""
+        positional = []
+        for index, token in enumerate(args):
+            if token.startswith("-"):
+                continue
+            if index > 0 and args[index - 1] in value_options:
+                continue
+            positional.append(token)
+        return positional
 
-        first = args[0]
-        if first in {"stable", "beta", "dev", "all"}:
-            return first
+    @staticmethod
+    def _parse_int_option(args: List[str], flag: str) -> Optional[int]:
+        value = FVMCommand._parse_option(args, flag)
+        if value is None:
+            return None
+        try:
+            return int(value)
+        except ValueError:
+            raise ValueError(f"{flag} expects a number, got '{value}'") from None
 
-        for token in args:
+    @staticmethod
+    def _parse_channel(args: List[str]) -> Optional[str]:
+        for index, token in enumerate(args):
+            # Skip values belonging to other options
+            if index > 0 and args[index - 1] in FVMCommand.VALUE_OPTIONS:
+                continue
+            if token in {"stable", "beta", "dev", "all"}:
+                return token
             if token.startswith("--channel="):
                 return token.split("=", 1)[1]
-
-        if len(args) >= 2 and args[0] in {"--channel", "-c"}:
-            return args[1]
+            if token in {"--channel", "-c"} and index + 1 < len(args):
+                return args[index + 1]
 
         return None
@@ -36,6 +36,8 @@ def show_fvm_help():
         "List Flutter versions filtered by channel (stable, beta, dev, all)",
     )
     table.add_row("fvm list", "List all installed Flutter SDK versions managed by FVM")
+    table.add_row("fvm use <version>", "Switch to an installed Flutter SDK version")
+    table.add_row("fvm remove <version>", "Remove an installed Flutter SDK version")
 
     console.print(table)
 
@@ -63,9 +65,16 @@ def show_fvm_install_help():
         "Installs Flutter Version Manager (FVM) on your system, which allows you to "
         "manage multiple Flutter SDK versions."
     )
+    console.print(
+        "Given one or more versions, installs those Flutter SDKs through FVM "
+        "instead, several at a time."
+    )
 
     console.print("\n[bold green]Usage:[/]")
-    console.print("  [cyan]fvm install[/]")
+    console.print("  [cyan]fvm install[/] - Install FVM itself")
+    console.print(
+        "  [cyan]fvm install <version> [<version> ...] [--jobs N][/] - Install Flutter SDKs"
+    )
 
     console.print("\n[bold green]Details:[/]")
     console.print("  On Windows:")
@@ -79,6 +88,10 @@ def show_fvm_install_help():
 
     console.print("\n[bold green]Examples:[/]")
     console.print("  [cyan]fvm install[/] - Install FVM on your system")
+    console.print(
+        "  [cyan]fvm install 3.19.6 3.22.0 stable --jobs 2[/] - Install three SDKs, "
+        "two at a time (default 3)"
+    )
 
     return "Displayed fvm install help"
 
@@ -126,6 +139,10 @@ def show_fvm_releases_help():
         "Lists all available Flutter SDK versions that can be installed through FVM. "
         "The versions can be filtered by channel (stable, beta, dev, or all)."
     )
+    console.print(
+        "The release list is cached in ~/.fluttercraft and refreshed in the "
+        "background once it is a day old, so repeat lookups are instant and work offline."
+    )
 
     console.print("\n[bold green]Usage:[/]")
     console.print("  [cyan]fvm releases[/] - List all stable versions (default)")
@@ -150,6 +167,41 @@ def show_fvm_releases_help():
         "Filter versions by release channel",
         "stable (default), beta, dev, all",
     )
+    param_table.add_row(
+        "--refresh",
+        "Fetch a fresh release list from FVM before displaying",
+        "",
+    )
+    param_table.add_row(
+        "--since / --until",
+        "Only releases published on or after / on or before a date",
+        "YYYY, YYYY-MM, YYYY-MM-DD",
+    )
+    param_table.add_row(
+        "--range",
+        "Only versions matching space-separated constraints (quote it)",
+        '">=3.16 <3.22", "3.19", "3.x"',
+    )
+    param_table.add_row(
+        "--dart",
+        "Only releases bundling a Dart SDK version or series",
+        "3, 3.3, 3.3.0",
+    )
+    param_table.add_row(
+        "--search",
+        "Only releases whose version, date or channel contains the text",
+        "e.g. 3.19, 2024-05",
+    )
+    param_table.add_row(
+        "--limit",
+        "Rows per page; the newest matches are shown first",
+        "50 (default), 0 for all",
+    )
+    param_table.add_row(
+        "--offset",
+        "Skip this many of the newest matches to page back",
+        "0 (default)",
+    )
 
     console.print(param_table)
 
@@ -163,6 +215,16 @@ def show_fvm_releases_help():
         "  [cyan]fvm releases --channel beta[/] - List all beta channel versions"
     )
     console.print("  [cyan]fvm releases -c all[/] - List versions from all channels")
+    console.print(
+        "  [cyan]fvm releases --refresh[/] - Update the cached release list first"
+    )
+    console.print(
+        '  [cyan]fvm releases all --since 2024-01 --range ">=3.16 <3.22" --dart 3.3[/]'
+        " - Combine filters"
+    )
+    console.print(
+        "  [cyan]fvm releases all --limit 20 --offset 20[/] - Show the next 20 older releases"
+    )
 
     return "Displayed fvm releases help"
 
@@ -176,14 +238,28 @@ def show_fvm_list_help():
         "Lists all installed Flutter SDK versions managed by FVM on your system. "
         "This includes global and local (project-specific) versions."
     )
+    console.print(
+        "The FVM cache directory (FVM_CACHE_PATH, or ~/fvm by default) is read "
+        "directly, so listing doesn't have to start FVM."
+    )
 
     console.print("\n[bold green]Usage:[/]")
     console.print("  [cyan]fvm list[/]")
+    console.print(
+        "  [cyan]fvm list --fvm[/] - Ask FVM instead of reading the cache directory"
+    )
+    console.print(
+        "  [cyan]fvm list --sizes[/] - Measure SDKs whose size is unknown or has changed"
+    )
 
     console.print("\n[bold green]Output Information:[/]")
     console.print("  The command displays:")
     console.print("    • Cache directory location")
     console.print("    • Total size of all installed Flutter versions")
+    console.print(
+        "    • Size of each SDK, remembered between runs and re-measured only "
+        "when the SDK changes"
+    )
     console.print("    • Version number and details for each installed SDK")
     console.print("    • Which version is set as global (if any)")
     console.print(
@@ -24,6 +24,8 @@ def show_global_help():
     current_table.add_row("fvm uninstall", "Uninstall Flutter Version Manager")
     current_table.add_row("fvm releases", "List all available Flutter versions")
     current_table.add_row("fvm list", "List all installed Flutter versions")
+    current_table.add_row("fvm use", "Switch to an installed Flutter version")
+    current_table.add_row("fvm remove", "Remove an installed Flutter version")
 
     console.print(current_table)
 
@@ -41,7 +43,6 @@ def show_global_help():
     future_table.add_row(
         "fvm setup", "Install and configure a specific Flutter version"
     )
-    future_table.add_row("fvm remove", "Remove a specific Flutter version")
     future_table.add_row("firebase", "Firebase integration commands")
     future_table.add_row("supabase", "Supabase integration commands")
     future_table.add_row("icon", "Generate app icons for all platforms")
@@ -0,0 +1,109 @@
+"""Concurrent environment probes for the FlutterCraft startup sequence."""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from fluttercraft.utils.platform_utils import get_platform_info
+from fluttercraft.commands.flutter.version import check_flutter_version
+from fluttercraft.commands.fvm.version import check_fvm_version
+
+# Placeholder shown in the header while the Flutter update check is running
+PENDING_FLUTTER_INFO = {
+    "installed": False,
+    "current_version": None,
+    "latest_version": None,
+    "update_available": False,
+    "pending": True,
+}
+
+# Results reported when a probe raises instead of returning its usual dict
+_FALLBACK_RESULTS: Dict[str, Dict[str, Any]] = {
+    "platform": {},
+    "flutter": {
+        "installed": False,
+        "current_version": None,
+        "latest_version": None,
+        "update_available": False,
+    },
+    "fvm": {"installed": False, "version": None},
+}
+
+
+class StartupProbes:
+    """Run the toolchain probes concurrently so the REPL never waits on them.
+
+    Every probe runs on its own daemon worker, so a slow ``flutter upgrade
+    --verify-only`` can neither delay the prompt nor keep the process alive
+    after the user quits.
+    """
+
+    FAST_PROBES = ("platform", "fvm")
+    SLOW_PROBES = ("flutter",)
+
+    def __init__(self) -> None:
+        self._futures: Dict[str, Future] = {}
+
+    def start(self) -> "StartupProbes":
+        """Submit all probes and return immediately."""
+        self._submit("platform", get_platform_info)
+        self._submit("fvm", lambda: check_fvm_version(silent=True, use_cache=True))
+        self._submit(
+            "flutter", lambda: check_flutter_version(silent=True, use_cache=True)
+        )
+        return self
+
+    def wait_fast(
+        self, timeout: Optional[float] = None
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Block until the cheap probes finish.
+
+        Returns:
+            tuple: (platform_info, fvm_info)
+        """
+        platform_info = self._futures["platform"].result(timeout=timeout)
+        fvm_info = self._futures["fvm"].result(timeout=timeout)
+        return platform_info, fvm_info
+
+    def is_done(self, name: str) -> bool:
+        future = self._futures.get(name)
+        return future is not None and future.done()
+
+    def result(self, name: str, default: Dict[str, Any]) -> Dict[str, Any]:
+        """Return a probe's result if it has finished, otherwise ``default``."""
+        if not self.is_done(name):
+            return default
+        return self._futures[name].result()
+
+    def on_complete(
+        self, name: str, callback: Callable[[Dict[str, Any]], None]
+    ) -> None:
+        """Invoke ``callback`` with the probe result once it is available.
+
+        The callback runs on the probe's worker thread, or immediately on the
+        calling thread if the probe has already finished.
+        """
+        self._futures[name].add_done_callback(
+            lambda future: callback(future.result())
+        )
+
+    def _submit(self, name: str, probe: Callable[[], Dict[str, Any]]) -> None:
+        future: Future = Future()
+
+        def run() -> None:
+            try:
+                result = probe()
+            except Exception:  # noqa: BLE001
+                result = dict(_FALLBACK_RESULTS[name])
+            future.set_result(result)
+
+        thread = threading.Thread(
+            target=run, name=f"fluttercraft-probe-{name}", daemon=True
+        )
+        self._futures[name] = future
+        thread.start()
+
+
+__all__ = ["StartupProbes", "PENDING_FLUTTER_INFO"]
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 from rich.console import Console
+from rich.markup import escape
+from rich.table import Table
+from rich.text import Text
 
 from fluttercraft.utils.themed_display import (
     display_themed_about,
@@ -8,7 +11,10 @@ from fluttercraft.utils.themed_display import (
     display_themed_welcome_header,
 )
 
+from fluttercraft.utils.terminal_utils import SPINNER_INTERVAL
+
 from fluttercraft.commands.core.base import Command
+from fluttercraft.commands.core.jobs import format_elapsed, get_job_manager
 from fluttercraft.commands.core.models import (
     CommandContext,
     CommandMetadata,
@@ -28,6 +34,9 @@ class SlashCommand(Command):
         )
         super().__init__(metadata)
 
+    def supports_background(self, args: list[str]) -> bool:
+        return False
+
     def _print(self, console: Console, message: str) -> None:
         console.print(message)
 
@@ -92,3 +101,153 @@ class ThemeSlashCommand(SlashCommand):
             show_ascii=True,
         )
         return CommandResult(success=True)
+
+
+class JobsSlashCommand(SlashCommand):
+    def __init__(self) -> None:
+        super().__init__("/jobs", "List background jobs")
+
+    def execute(self, context: CommandContext, args: list[str]) -> CommandResult:
+        manager = get_job_manager()
+        jobs = manager.list_jobs()
+        if not jobs:
+            self._print(
+                context.console,
+                "[dim]No background jobs. End a command with '&' to start one, "
+                "e.g. flutter upgrade &[/]",
+            )
+            return CommandResult(success=True)
+
+        table = Table(show_header=True, header_style="bold magenta")
+        table.add_column("ID", style="cyan", justify="right", no_wrap=True)
+        table.add_column("Status", no_wrap=True)
+        table.add_column("Time", justify="right", no_wrap=True)
+        table.add_column("Command", style="bold", min_width=16)
+        table.add_column(
+            "Last output", style="dim", no_wrap=True, overflow="ellipsis", max_width=32
+        )
+        for job in jobs:
+            table.add_row(
+                str(job.id),
+                _JOB_STATUS_STYLES[job.status],
+                format_elapsed(job.elapsed),
+                Text(job.command),
+                Text(job.output.last_line.strip()),
+            )
+        context.console.print(table)
+
+        # Finished jobs are listed once more, then forgotten
+        manager.prune()
+        return CommandResult(success=True)
+
+
+class FgSlashCommand(SlashCommand):
+    def __init__(self) -> None:
+        super().__init__("/fg", "Follow a background job's output until it finishes")
+
+    def execute(self, context: CommandContext, args: list[str]) -> CommandResult:
+        job = _resolve_job(args)
+        if isinstance(job, CommandResult):
+            return job
+
+        console = context.console
+        console.print(f"[cyan]\\[{job.id}][/] {escape(job.command)}")
+        cursor = 0
+        try:
+            while True:
+                lines, cursor = job.output.read_since(cursor)
+                for line in lines:
+                    console.print(Text.from_ansi(line))
+                if job.is_finished:
+                    break
+                job.output.wait(SPINNER_INTERVAL)
+        except KeyboardInterrupt:
+            console.print(
+                f"\n[yellow]Detached; job {job.id} keeps running in the background.[/]"
+            )
+            return CommandResult(success=True)
+
+        # Drain whatever arrived between the last read and the job finishing
+        lines, cursor = job.output.read_since(cursor)
+        for line in lines:
+            console.print(Text.from_ansi(line))
+        console.print(
+            f"[cyan]\\[{job.id}][/] {_JOB_STATUS_STYLES[job.status]} "
+            f"[dim]({format_elapsed(job.elapsed)})[/]"
+        )
+        return CommandResult(success=job.status == "done")
+
+
+class KillSlashCommand(SlashCommand):
+    def __init__(self) -> None:
+        super().__init__("/kill", "Stop a background job")
+
+    def execute(self, context: CommandContext, args: list[str]) -> CommandResult:
+        job = _resolve_job(args)
+        if isinstance(job, CommandResult):
+            return job
+        if not job.is_running:
+            return CommandResult(
+                success=False, message=f"✗ Job {job.id} has already finished"
+            )
+
+        job.kill()
+        self._print(context.console, f"[yellow]Stopping job {job.id}...[/]")
+        return CommandResult(success=True)
+
+
+class WaitSlashCommand(SlashCommand):
+    def __init__(self) -> None:
+        super().__init__("/wait", "Wait for background jobs to finish")
+
+    def execute(self, context: CommandContext, args: list[str]) -> CommandResult:
+        if args:
+            job = _resolve_job(args)
+            if isinstance(job, CommandResult):
+                return job
+            jobs = [job]
+        else:
+            jobs = get_job_manager().running()
+
+        if not jobs:
+            self._print(context.console, "[dim]No running jobs.[/]")
+            return CommandResult(success=True)
+
+        try:
+            with context.console.status(
+                f"Waiting for {len(jobs)} {'job' if len(jobs) == 1 else 'jobs'}..."
+            ):
+                for job in jobs:
+                    # Short waits so Ctrl+C gets through (on Windows too)
+                    while not job.wait(SPINNER_INTERVAL):
+                        pass
+        except KeyboardInterrupt:
+            self._print(context.console, "\n[yellow]Stopped waiting.[/]")
+        return CommandResult(success=True)
+
+
+_JOB_STATUS_STYLES = {
+    "running": "[yellow]running[/]",
+    "done": "[bold green]✓ done[/]",
+    "failed": "[bold red]✗ failed[/]",
+    "killed": "[yellow]killed[/]",
+}
+
+
+def _resolve_job(args: list[str]):
+    """Return the job named in ``args`` or a CommandResult describing why not.
+
+    Without an ID the most recently started job is used.
+    """
+    manager = get_job_manager()
+    if not args:
+        jobs = manager.list_jobs()
+        if not jobs:
+            return CommandResult(success=False, message="✗ No background jobs")
+        return jobs[-1]
+
+    job_id = args[0].lstrip("%")
+    job = manager.get(int(job_id)) if job_id.isdigit() else None
+    if job is None:
+        return CommandResult(success=False, message=f"✗ No such job: {args[0]}")
+    return job
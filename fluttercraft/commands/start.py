@@ -1,28 +1,35 @@
 """Start command for FlutterCraft CLI with beautiful interface."""
 
-import time
-
 from rich.console import Console
 from rich.spinner import Spinner
 from rich.live import Live
-from prompt_toolkit.history import InMemoryHistory
 
-from fluttercraft.utils.platform_utils import get_platform_info
-from fluttercraft.utils.beautiful_display import show_platform_not_supported
+from fluttercraft.utils.beautiful_display import (
+    show_platform_not_supported,
+    update_system_info,
+)
 from fluttercraft.utils.themed_display import (
     display_themed_welcome_header,
     create_themed_ascii_art,
     clear_screen,
 )
+from fluttercraft.utils.command_history import get_command_history
 from fluttercraft.utils.beautiful_prompt import (
     prompt_user_with_border,
     FlutterCraftCompleter,
     update_command_completions,
+    get_argument_completer,
+    refresh_completions,
+    run_above_prompt,
 )
-from fluttercraft.commands.flutter_commands import check_flutter_version
-from fluttercraft.commands.fvm_commands import check_fvm_version
+from fluttercraft.commands.probes import StartupProbes, PENDING_FLUTTER_INFO
 from fluttercraft.commands.core import CommandContext
+from fluttercraft.commands.core.jobs import get_job_manager
 from fluttercraft.commands.bootstrap import build_command_system
+from fluttercraft.commands.fvm.version_completions import (
+    get_version_completions,
+    register_version_completions,
+)
 
 console = Console()
 
@@ -47,20 +54,16 @@ def start_command():
     console.print(ascii_art)
     console.print()
 
-    # Show loading spinner
+    # Launch all environment probes concurrently
+    probes = StartupProbes().start()
+
+    # Show loading spinner until the cheap probes are done
     spinner = Spinner("dots", text="[cyan]Loading system information...[/]")
     with Live(spinner, console=console, refresh_per_second=10):
-        # Get platform information (fast, no external calls)
-        platform_info = get_platform_info()
-        time.sleep(0.3)  # Small delay to show spinner
+        platform_info, fvm_info = probes.wait_fast()
 
-        # Check Flutter installation and version (silent mode)
-        flutter_info = check_flutter_version(silent=True)
-        time.sleep(0.3)  # Small delay to show spinner
-
-        # Check FVM installation (silent mode)
-        fvm_info = check_fvm_version(silent=True)
-        time.sleep(0.3)  # Small delay to show spinner
+    # The Flutter update check is network-bound; don't wait for it
+    flutter_info = probes.result("flutter", dict(PENDING_FLUTTER_INFO))
 
     # Clear screen and display themed static header
     clear_screen()
@@ -68,13 +71,24 @@ def start_command():
         platform_info, flutter_info, fvm_info, show_ascii=True
     )
 
-    # Create completer and history for bordered prompt
+    # Create completer and history for bordered prompt; the history file is
+    # read in the background and is searchable once it has loaded
     completer = FlutterCraftCompleter()
-    history = InMemoryHistory()
+    history = get_command_history().start_loading()
 
     executor = build_command_system(console)
+    # Job completion notices appear above the prompt
+    get_job_manager().notify = lambda message: run_above_prompt(
+        lambda: console.print(message, style="cyan", markup=False, highlight=False)
+    )
     update_command_completions(executor.registry.to_metadata())
 
+    # SDK versions for argument completion load in the background
+    version_completions = get_version_completions()
+    register_version_completions(get_argument_completer(), version_completions)
+    version_completions.on_change(refresh_completions)
+    version_completions.start()
+
     context = CommandContext(
         platform_info=platform_info,
         flutter_info=flutter_info,
@@ -83,6 +97,11 @@ def start_command():
         prompt_history=history,
     )
 
+    if flutter_info.get("pending"):
+        probes.on_complete(
+            "flutter", lambda info: _apply_flutter_probe(context, info)
+        )
+
     # Main REPL loop
     while True:
         try:
@@ -113,3 +132,17 @@ def start_command():
             console.print(f"\n[bold red]An error occurred: {str(e)}[/]")
             console.print("[dim]Please report this issue if it persists.[/]")
             continue
+
+
+def _apply_flutter_probe(context: CommandContext, flutter_info: dict) -> None:
+    """Fill in the Flutter status once the background check finishes."""
+    # A command such as 'flutter upgrade' may already have refreshed it
+    if not context.flutter_info.get("pending"):
+        return
+
+    context.flutter_info = flutter_info
+    run_above_prompt(
+        lambda: update_system_info(
+            context.platform_info, context.flutter_info, context.fvm_info
+        )
+    )
@@ -9,7 +9,6 @@ from prompt_toolkit.layout.controls import FormattedTextControl
 from prompt_toolkit.formatted_text import HTML, FormattedText
 from prompt_toolkit.widgets import Frame
 from rich.console import Console
-from rich.syntax import Syntax
 from rich.text import Text
 import io
 
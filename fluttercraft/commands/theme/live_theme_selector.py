@@ -6,14 +6,17 @@ from rich.console import Console, Group
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
-from rich.syntax import Syntax
-from rich.layout import Layout
-from rich.live import Live
 import msvcrt  # For Windows key detection
 
+from fluttercraft.utils.lazy_import import lazy_module
 from fluttercraft.utils.themes import get_theme_manager
 from fluttercraft.utils.themes.professional_themes import PROFESSIONAL_THEMES
 
+# Only needed once the selector is drawn
+rich_syntax = lazy_module("rich.syntax")
+rich_layout = lazy_module("rich.layout")
+rich_live = lazy_module("rich.live")
+
 console = Console()
 
 
@@ -92,7 +95,7 @@ def fibonacci(n):
         code = self._get_code_sample()
 
         # Create custom syntax with theme colors
-        syntax = Syntax(
+        syntax = rich_syntax.Syntax(
             code,
             "python",
             theme="monokai",  # Base theme
@@ -140,21 +143,21 @@ def fibonacci(n):
             style=f"on {theme.background}",
         )
 
-    def _create_layout(self) -> Layout:
+    def _create_layout(self) -> "rich_layout.Layout":
         """Create the main layout with current theme colors."""
         # Get current theme for UI colors
         preview_theme = PROFESSIONAL_THEMES[self.themes[self.selected_index]]
 
-        layout = Layout()
+        layout = rich_layout.Layout()
 
         layout.split_column(
-            Layout(name="main", ratio=10),
-            Layout(name="help", size=3),
+            rich_layout.Layout(name="main", ratio=10),
+            rich_layout.Layout(name="help", size=3),
         )
 
         layout["main"].split_row(
-            Layout(name="themes", ratio=1),
-            Layout(name="preview", ratio=2),
+            rich_layout.Layout(name="themes", ratio=1),
+            rich_layout.Layout(name="preview", ratio=2),
         )
 
         layout["themes"].update(self._create_theme_list_panel(preview_theme))
@@ -172,7 +175,7 @@ def fibonacci(n):
         console.print(f"\n[bold cyan]Interactive Theme Selector[/]\n")
 
         try:
-            with Live(
+            with rich_live.Live(
                 self._create_layout(),
                 console=console,
                 refresh_per_second=10,
@@ -6,13 +6,16 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
-from rich.layout import Layout
-from rich.live import Live
 import msvcrt  # For Windows key detection
 
+from fluttercraft.utils.lazy_import import lazy_module
 from fluttercraft.utils.themes import get_theme_manager, PROFESSIONAL_THEMES
 from fluttercraft.utils.themes.gradient import create_gradient_text
 
+# Only needed once the selector is drawn
+rich_layout = lazy_module("rich.layout")
+rich_live = lazy_module("rich.live")
+
 console = Console()
 
 
@@ -128,18 +131,18 @@ class RichThemeSelector:
 
         return Panel(help_text, border_style="dim", padding=(0, 2))
 
-    def _create_layout(self) -> Layout:
+    def _create_layout(self) -> "rich_layout.Layout":
         """Create the main layout."""
-        layout = Layout()
+        layout = rich_layout.Layout()
 
         layout.split_column(
-            Layout(name="main", ratio=10),
-            Layout(name="help", size=3),
+            rich_layout.Layout(name="main", ratio=10),
+            rich_layout.Layout(name="help", size=3),
         )
 
         layout["main"].split_row(
-            Layout(name="themes", ratio=1),
-            Layout(name="preview", ratio=2),
+            rich_layout.Layout(name="themes", ratio=1),
+            rich_layout.Layout(name="preview", ratio=2),
         )
 
         layout["themes"].update(self._create_theme_list_panel())
@@ -157,7 +160,7 @@ class RichThemeSelector:
         console.print("\n[bold cyan]Interactive Theme Selector[/]\n")
 
         try:
-            with Live(
+            with rich_live.Live(
                 self._create_layout(),
                 console=console,
                 refresh_per_second=10,
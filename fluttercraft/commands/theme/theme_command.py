@@ -13,7 +13,6 @@ from fluttercraft.utils.themed_display import (
     print_error,
     print_info,
 )
-from .interactive_selector import run_interactive_theme_selector
 
 theme_app = typer.Typer(help="Manage FlutterCraft themes")
 console = Console()
@@ -43,7 +42,10 @@ def set_theme(
         # Show a preview of the new theme
         if theme.gradient_colors:
             preview = create_gradient_text(
-                "FlutterCraft", theme.gradient_colors, bold=True
+                "FlutterCraft",
+                theme.gradient_colors,
+                bold=True,
+                color_system=console.color_system,
             )
             console.print("\nPreview: ", end="")
             console.print(preview)
@@ -166,7 +168,10 @@ def preview_theme(
     # Show ASCII art preview with gradient
     if theme.gradient_colors:
         preview_text = create_gradient_text(
-            "FlutterCraft", theme.gradient_colors, bold=True
+            "FlutterCraft",
+            theme.gradient_colors,
+            bold=True,
+            color_system=console.color_system,
         )
         console.print(preview_text)
     else:
@@ -200,6 +205,8 @@ def select_theme_interactive():
     Example:
         fluttercraft theme select
     """
+    from .interactive_selector import run_interactive_theme_selector
+
     run_interactive_theme_selector()
 
 
@@ -212,4 +219,6 @@ def theme_callback(ctx: typer.Context):
     """
     if ctx.invoked_subcommand is None:
         # If no subcommand, launch interactive selector
+        from .interactive_selector import run_interactive_theme_selector
+
         run_interactive_theme_selector()
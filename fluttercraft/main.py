@@ -1,9 +1,7 @@
 import typer
 from rich.console import Console
 
-from fluttercraft.commands.start import start_command
 from fluttercraft.commands.theme import theme_app
-from fluttercraft.utils.display_utils import display_welcome_art
 
 app = typer.Typer(help="FlutterCraft: Automate your Flutter app setup like a pro.")
 console = Console()
@@ -15,6 +13,9 @@ app.add_typer(theme_app, name="theme")
 @app.command()
 def start():
     """Start the FlutterCraft interactive CLI."""
+    # Imported here so other subcommands don't load the interactive shell
+    from fluttercraft.commands.start import start_command
+
     # Don't display old welcome art - start_command handles it
     start_command()
 
@@ -1,12 +1,18 @@
 """FlutterCraft CLI utilities package."""
 
-from fluttercraft.utils.platform_utils import get_platform_info
-from fluttercraft.utils.display_utils import (
-    display_welcome_art,
-    display_full_header,
-    refresh_display,
-    add_to_history,
-    clear_command,
-)
-from fluttercraft.utils.terminal_utils import run_with_loading, OutputCapture
-from fluttercraft.utils.system_utils import check_chocolatey_installed
+from fluttercraft.utils.lazy_import import lazy_exports
+
+_EXPORTS = {
+    "get_platform_info": "fluttercraft.utils.platform_utils",
+    "display_welcome_art": "fluttercraft.utils.display_utils",
+    "display_full_header": "fluttercraft.utils.display_utils",
+    "refresh_display": "fluttercraft.utils.display_utils",
+    "add_to_history": "fluttercraft.utils.display_utils",
+    "clear_command": "fluttercraft.utils.display_utils",
+    "run_with_loading": "fluttercraft.utils.terminal_utils",
+    "run_with_loading_async": "fluttercraft.utils.terminal_utils",
+    "OutputCapture": "fluttercraft.utils.terminal_utils",
+    "check_chocolatey_installed": "fluttercraft.utils.system_utils",
+}
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, _EXPORTS)
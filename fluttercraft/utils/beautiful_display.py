@@ -2,11 +2,12 @@
 
 import os
 import platform
-import subprocess
 from pathlib import Path
 
 from rich.console import Console
 
+from fluttercraft.utils.git_status import get_git_status_provider
+
 console = Console()
 
 
@@ -30,40 +31,12 @@ def create_ascii_art():
 
 
 def get_git_info():
-    """Get current git branch and status."""
-    try:
-        # Get current directory
-        cwd = os.getcwd()
-
-        # Get git branch
-        branch_result = subprocess.run(
-            ["git", "branch", "--show-current"],
-            capture_output=True,
-            text=True,
-            cwd=cwd,
-            timeout=2,
-        )
-
-        if branch_result.returncode == 0:
-            branch = branch_result.stdout.strip()
-
-            # Check if there are uncommitted changes
-            status_result = subprocess.run(
-                ["git", "status", "--porcelain"],
-                capture_output=True,
-                text=True,
-                cwd=cwd,
-                timeout=2,
-            )
+    """Get current git branch and status.
 
-            has_changes = bool(status_result.stdout.strip())
-            status_indicator = "*" if has_changes else ""
-
-            return f"{branch}{status_indicator}"
-        else:
-            return None
-    except (subprocess.TimeoutExpired, FileNotFoundError, Exception):
-        return None
+    Returns the last known state immediately; git itself runs in the
+    background (see fluttercraft.utils.git_status).
+    """
+    return get_git_status_provider().describe()
 
 
 def get_current_path():
@@ -113,7 +86,9 @@ def display_welcome_header(platform_info, flutter_info, fvm_info, show_ascii=Tru
 
     # Format Flutter version with update indicator
     flutter_version = flutter_info.get("current_version")
-    if flutter_version:
+    if flutter_info.get("pending"):
+        flutter_display = "checking..."
+    elif flutter_version:
         if flutter_info.get("update_available"):
             latest = flutter_info.get("latest_version", "unknown")
             flutter_display = (
@@ -259,7 +234,9 @@ def update_system_info(platform_info, flutter_info, fvm_info):
 
     # Format Flutter version with update indicator
     flutter_version = flutter_info.get("current_version")
-    if flutter_version:
+    if flutter_info.get("pending"):
+        flutter_display = "checking..."
+    elif flutter_version:
         if flutter_info.get("update_available"):
             latest = flutter_info.get("latest_version", "unknown")
             flutter_display = (
@@ -1,19 +1,32 @@
 """Beautiful prompt system using prompt_toolkit for FlutterCraft CLI."""
 
-from typing import Iterable, TYPE_CHECKING
+import threading
+from typing import Callable, Iterable, Optional, TYPE_CHECKING
 
 from prompt_toolkit import Application
+from prompt_toolkit.application import run_in_terminal
+from prompt_toolkit.application.current import set_app
 from prompt_toolkit.completion import Completer, Completion
 from prompt_toolkit.history import InMemoryHistory
 from prompt_toolkit.auto_suggest import AutoSuggestFromHistory
-from prompt_toolkit.key_binding import KeyBindings
-from prompt_toolkit.formatted_text import ANSI
+from prompt_toolkit.buffer import Buffer
+from prompt_toolkit.key_binding import KeyBindings, merge_key_bindings
+from prompt_toolkit.key_binding.bindings.auto_suggest import load_auto_suggest_bindings
+from prompt_toolkit.formatted_text import ANSI, FormattedText
 from prompt_toolkit.styles import Style
 from prompt_toolkit.layout import Layout, HSplit, Window, FormattedTextControl
+from prompt_toolkit.layout.controls import BufferControl, UIContent, UIControl
+from prompt_toolkit.layout.dimension import Dimension
+from prompt_toolkit.layout.margins import Margin
+from prompt_toolkit.layout.processors import AppendAutoSuggestion
 from rich.console import Console
+from rich.markup import escape
 import os
 from pathlib import Path
 
+from fluttercraft.utils.command_history import IndexedAutoSuggest, PersistentHistory
+from fluttercraft.utils.completion_index import ArgumentCompleter, CompletionIndex
+from fluttercraft.utils.git_status import get_git_status_provider
 from fluttercraft.utils.themed_display import get_theme
 
 if TYPE_CHECKING:
@@ -28,18 +41,35 @@ SLASH_COMMANDS = {
     "/help": "Show comprehensive help information",
     "/about": "Show information about FlutterCraft CLI",
     "/theme": "Launch interactive theme selector",
+    "/jobs": "List background jobs (end a command with & to start one)",
+    "/fg": "Follow a background job's output until it finishes",
+    "/kill": "Stop a background job",
+    "/wait": "Wait for background jobs to finish",
 }
 
 # Define FVM commands with descriptions
 FVM_COMMANDS = {
     "fvm": "Show FVM help",
     "fvm install": "Install Flutter Version Manager",
+    "fvm install --jobs": "Install Flutter SDK versions in parallel",
     "fvm uninstall": "Uninstall Flutter Version Manager",
     "fvm releases": "List all available Flutter SDK versions",
     "fvm releases stable": "List stable Flutter versions",
     "fvm releases beta": "List beta Flutter versions",
     "fvm releases dev": "List dev Flutter versions",
+    "fvm releases --refresh": "Re-fetch the cached Flutter release list",
+    "fvm releases --since": "Releases on or after a date (YYYY-MM)",
+    "fvm releases --until": "Releases on or before a date (YYYY-MM)",
+    "fvm releases --range": 'Releases in a version range, e.g. ">=3.16 <3.22"',
+    "fvm releases --dart": "Releases bundling a Dart SDK version, e.g. 3.3",
+    "fvm releases --search": "Releases whose version, date or channel matches",
+    "fvm releases --limit": "Rows per page (default 50, 0 for all)",
+    "fvm releases --offset": "Skip the N newest matches to page back",
     "fvm list": "List installed Flutter SDK versions",
+    "fvm list --fvm": "List installed versions by asking FVM itself",
+    "fvm list --sizes": "Measure the disk usage of each installed SDK",
+    "fvm use": "Switch to an installed Flutter SDK version",
+    "fvm remove": "Remove an installed Flutter SDK version",
     "fvm --help": "Show FVM help",
 }
 
@@ -54,6 +84,97 @@ FLUTTER_COMMANDS = {
 BASE_COMMANDS = {**SLASH_COMMANDS, **FVM_COMMANDS, **FLUTTER_COMMANDS}
 ALL_COMMANDS = dict(BASE_COMMANDS)
 
+# Rebuilt only when the command registry changes
+_completion_index = CompletionIndex(ALL_COMMANDS)
+
+# Argument values (SDK versions, channels) registered by command packages
+_argument_completer = ArgumentCompleter()
+# Bumped whenever completion data changes, so memoized menus are recomputed
+_completion_generation = 0
+
+# Prompt application currently waiting for input, if any
+_active_app: Optional[Application] = None
+# Output callbacks queued by background threads for display above the prompt
+_deferred_output: list[Callable[[], None]] = []
+_deferred_lock = threading.Lock()
+
+
+def run_above_prompt(func: Callable[[], None]) -> None:
+    """Run ``func`` so that anything it prints lands above the prompt.
+
+    Safe to call from worker threads. While the bordered prompt is waiting for
+    input the prompt is temporarily hidden and redrawn after ``func`` runs;
+    otherwise ``func`` is deferred until just before the next prompt is drawn,
+    so it never interleaves with the output of a running command.
+    """
+    with _deferred_lock:
+        _deferred_output.append(func)
+        app = _active_app
+
+    if app is None or app.loop is None:
+        return
+
+    def flush_in_terminal() -> None:
+        callbacks = _take_deferred_output()
+        if not callbacks:
+            return
+        with set_app(app):
+            run_in_terminal(lambda: _run_callbacks(callbacks))
+
+    try:
+        app.loop.call_soon_threadsafe(flush_in_terminal)
+    except RuntimeError:
+        # Loop already closed; the callback is flushed before the next prompt
+        pass
+
+
+def _take_deferred_output() -> list[Callable[[], None]]:
+    with _deferred_lock:
+        callbacks = list(_deferred_output)
+        _deferred_output.clear()
+    return callbacks
+
+
+def _run_callbacks(callbacks: Iterable[Callable[[], None]]) -> None:
+    for callback in callbacks:
+        try:
+            callback()
+        except Exception as exc:  # noqa: BLE001
+            # Keep going with the rest, but don't let a failed update vanish
+            console.print(
+                f"[bold red]Background update failed: {escape(str(exc))}[/]",
+                highlight=False,
+            )
+
+
+def _activate_prompt(app: Application) -> None:
+    """Mark ``app`` as the active prompt and flush any queued output first."""
+    global _active_app
+
+    _run_callbacks(_take_deferred_output())
+    with _deferred_lock:
+        _active_app = app
+    # Anything queued while we were flushing still needs to be shown
+    _run_callbacks(_take_deferred_output())
+
+
+def _deactivate_prompt() -> None:
+    global _active_app
+
+    with _deferred_lock:
+        _active_app = None
+
+
+def _redraw_prompt() -> None:
+    """Redraw the active prompt, e.g. once a background git check finishes."""
+    with _deferred_lock:
+        app = _active_app
+    if app is not None:
+        app.invalidate()
+
+
+get_git_status_provider().on_change(_redraw_prompt)
+
 
 # Completion management
 def update_command_completions(
@@ -61,7 +182,7 @@ def update_command_completions(
 ) -> None:
     """Refresh completion map from registered commands."""
 
-    global ALL_COMMANDS
+    global ALL_COMMANDS, _completion_index
 
     commands = dict(BASE_COMMANDS)
     for metadata in command_metadata:
@@ -70,9 +191,32 @@ def update_command_completions(
         for alias in metadata.aliases:
             commands[alias] = description
 
+    if commands != ALL_COMMANDS:
+        _completion_index = CompletionIndex(commands)
     ALL_COMMANDS = commands
 
 
+def get_completion_index() -> CompletionIndex:
+    """Return the index behind command completion."""
+    return _completion_index
+
+
+def get_argument_completer() -> ArgumentCompleter:
+    """Return the completer for command arguments."""
+    return _argument_completer
+
+
+def refresh_completions() -> None:
+    """Recompute the completion menu, e.g. once argument data has loaded.
+
+    Safe to call from worker threads.
+    """
+    global _completion_generation
+
+    _completion_generation += 1
+    _redraw_prompt()
+
+
 def build_prompt_style() -> Style:
     theme = get_theme()
 
@@ -104,71 +248,55 @@ class FlutterCraftCompleter(Completer):
         # Get the text on the current line before cursor
         text = document.current_line_before_cursor.lstrip()
 
-        # If text starts with /, show slash commands immediately
-        if text.startswith("/"):
-            for cmd, desc in SLASH_COMMANDS.items():
-                if cmd.startswith(text):
-                    yield Completion(
-                        cmd[len(text):],  # Only complete the remaining part
-                        display=cmd,
-                        display_meta=desc,
-                    )
-        # If text is just "/", show all slash commands
-        elif text == "/":
-            for cmd, desc in SLASH_COMMANDS.items():
-                yield Completion(
-                    cmd[1:],  # Skip the / since user already typed it
-                    display=cmd,
-                    display_meta=desc,
-                )
         # If text is empty, don't show anything
-        elif text == "":
-            pass
-        # Otherwise show matching commands from all categories
-        else:
-            for cmd, desc in ALL_COMMANDS.items():
-                if cmd.lower().startswith(text.lower()):
-                    yield Completion(
-                        cmd[len(text):],  # Only complete the remaining part
-                        display=cmd,
-                        display_meta=desc,
-                    )
-
+        if not text:
+            return
+
+        # Argument values ('fvm use 3.2') follow any matching commands;
+        # otherwise prefix matches come first, then fuzzy matches ("fvmrel")
+        partial, arguments = _argument_completer.complete(text)
+        commands = (
+            _completion_index.prefix_matches(text)
+            if arguments
+            else _completion_index.complete(text)
+        )
 
-def get_git_info():
-    """Get current git branch and status."""
-    try:
-        import subprocess
+        for entry in commands:
+            yield Completion(
+                entry.text,
+                start_position=-len(text),  # Replace what was typed
+                display=entry.text,
+                display_meta=entry.description,
+            )
+        for entry in arguments:
+            yield Completion(
+                entry.text,
+                start_position=-len(partial),  # Replace the word being typed
+                display=entry.text,
+                display_meta=entry.description,
+            )
 
-        cwd = os.getcwd()
 
-        branch_result = subprocess.run(
-            ["git", "branch", "--show-current"],
-            capture_output=True,
-            text=True,
-            cwd=cwd,
-            timeout=2,
-        )
+def _search_history(history, query: str) -> list[str]:
+    """Commands in ``history`` containing ``query``, newest first."""
+    if isinstance(history, PersistentHistory):
+        return history.search(query)
 
-        if branch_result.returncode == 0:
-            branch = branch_result.stdout.strip()
+    query = query.lower()
+    matches = []
+    for string in reversed(history.get_strings()):
+        if query in string.lower() and string not in matches:
+            matches.append(string)
+    return matches
 
-            status_result = subprocess.run(
-                ["git", "status", "--porcelain"],
-                capture_output=True,
-                text=True,
-                cwd=cwd,
-                timeout=2,
-            )
 
-            has_changes = bool(status_result.stdout.strip())
-            status_indicator = "*" if has_changes else ""
+def get_git_info():
+    """Get current git branch and status.
 
-            return f"{branch}{status_indicator}"
-        else:
-            return None
-    except Exception:
-        return None
+    Returns the last known state immediately; git itself runs in the
+    background (see fluttercraft.utils.git_status).
+    """
+    return get_git_status_provider().describe()
 
 
 def get_current_path():
@@ -250,104 +378,178 @@ def get_bottom_toolbar():
     return HTML(f"<b>{location}</b>")
 
 
-def prompt_user_with_border(completer, history):
-    """Prompt user with bordered input box and permanent completion menu area below.
+class PromptEngine:
+    """Bordered input box with a permanent completion menu area below.
 
-    Args:
-        completer: The completer instance
-        history: The history instance
+    The buffer, layout, key bindings and Application are built once and
+    reused for every command; between prompts only the input and menu state
+    are reset, and the style is rebuilt only after the theme changes.
 
-    Returns:
-        str: The user's input
+    Ctrl-R switches the menu to a reverse search of the command history,
+    matching what has been typed so far.
     """
-    from prompt_toolkit.layout.containers import VSplit, Window as LayoutWindow
-    from prompt_toolkit.layout.controls import BufferControl
-    from prompt_toolkit.buffer import Buffer
-    from prompt_toolkit.document import Document
-    from prompt_toolkit.layout.dimension import Dimension
-
-    # Track selected completion index and scroll position
-    selected_index = [0]  # Use list to make it mutable in nested functions
-    scroll_offset = [0]  # Scroll position for viewing window
-    current_completions = []  # Store current completions
+
     VISIBLE_ITEMS = 5  # Number of items visible at once
+    PROMPT_SYMBOL = " > "
+
+    def __init__(self, completer, history):
+        """Build the prompt.
+
+        Args:
+            completer: The completer instance
+            history: The history instance; submitted commands are appended to it
+        """
+        self.completer = completer
+        self.history = history
+
+        # Track selected completion index and scroll position
+        self.selected_index = 0
+        self.scroll_offset = 0  # Scroll position for viewing window
+        self.current_completions: list[Completion] = []
+        self.completions_for = None  # Input the completions were computed for
+        self.history_search = False  # Whether the menu shows history (Ctrl-R)
+
+        # Create buffer for input
+        self.buffer = Buffer(
+            completer=completer,
+            complete_while_typing=False,  # Don't auto-complete while typing
+            history=history,
+            auto_suggest=IndexedAutoSuggest(),
+            multiline=False,
+        )
 
-    # Create buffer for input
-    input_buffer = Buffer(
-        completer=completer,
-        complete_while_typing=False,  # Don't auto-complete while typing
-        history=history,
-        auto_suggest=AutoSuggestFromHistory(),
-        multiline=False,
-    )
+        # Create input control
+        self.input_control = BufferControl(
+            buffer=self.buffer,
+            # Show the history suggestion after the cursor (Right arrow accepts it)
+            input_processors=[AppendAutoSuggestion()],
+            focusable=True,
+        )
 
-    # Create input control
-    input_control = BufferControl(
-        buffer=input_buffer,
-        focusable=True,
-    )
+        self._theme = get_theme()
+        # Create application (NOT full-screen - we want to preserve command output!)
+        self.app = Application(
+            layout=self._build_layout(),
+            key_bindings=merge_key_bindings(
+                [load_auto_suggest_bindings(), self._build_key_bindings()]
+            ),
+            style=build_prompt_style(),
+            full_screen=False,  # NOT full-screen - preserve command output
+            mouse_support=False,  # Disable to allow terminal scrolling
+        )
 
-    prompt_symbol = " > "
+    def serves(self, completer, history) -> bool:
+        """Whether this engine was built for ``completer`` and ``history``."""
+        return completer is self.completer and history is self.history
 
-    # Create completion menu text control
-    def get_completions_text():
-        """Get formatted completions text with highlighting and scrolling."""
-        nonlocal current_completions
-        document = input_buffer.document
-        text = document.text_before_cursor.lstrip()
+    def prompt(self) -> str:
+        """Read one command.
 
-        if not text:
-            current_completions = []
-            selected_index[0] = 0
-            scroll_offset[0] = 0
-            return ""
+        Returns:
+            str: The user's input
+        """
+        self._reset()
 
-        # Check if text exactly matches a command (hide menu if exact match)
-        all_commands = {**SLASH_COMMANDS, **FVM_COMMANDS, **FLUTTER_COMMANDS}
-        if text in all_commands:
-            current_completions = []
-            selected_index[0] = 0
-            scroll_offset[0] = 0
-            return ""
+        theme = get_theme()
+        if theme is not self._theme:
+            self._theme = theme
+            self.app.style = build_prompt_style()
 
-        completions = list(completer.get_completions(document, None))
-        current_completions = completions  # Store ALL completions
+        # Run and return result
+        try:
+            result = self.app.run(pre_run=lambda: _activate_prompt(self.app))
+            return result.strip() if result else ""
+        except KeyboardInterrupt:
+            return ""
+        except EOFError:
+            return "/quit"
+        finally:
+            _deactivate_prompt()
+
+    def _reset(self) -> None:
+        self.buffer.reset()
+        self.selected_index = 0
+        self.scroll_offset = 0
+        self.current_completions = []
+        self.completions_for = None
+        self.history_search = False
+
+    # ------------------------------------------------------------------
+    # Completion menu
+    # ------------------------------------------------------------------
+    def _completions_text(self):
+        """Get formatted completions text with highlighting and scrolling."""
+        document = self.buffer.document
+        text = document.text_before_cursor.lstrip()
 
-        if not current_completions:
-            selected_index[0] = 0
-            scroll_offset[0] = 0
+        if self.history_search:
+            key = ("history", text)
+        elif not text or text in _completion_index:
+            # Nothing typed, or an exact command match: hide the menu
+            self.current_completions = []
+            self.completions_for = None
+            self.selected_index = 0
+            self.scroll_offset = 0
+            return ""
+        else:
+            key = (text, _completion_generation)
+
+        # Redraws (cursor moves, toolbar updates) reuse the last lookup
+        if self.completions_for != key:
+            if self.history_search:
+                self.current_completions = [
+                    Completion(
+                        string,
+                        start_position=-len(document.text_before_cursor),
+                        display=string,
+                        display_meta="history",
+                    )
+                    for string in _search_history(self.history, text)
+                ]
+            else:
+                self.current_completions = list(
+                    self.completer.get_completions(document, None)
+                )
+                # A complete argument ('fvm use 3.22.0') is an exact match too
+                if any(
+                    text[len(text) + comp.start_position:] == comp.text
+                    for comp in self.current_completions
+                ):
+                    self.current_completions = []
+            self.completions_for = key
+
+        completions = self.current_completions
+        if not completions:
+            self.selected_index = 0
+            self.scroll_offset = 0
+            if self.history_search:
+                return [("class:completion-menu.meta", " No matching history")]
             return ""
 
         # Ensure selected index is valid
-        if selected_index[0] >= len(current_completions):
-            selected_index[0] = 0
-            scroll_offset[0] = 0
+        if self.selected_index >= len(completions):
+            self.selected_index = 0
+            self.scroll_offset = 0
 
         # Calculate scroll window
         # If selected item is below visible window, scroll down
-        if selected_index[0] >= scroll_offset[0] + VISIBLE_ITEMS:
-            scroll_offset[0] = selected_index[0] - VISIBLE_ITEMS + 1
+        if self.selected_index >= self.scroll_offset + self.VISIBLE_ITEMS:
+            self.scroll_offset = self.selected_index - self.VISIBLE_ITEMS + 1
         # If selected item is above visible window, scroll up
-        elif selected_index[0] < scroll_offset[0]:
-            scroll_offset[0] = selected_index[0]
+        elif self.selected_index < self.scroll_offset:
+            self.scroll_offset = self.selected_index
 
         # Get visible slice of completions
-        visible_completions = current_completions[
-            scroll_offset[0]: scroll_offset[0] + VISIBLE_ITEMS
+        visible_completions = completions[
+            self.scroll_offset: self.scroll_offset + self.VISIBLE_ITEMS
         ]
 
-        # Format completions as FormattedText with highlighting
-        from prompt_toolkit.formatted_text import FormattedText
-
         lines = []
         for i, comp in enumerate(visible_completions):
-            actual_index = scroll_offset[0] + i
+            actual_index = self.scroll_offset + i
 
             # Get display text - handle both string and FormattedText
-            if hasattr(comp.display, "__iter__") and not isinstance(comp.display, str):
-                display_str = "".join(text for style, text in comp.display)
-            else:
-                display_str = str(comp.display) if comp.display else comp.text
+            display_str = _completion_display(comp)
 
             # Get meta text
             if hasattr(comp.display_meta, "__iter__") and not isinstance(
@@ -361,7 +563,7 @@ def prompt_user_with_border(completer, history):
             line = f" {display_str:<25} {meta_str}"
 
             # Highlight selected item
-            if actual_index == selected_index[0]:
+            if actual_index == self.selected_index:
                 lines.append(("class:completion-menu.completion.current", line))
             else:
                 lines.append(("", line))
@@ -370,217 +572,226 @@ def prompt_user_with_border(completer, history):
                 lines.append(("", "\n"))
 
         # Add scroll indicator if there are more items
-        if len(current_completions) > VISIBLE_ITEMS:
-            total = len(current_completions)
-            showing = f" ({scroll_offset[0] + 1}-{min(scroll_offset[0] + VISIBLE_ITEMS, total)} of {total})"
+        if len(completions) > self.VISIBLE_ITEMS:
+            total = len(completions)
+            showing = f" ({self.scroll_offset + 1}-{min(self.scroll_offset + self.VISIBLE_ITEMS, total)} of {total})"
             if lines:
                 lines.append(("", "\n"))
             lines.append(("class:completion-menu.meta", showing))
 
         return FormattedText(lines)
 
-    completion_control = FormattedTextControl(
-        get_completions_text,
-        focusable=False,
-    )
-
-    # Create toolbar text
-    def get_toolbar_text():
+    def _select_completion(self) -> bool:
+        """Fill the input with the highlighted completion, if there is one."""
+        if not self.current_completions or self.selected_index >= len(
+            self.current_completions
+        ):
+            return False
+
+        completion = self.current_completions[self.selected_index]
+        # Replace current input with the line the completion finishes
+        before = self.buffer.document.text_before_cursor
+        text = before[: len(before) + completion.start_position] + completion.text
+        self.buffer.text = text
+        self.buffer.cursor_position = len(text)
+        self.history_search = False
+        return True
+
+    # ------------------------------------------------------------------
+    # Layout and key bindings, built once
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _toolbar_text() -> str:
         path = get_current_path()
         git_info = get_git_info()
         if git_info:
             return f"{path} ({git_info})"
         return path
 
-    toolbar_control = FormattedTextControl(
-        lambda: get_toolbar_text(),
-        focusable=False,
-    )
+    def _build_layout(self) -> Layout:
+        # Create layout (system info now in static header)
+        root_container = HSplit(
+            [
+                # Input box with frame (fixed 1 line height)
+                self._rounded_frame(
+                    self.input_control,
+                    height=1,  # Fixed 1 line height
+                    style="class:frame",
+                    with_prompt=True,
+                ),
+                # Completion menu area (permanent, shows completions when available)
+                self._rounded_frame(
+                    FormattedTextControl(self._completions_text, focusable=False),
+                    # Fixed height for menu (5 items + 1 scroll indicator)
+                    height=Dimension(min=6, max=6),
+                    style="class:completion-menu",
+                ),
+                # Toolbar
+                self._rounded_frame(
+                    FormattedTextControl(self._toolbar_text, focusable=False),
+                    height=1,
+                    style="class:toolbar",
+                ),
+            ]
+        )
 
-    def build_rounded_frame(
-        content: LayoutWindow, *, style: str, with_prompt: bool = False
+        return Layout(root_container, focused_element=self.input_control)
+
+    def _rounded_frame(
+        self, control, *, height, style: str, with_prompt: bool = False
     ) -> HSplit:
-        from prompt_toolkit.layout.containers import ConditionalContainer
-        from prompt_toolkit.widgets.base import Border
+        """Frame ``control`` in a rounded border.
 
+        The edges are single windows and the sides are margins: rows split
+        into several windows make prompt_toolkit divide the width column by
+        column on every redraw, which cost tens of milliseconds per frame.
+        """
         border_style = "class:frame.border"
 
-        def border_window(
-            char: str, *, width: int = 1, height: int = 1, stretch: bool = False
-        ) -> Window:
-            return Window(
-                char=char,
-                width=width if not stretch else None,
-                height=height,
-                style=border_style,
-            )
+        left = [(border_style, "│")]
+        if with_prompt:
+            left.append(("class:frame.prompt", self.PROMPT_SYMBOL))
 
-        top = VSplit(
+        return HSplit(
             [
-                border_window("╭"),
-                border_window("─", height=1, stretch=True),
-                border_window("╮"),
+                Window(_FrameEdge("╭", "╮"), height=1, style=border_style),
+                Window(
+                    content=control,
+                    height=height,
+                    style=style,
+                    left_margins=[_FrameMargin(left)],
+                    right_margins=[_FrameMargin([(border_style, "│")])],
+                ),
+                Window(_FrameEdge("╰", "╯"), height=1, style=border_style),
             ],
-            height=1,
+            style=style,
         )
 
-        middle_children = [border_window("│")]
+    def _build_key_bindings(self) -> KeyBindings:
+        kb = KeyBindings()
+
+        @kb.add("c-c")
+        def _(event):
+            """Cancel input."""
+            event.app.exit(result="")
+
+        @kb.add("c-d")
+        def _(event):
+            """Exit."""
+            event.app.exit(result="/quit")
+
+        @kb.add("down")
+        def _(event):
+            """Navigate down in completion menu."""
+            if self.current_completions:
+                self.selected_index = (self.selected_index + 1) % len(
+                    self.current_completions
+                )
+                event.app.invalidate()  # Redraw to show highlight
+
+        @kb.add("up")
+        def _(event):
+            """Navigate up in completion menu."""
+            if self.current_completions:
+                self.selected_index = (self.selected_index - 1) % len(
+                    self.current_completions
+                )
+                event.app.invalidate()  # Redraw to show highlight
+
+        @kb.add("tab")
+        def _(event):
+            """Select highlighted completion."""
+            self._select_completion()
+
+        @kb.add("enter")
+        def _(event):
+            """Select completion if menu active, otherwise submit."""
+            if self._select_completion():
+                # Clear completions after selection
+                self.selected_index = 0
+                event.app.invalidate()
+            else:
+                # No completions, submit the input
+                if self.buffer.text.strip():
+                    self.history.append_string(self.buffer.text.strip())
+                event.app.exit(result=self.buffer.text)
+
+        @kb.add("c-r")
+        def _(event):
+            """Toggle reverse search of the command history."""
+            self.history_search = not self.history_search
+            self.selected_index = 0
+            self.scroll_offset = 0
+            self.completions_for = None
+            event.app.invalidate()
 
-        if with_prompt:
-            from prompt_toolkit.layout.containers import Window as PlainWindow
-            from prompt_toolkit.layout.controls import (
-                FormattedTextControl as PlainTextControl,
-            )
+        @kb.add("escape", "enter")
+        def _(event):
+            """New line."""
+            self.buffer.insert_text("\n")
 
-            prompt_window = PlainWindow(
-                content=PlainTextControl(lambda: prompt_symbol),
-                width=len(prompt_symbol),
-                style="class:frame.prompt",
-                dont_extend_width=True,
-                align="left",
-            )
-            middle_children.append(prompt_window)
+        return kb
 
-        middle_children.append(content)
-        middle_children.append(border_window("│"))
 
-        middle = VSplit(
-            middle_children,
-            padding=0,
-        )
+class _FrameEdge(UIControl):
+    """Top or bottom edge of a rounded frame, e.g. ╭────╮, at full width."""
 
-        bottom = VSplit(
-            [
-                border_window("╰"),
-                border_window("─", height=1, stretch=True),
-                border_window("╯"),
-            ],
-            height=1,
-        )
+    def __init__(self, left: str, right: str):
+        self.left = left
+        self.right = right
 
-        return HSplit([top, middle, bottom], style=style)
+    def create_content(self, width: int, height: int) -> UIContent:
+        line = [("", self.left + "─" * max(width - 2, 0) + self.right)]
+        return UIContent(get_line=lambda i: line, line_count=1)
 
-    # Create layout (system info now in static header)
-    root_container = HSplit(
-        [
-            # Input box with frame (fixed 1 line height)
-            build_rounded_frame(
-                LayoutWindow(
-                    content=input_control,
-                    height=1,  # Fixed 1 line height
-                ),
-                style="class:frame",
-                with_prompt=True,
-            ),
-            # Completion menu area (permanent, shows completions when available)
-            build_rounded_frame(
-                LayoutWindow(
-                    content=completion_control,
-                    height=Dimension(
-                        min=6, max=6
-                    ),  # Fixed height for menu (5 items + 1 scroll indicator)
-                    style="class:completion-menu",
-                ),
-                style="class:completion-menu",
-            ),
-            # Toolbar
-            build_rounded_frame(
-                LayoutWindow(
-                    content=toolbar_control,
-                    height=1,
-                    style="class:toolbar",
-                ),
-                style="class:toolbar",
-            ),
-        ]
-    )
 
-    layout = Layout(root_container, focused_element=input_control)
+class _FrameMargin(Margin):
+    """Side of a rounded frame: the same fragments on every row."""
 
-    # Create key bindings
-    kb = KeyBindings()
+    def __init__(self, fragments: list[tuple[str, str]]):
+        self.fragments = fragments
 
-    @kb.add("c-c")
-    def _(event):
-        """Cancel input."""
-        event.app.exit(result="")
+    def get_width(self, get_ui_content) -> int:
+        return sum(len(text) for _, text in self.fragments)
 
-    @kb.add("c-d")
-    def _(event):
-        """Exit."""
-        event.app.exit(result="/quit")
+    def create_margin(self, window_render_info, width: int, height: int):
+        result = []
+        for row in range(height):
+            if row:
+                result.append(("", "\n"))
+            result.extend(self.fragments)
+        return result
 
-    @kb.add("down")
-    def _(event):
-        """Navigate down in completion menu."""
-        if current_completions:
-            selected_index[0] = (selected_index[0] + 1) % len(current_completions)
-            event.app.invalidate()  # Redraw to show highlight
 
-    @kb.add("up")
-    def _(event):
-        """Navigate up in completion menu."""
-        if current_completions:
-            selected_index[0] = (selected_index[0] - 1) % len(current_completions)
-            event.app.invalidate()  # Redraw to show highlight
+def _completion_display(comp: Completion) -> str:
+    """The text shown for a completion in the menu."""
+    if hasattr(comp.display, "__iter__") and not isinstance(comp.display, str):
+        return "".join(text for style, text in comp.display)
+    return str(comp.display) if comp.display else comp.text
 
-    @kb.add("tab")
-    def _(event):
-        """Select highlighted completion."""
-        if current_completions and selected_index[0] < len(current_completions):
-            comp = current_completions[selected_index[0]]
-            # Get the full command text
-            if hasattr(comp.display, "__iter__") and not isinstance(comp.display, str):
-                text = "".join(t for s, t in comp.display)
-            else:
-                text = str(comp.display) if comp.display else comp.text
-            # Replace current input with selected completion
-            input_buffer.text = text
-            input_buffer.cursor_position = len(text)
 
-    @kb.add("enter")
-    def _(event):
-        """Select completion if menu active, otherwise submit."""
-        if current_completions and selected_index[0] < len(current_completions):
-            # Select the highlighted completion
-            comp = current_completions[selected_index[0]]
-            if hasattr(comp.display, "__iter__") and not isinstance(comp.display, str):
-                text = "".join(t for s, t in comp.display)
-            else:
-                text = str(comp.display) if comp.display else comp.text
-            input_buffer.text = text
-            input_buffer.cursor_position = len(text)
-            # Clear completions after selection
-            selected_index[0] = 0
-            event.app.invalidate()
-        else:
-            # No completions, submit the input
-            event.app.exit(result=input_buffer.text)
+# Prompt engine reused across REPL iterations
+_prompt_engine: Optional[PromptEngine] = None
 
-    @kb.add("escape", "enter")
-    def _(event):
-        """New line."""
-        input_buffer.insert_text("\n")
 
-    # Create application (NOT full-screen - we want to preserve command output!)
-    custom_style = build_prompt_style()
+def prompt_user_with_border(completer, history):
+    """Prompt user with bordered input box and permanent completion menu area below.
 
-    app = Application(
-        layout=layout,
-        key_bindings=kb,
-        style=custom_style,
-        full_screen=False,  # NOT full-screen - preserve command output
-        mouse_support=False,  # Disable to allow terminal scrolling
-    )
+    The prompt is built on first use and reused for every later command with
+    the same completer and history (see PromptEngine).
 
-    # Run and return result
-    try:
-        result = app.run()
-        return result.strip() if result else ""
-    except KeyboardInterrupt:
-        return ""
-    except EOFError:
-        return "/quit"
+    Args:
+        completer: The completer instance
+        history: The history instance; submitted commands are appended to it
+
+    Returns:
+        str: The user's input
+    """
+    global _prompt_engine
+
+    if _prompt_engine is None or not _prompt_engine.serves(completer, history):
+        _prompt_engine = PromptEngine(completer, history)
+    return _prompt_engine.prompt()
 
 
 def prompt_user(session, show_toolbar=True):
@@ -0,0 +1,304 @@
+"""Persistent command history for the interactive prompt.
+
+Commands are appended to ~/.fluttercraft/history, one JSON string per line,
+so saving a command never rewrites the file. The file is read on a
+background thread at startup. Once it holds more than twice
+MAX_HISTORY_ENTRIES lines it is compacted there too: repeated commands keep
+only their latest use and the newest MAX_HISTORY_ENTRIES are written back.
+Appends and the compaction's final read-and-replace hold an exclusive lock
+on ~/.fluttercraft/history.lock, shared by every running session, so a
+command saved by another window is merged in rather than lost to the swap.
+
+Lookups never touch the file. Suggestions come from a prefix trie whose
+nodes remember the most recent command below them, in O(len(prefix)), and
+Ctrl-R search scans unique commands newest first until it has enough hits.
+"""
+
+import json
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import AsyncGenerator, Dict, Iterable, List, Optional, Tuple
+
+from prompt_toolkit.auto_suggest import AutoSuggestFromHistory, Suggestion
+from prompt_toolkit.history import History
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+# Unique commands kept when the history file is compacted
+MAX_HISTORY_ENTRIES = int(os.environ.get("FLUTTERCRAFT_HISTORY_SIZE", 10000))
+
+# Matches returned by a reverse search
+SEARCH_LIMIT = 50
+
+
+class _PrefixNode:
+    __slots__ = ("children", "latest")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_PrefixNode"] = {}
+        # Most recent command passing through this node
+        self.latest: Optional[str] = None
+
+
+class PersistentHistory(History):
+    """Append-only history file with in-memory suggestion and search indexes."""
+
+    def __init__(
+        self, config_dir: Optional[Path] = None, max_entries: int = MAX_HISTORY_ENTRIES
+    ):
+        """Initialize the command history.
+
+        Args:
+            config_dir: Directory to store the history file.
+                       Defaults to ~/.fluttercraft/
+            max_entries: Unique commands kept when the file is compacted
+        """
+        super().__init__()
+        if config_dir is None:
+            config_dir = Path.home() / ".fluttercraft"
+
+        self.config_dir = config_dir
+        self.history_file = self.config_dir / "history"
+        self.lock_file = self.config_dir / "history.lock"
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        # Serializes this process's appends with compaction; _file_locked()
+        # adds the lock shared with other sessions
+        self._file_lock = threading.Lock()
+        self._load_thread: Optional[threading.Thread] = None
+        # Unique commands (mapped to their lowercase form for search),
+        # least recently used first
+        self._unique: Dict[str, str] = {}
+        self._root = _PrefixNode()
+        # Commands entered before the file finished loading
+        self._session: List[str] = []
+        self._loaded = False
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+    def start_loading(self) -> "PersistentHistory":
+        """Read (and if needed compact) the history file in the background."""
+        with self._lock:
+            if self._load_thread is None:
+                self._load_thread = threading.Thread(
+                    target=self._load_file, name="fluttercraft-history", daemon=True
+                )
+                self._load_thread.start()
+        return self
+
+    def wait_loaded(self, timeout: Optional[float] = None) -> bool:
+        """Block until the history file has been read; True once loaded."""
+        thread = self._load_thread
+        if thread is not None:
+            thread.join(timeout)
+        return self._loaded
+
+    def _load_file(self) -> None:
+        entries, size = self._read()
+        if len(entries) > 2 * self.max_entries:
+            try:
+                with self._file_locked():
+                    # Commands appended (by any session) since the first read
+                    entries += self._read(offset=size)[0]
+                    entries = list(dict.fromkeys(reversed(entries)))
+                    entries = entries[: self.max_entries]
+                    entries.reverse()
+                    self._write(entries)
+            except OSError:
+                # Silently skip compaction if the history can't be locked
+                pass
+
+        with self._lock:
+            session = self._session
+            self._session = []
+            self._unique.clear()
+            self._root = _PrefixNode()
+            for string in entries + session:
+                self._index(string)
+            self._loaded = True
+
+    @contextmanager
+    def _file_locked(self):
+        """Hold the history lock of this process and of every other session."""
+        with self._file_lock:
+            self.config_dir.mkdir(parents=True, exist_ok=True)
+            with open(self.lock_file, "a+b") as f:
+                if os.name == "nt":
+                    f.seek(0)
+                    # Retries for about 10 seconds before raising OSError
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    try:
+                        yield
+                    finally:
+                        f.seek(0)
+                        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+                else:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+                    try:
+                        yield
+                    finally:
+                        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def _read(self, offset: int = 0) -> Tuple[List[str], int]:
+        """Entries in the file from byte ``offset`` on, and where they end.
+
+        A trailing line without a newline may still be being written, so it
+        is left for the next read.
+        """
+        try:
+            with open(self.history_file, "rb") as f:
+                f.seek(offset)
+                data = f.read()
+        except OSError:
+            return [], offset
+
+        complete = data.rfind(b"\n") + 1
+        entries = []
+        for line in data[:complete].decode("utf-8", errors="replace").splitlines():
+            try:
+                string = json.loads(line)
+            except json.JSONDecodeError:
+                # A torn write from a crashed session; skip it
+                continue
+            if isinstance(string, str) and string:
+                entries.append(string)
+        return entries, offset + complete
+
+    def _write(self, entries: List[str]) -> None:
+        try:
+            self.config_dir.mkdir(parents=True, exist_ok=True)
+            temp_file = self.history_file.with_suffix(".tmp")
+            with open(temp_file, "w", encoding="utf-8") as f:
+                f.writelines(json.dumps(string) + "\n" for string in entries)
+            os.replace(temp_file, self.history_file)
+        except OSError:
+            # Silently fail if we can't compact the history
+            pass
+
+    # ------------------------------------------------------------------
+    # Indexes
+    # ------------------------------------------------------------------
+    def _index(self, string: str) -> None:
+        # Re-inserting moves the command to the most recent position
+        lower = self._unique.pop(string, None) or string.lower()
+        self._unique[string] = lower
+
+        node = self._root
+        node.latest = string
+        for char in string:
+            child = node.children.get(char)
+            if child is None:
+                child = node.children[char] = _PrefixNode()
+            node = child
+            node.latest = string
+
+    def latest_with_prefix(self, prefix: str) -> Optional[str]:
+        """Most recent command starting with ``prefix``."""
+        with self._lock:
+            node = self._root
+            for char in prefix:
+                node = node.children.get(char)
+                if node is None:
+                    return None
+            return node.latest
+
+    def search(self, query: str, limit: int = SEARCH_LIMIT) -> List[str]:
+        """Unique commands containing ``query`` (case-insensitive), newest first."""
+        query = query.lower()
+        with self._lock:
+            recent = list(reversed(self._unique.items()))
+
+        matches = []
+        for string, lower in recent:
+            if query in lower:
+                matches.append(string)
+                if len(matches) >= limit:
+                    break
+        return matches
+
+    # ------------------------------------------------------------------
+    # prompt_toolkit History interface
+    # ------------------------------------------------------------------
+    async def load(self) -> AsyncGenerator[str, None]:
+        # Whatever is loaded so far; never reads the file on the event loop
+        with self._lock:
+            recent = list(reversed(self._unique))
+        for string in recent:
+            yield string
+
+    def get_strings(self) -> List[str]:
+        with self._lock:
+            return list(self._unique)
+
+    def append_string(self, string: str) -> None:
+        if not string.strip():
+            return
+        with self._lock:
+            is_repeat = next(reversed(self._unique), None) == string
+            self._index(string)
+            if not self._loaded:
+                self._session.append(string)
+        if not is_repeat:
+            self.store_string(string)
+
+    def load_history_strings(self) -> Iterable[str]:
+        return reversed(self.get_strings())
+
+    def store_string(self, string: str) -> None:
+        try:
+            with self._file_locked():
+                with open(self.history_file, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(string) + "\n")
+        except OSError:
+            # Silently fail if we can't save the history
+            pass
+
+
+class IndexedAutoSuggest(AutoSuggestFromHistory):
+    """AutoSuggestFromHistory that asks PersistentHistory's prefix index."""
+
+    def get_suggestion(self, buffer, document) -> Optional[Suggestion]:
+        history = buffer.history
+        if not isinstance(history, PersistentHistory):
+            return super().get_suggestion(buffer, document)
+
+        # Consider only the last line, as AutoSuggestFromHistory does
+        text = document.text.rsplit("\n", 1)[-1]
+        if not text.strip():
+            return None
+
+        match = history.latest_with_prefix(text)
+        if match is None:
+            return None
+        return Suggestion(match.split("\n", 1)[0][len(text):])
+
+
+# Global command history instance
+_history: Optional[PersistentHistory] = None
+
+
+def get_command_history() -> PersistentHistory:
+    """Get the global command history instance.
+
+    Returns:
+        Global PersistentHistory instance
+    """
+    global _history
+    if _history is None:
+        _history = PersistentHistory()
+    return _history
+
+
+__all__ = [
+    "IndexedAutoSuggest",
+    "MAX_HISTORY_ENTRIES",
+    "PersistentHistory",
+    "SEARCH_LIMIT",
+    "get_command_history",
+]
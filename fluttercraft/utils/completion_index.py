@@ -0,0 +1,241 @@
+"""Prebuilt index for prompt completions.
+
+Entries (commands, flags, later version names and paths) are stored in a
+case-insensitive prefix trie whose nodes keep the entries below them, so a
+prefix lookup costs O(len(prefix) + results). When the prefix matches
+nothing, a subsequence scorer ranks fuzzy matches ("fvmrel" ->
+"fvm releases"); it only scores entries containing the query's rarest
+character.
+
+Arguments are completed separately by an ArgumentCompleter, whose sources
+return their own (prebuilt) indexes of values such as SDK versions.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# Fuzzy matching needs at least this many characters to be meaningful
+MIN_FUZZY_QUERY = 2
+
+# Characters after which a match counts as the start of a word
+_WORD_SEPARATORS = frozenset(" -_/.:")
+
+
+@dataclass(slots=True)
+class CompletionEntry:
+    """One completion candidate."""
+
+    text: str
+    description: str = ""
+    lower: str = ""
+
+    def __post_init__(self) -> None:
+        self.lower = self.text.lower()
+
+
+class _TrieNode:
+    __slots__ = ("children", "entries")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_TrieNode"] = {}
+        # Entries in this subtree, in insertion order
+        self.entries: List[CompletionEntry] = []
+
+
+class CompletionIndex:
+    """Prefix trie plus fuzzy scorer over completion entries."""
+
+    def __init__(self, entries: Optional[Dict[str, str]] = None) -> None:
+        self._root = _TrieNode()
+        self._by_text: Dict[str, CompletionEntry] = {}
+        # Character -> entries containing it, to narrow fuzzy candidates
+        self._by_char: Dict[str, List[CompletionEntry]] = {}
+        for text, description in (entries or {}).items():
+            self.add(text, description)
+
+    def __len__(self) -> int:
+        return len(self._by_text)
+
+    def __contains__(self, text: str) -> bool:
+        return text.lower() in self._by_text
+
+    def add(self, text: str, description: str = "") -> None:
+        """Add an entry; re-adding a text updates its description."""
+        existing = self._by_text.get(text.lower())
+        if existing is not None:
+            existing.description = description
+            return
+
+        entry = CompletionEntry(text, description)
+        self._by_text[entry.lower] = entry
+
+        node = self._root
+        node.entries.append(entry)
+        for char in entry.lower:
+            node = node.children.setdefault(char, _TrieNode())
+            node.entries.append(entry)
+
+        for char in set(entry.lower):
+            self._by_char.setdefault(char, []).append(entry)
+
+    def extend(self, entries: Iterable[Tuple[str, str]]) -> None:
+        for text, description in entries:
+            self.add(text, description)
+
+    def prefix_matches(self, prefix: str) -> List[CompletionEntry]:
+        """Entries starting with ``prefix`` (case-insensitive)."""
+        node = self._root
+        for char in prefix.lower():
+            node = node.children.get(char)
+            if node is None:
+                return []
+        return node.entries
+
+    def fuzzy_matches(self, query: str) -> List[CompletionEntry]:
+        """Entries containing ``query`` as a subsequence, best first."""
+        query = query.lower()
+        if len(query) < MIN_FUZZY_QUERY:
+            return []
+
+        postings = [self._by_char.get(char) for char in set(query)]
+        if not all(postings):
+            return []
+        candidates = min(postings, key=len)
+
+        scored = []
+        for position, entry in enumerate(candidates):
+            score = fuzzy_score(query, entry.lower)
+            if score is not None:
+                scored.append((-score, position, entry))
+        scored.sort(key=lambda item: (item[0], item[1]))
+        return [entry for _, _, entry in scored]
+
+    def complete(self, text: str) -> List[CompletionEntry]:
+        """Prefix matches in insertion order, or ranked fuzzy matches if none.
+
+        Fuzzy matches for "/..." queries are limited to slash commands, and
+        other queries never fuzzy-match slash commands.
+        """
+        prefix_hits = self.prefix_matches(text)
+        if prefix_hits:
+            return prefix_hits
+
+        slash = text.startswith("/")
+        return [
+            entry
+            for entry in self.fuzzy_matches(text)
+            if entry.text.startswith("/") == slash
+        ]
+
+
+@dataclass(slots=True)
+class ArgumentSpec:
+    """Values completed after a command, or after one of its options."""
+
+    command: Tuple[str, ...]
+    source: Callable[[], CompletionIndex]
+    option: Optional[str] = None
+    # Whether the command takes several values ('fvm install 3.22.0 3.24.0')
+    repeat: bool = False
+
+
+class ArgumentCompleter:
+    """Completes the argument being typed from the index of a matching spec.
+
+    Sources are called on every lookup, so they must return an index that
+    is already built; anything slow belongs in a background refresh.
+    """
+
+    def __init__(self) -> None:
+        self._specs: List[ArgumentSpec] = []
+
+    def register(
+        self,
+        command: str,
+        source: Callable[[], CompletionIndex],
+        option: Optional[str] = None,
+        repeat: bool = False,
+    ) -> None:
+        """Complete values from ``source`` after ``command`` (or its ``option``)."""
+        self._specs.append(
+            ArgumentSpec(tuple(command.lower().split()), source, option, repeat)
+        )
+        # An option's value takes precedence over the command's positionals
+        self._specs.sort(key=lambda spec: spec.option is None)
+
+    def complete(self, text: str) -> Tuple[str, List[CompletionEntry]]:
+        """The word being completed and the entries that complete it.
+
+        The entries are the source index's own list (no copy is made per
+        keystroke), so callers must not modify it; a completion replaces the
+        last ``len(word)`` characters of ``text``.
+        """
+        words = text.split()
+        if not words:
+            return "", []
+
+        if text[-1].isspace():
+            partial, before = "", words
+        else:
+            partial, before = words[-1], words[:-1]
+        lowered = [word.lower() for word in before]
+
+        # '--channel=be' completes the part after '='
+        inline_option = None
+        if partial.startswith("-") and "=" in partial:
+            inline_option, _, partial = partial.partition("=")
+
+        for spec in self._specs:
+            size = len(spec.command)
+            if tuple(lowered[:size]) != spec.command:
+                continue
+            rest = lowered[size:]
+
+            if spec.option is not None:
+                if inline_option is not None:
+                    if inline_option != spec.option:
+                        continue
+                elif not rest or rest[-1] != spec.option:
+                    continue
+            elif inline_option is not None or partial.startswith("-"):
+                continue
+            elif rest and (not spec.repeat or rest[-1].startswith("-")):
+                continue
+
+            return partial, spec.source().prefix_matches(partial)
+
+        return "", []
+
+
+def fuzzy_score(query: str, candidate: str) -> Optional[int]:
+    """Score ``candidate`` for ``query`` (both lowercase); None if no match.
+
+    Each matched character scores a point, with bonuses for runs of
+    consecutive characters and for matches at the start of a word, and a
+    penalty for characters skipped in between.
+    """
+    score = 0
+    position = 0
+    previous = -2
+    for char in query:
+        found = candidate.find(char, position)
+        if found < 0:
+            return None
+        score += 1
+        if found == previous + 1:
+            score += 3
+        if found == 0 or candidate[found - 1] in _WORD_SEPARATORS:
+            score += 2
+        score -= min(found - position, 3) if previous >= 0 else min(found, 3)
+        previous = found
+        position = found + 1
+    return score
+
+
+__all__ = [
+    "ArgumentCompleter",
+    "ArgumentSpec",
+    "CompletionEntry",
+    "CompletionIndex",
+    "fuzzy_score",
+]
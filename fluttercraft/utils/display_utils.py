@@ -2,13 +2,16 @@
 
 from rich.console import Console
 from rich.panel import Panel
-import pyfiglet
 from fluttercraft import __version__
+from fluttercraft.utils.lazy_import import lazy_module
 import os
 import platform
 
 console = Console()
 
+# Loads its font machinery on import; only needed for the welcome art
+pyfiglet = lazy_module("pyfiglet")
+
 # Store command history for redisplay after refreshing header
 command_history = []
 
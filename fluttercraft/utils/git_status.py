@@ -0,0 +1,214 @@
+"""Git branch and dirty state for the prompt toolbar, without blocking it.
+
+The branch is read straight from ``.git/HEAD``. ``git status --porcelain``
+runs on a background thread and its result is cached per repository. A
+cached result is reused until ``.git/HEAD`` or ``.git/index`` changes, or
+until it is STATUS_TTL seconds old (for edits that don't touch the index).
+The toolbar always renders immediately, with the last known state.
+"""
+
+import os
+import subprocess
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Seconds before a clean/dirty result is re-checked even if nothing changed
+# in .git (edits to tracked files don't touch the index)
+STATUS_TTL = float(os.environ.get("FLUTTERCRAFT_GIT_STATUS_TTL", 10))
+
+# Listing untracked files is the slow part of 'git status' in large trees
+INCLUDE_UNTRACKED = os.environ.get("FLUTTERCRAFT_GIT_UNTRACKED", "1") != "0"
+
+# Off the UI thread, a slow repository is allowed much longer than before
+_STATUS_TIMEOUT = 60
+
+
+@dataclass(slots=True)
+class GitStatus:
+    """Cached state of one repository."""
+
+    branch: str
+    dirty: Optional[bool] = None  # None until the first status check finishes
+    signature: Tuple[int, ...] = ()
+    checked_at: float = 0.0
+
+    def describe(self) -> str:
+        return f"{self.branch}{'*' if self.dirty else ''}"
+
+
+class GitStatusProvider:
+    """Refreshes git status in the background, one repository at a time."""
+
+    def __init__(self, include_untracked: bool = INCLUDE_UNTRACKED):
+        self.include_untracked = include_untracked
+        self._cache: Dict[str, GitStatus] = {}
+        self._pending: set = set()
+        self._lock = threading.Lock()
+        self._listeners: List[Callable[[], None]] = []
+
+    def on_change(self, callback: Callable[[], None]) -> None:
+        """Call ``callback`` (on a worker thread) when a status changes."""
+        self._listeners.append(callback)
+
+    def describe(self, cwd: Optional[str] = None) -> Optional[str]:
+        """Return e.g. 'main*' for ``cwd``, or None outside a repository.
+
+        Never blocks on git; a refresh is started if the cached state is
+        missing or out of date.
+        """
+        status = self.status(cwd)
+        return status.describe() if status else None
+
+    def status(self, cwd: Optional[str] = None) -> Optional[GitStatus]:
+        repository = find_git_dir(cwd or os.getcwd())
+        if repository is None:
+            return None
+        git_dir, work_tree = repository
+
+        branch = read_branch(git_dir)
+        if branch is None:
+            return None
+
+        signature = _signature(git_dir)
+        with self._lock:
+            status = self._cache.get(git_dir)
+            if status is None:
+                status = self._cache[git_dir] = GitStatus(branch=branch)
+            status.branch = branch
+
+            stale = (
+                status.signature != signature
+                or time.monotonic() - status.checked_at >= STATUS_TTL
+            )
+            if stale and git_dir not in self._pending:
+                self._pending.add(git_dir)
+                threading.Thread(
+                    target=self._refresh,
+                    args=(git_dir, work_tree, signature),
+                    name="fluttercraft-git-status",
+                    daemon=True,
+                ).start()
+
+            return GitStatus(status.branch, status.dirty, status.signature)
+
+    def invalidate(self, cwd: Optional[str] = None) -> None:
+        """Forget cached results, for one repository or all of them."""
+        with self._lock:
+            if cwd is None:
+                self._cache.clear()
+                return
+            repository = find_git_dir(cwd)
+            if repository:
+                self._cache.pop(repository[0], None)
+
+    def _refresh(self, git_dir: str, work_tree: str, signature: tuple) -> None:
+        command = ["git", "status", "--porcelain"]
+        if not self.include_untracked:
+            command.append("--untracked-files=no")
+
+        try:
+            result = subprocess.run(
+                command,
+                capture_output=True,
+                text=True,
+                cwd=work_tree,
+                stdin=subprocess.DEVNULL,
+                timeout=_STATUS_TIMEOUT,
+            )
+            dirty = bool(result.stdout.strip()) if result.returncode == 0 else None
+        except (subprocess.TimeoutExpired, OSError):
+            dirty = None
+
+        with self._lock:
+            self._pending.discard(git_dir)
+            status = self._cache.get(git_dir)
+            if status is None:
+                return
+            changed = status.dirty != dirty
+            status.dirty = dirty
+            status.signature = signature
+            status.checked_at = time.monotonic()
+
+        if changed:
+            for callback in self._listeners:
+                try:
+                    callback()
+                except Exception:
+                    pass
+
+
+def find_git_dir(path: str) -> Optional[Tuple[str, str]]:
+    """Return ``(git_dir, work_tree)`` for the repository containing ``path``.
+
+    ``work_tree`` is the directory holding ``.git``; for worktrees and
+    submodules it is not the parent of ``git_dir``.
+    """
+    path = os.path.abspath(path)
+    while True:
+        candidate = os.path.join(path, ".git")
+        if os.path.isdir(candidate):
+            return candidate, path
+        if os.path.isfile(candidate):
+            # Worktrees and submodules: ".git" is a file naming the real dir
+            try:
+                with open(candidate, "r", encoding="utf-8") as f:
+                    content = f.read().strip()
+            except OSError:
+                return None
+            if content.startswith("gitdir:"):
+                git_dir = content[len("gitdir:"):].strip()
+                return os.path.normpath(os.path.join(path, git_dir)), path
+            return None
+        parent = os.path.dirname(path)
+        if parent == path:
+            return None
+        path = parent
+
+
+def read_branch(git_dir: str) -> Optional[str]:
+    """Branch name from HEAD, or the short commit hash when detached."""
+    try:
+        with open(os.path.join(git_dir, "HEAD"), "r", encoding="utf-8") as f:
+            head = f.read().strip()
+    except OSError:
+        return None
+    if head.startswith("ref:"):
+        return head[len("ref:"):].strip().removeprefix("refs/heads/")
+    return head[:7] or None
+
+
+def _signature(git_dir: str) -> Tuple[int, ...]:
+    stamps = []
+    for name in ("HEAD", "index"):
+        try:
+            stamps.append(os.stat(os.path.join(git_dir, name)).st_mtime_ns)
+        except OSError:
+            stamps.append(0)
+    return tuple(stamps)
+
+
+# Global provider instance
+_provider: Optional[GitStatusProvider] = None
+
+
+def get_git_status_provider() -> GitStatusProvider:
+    """Get the global git status provider instance.
+
+    Returns:
+        Global GitStatusProvider instance
+    """
+    global _provider
+    if _provider is None:
+        _provider = GitStatusProvider()
+    return _provider
+
+
+__all__ = [
+    "GitStatus",
+    "GitStatusProvider",
+    "find_git_dir",
+    "get_git_status_provider",
+    "read_branch",
+]
@@ -0,0 +1,76 @@
+"""Deferred imports for optional renderers and package exports.
+
+``lazy_module("pyfiglet")`` returns a module object whose code runs on first
+attribute access, so modules that only use pyfiglet, rich.live, rich.layout
+or rich.syntax (pygments) on some code paths don't pay for them at import.
+``lazy_exports`` does the same for the names a package re-exports.
+"""
+
+import importlib
+import importlib.util
+import sys
+import threading
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Tuple
+
+_lock = threading.Lock()
+
+
+def lazy_module(name: str) -> ModuleType:
+    """Return module ``name``, deferring its execution until first use.
+
+    Modules that are already imported are returned as is.
+
+    Raises:
+        ModuleNotFoundError: If the module can't be found; this is checked
+            up front, only executing the module is deferred
+    """
+    with _lock:
+        module = sys.modules.get(name)
+        if module is not None:
+            return module
+
+        spec = importlib.util.find_spec(name)
+        if spec is None:
+            raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+
+        loader = importlib.util.LazyLoader(spec.loader)
+        spec.loader = loader
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        loader.exec_module(module)
+
+        # Bind it on the parent package, as a regular import would
+        parent, _, child = name.rpartition(".")
+        if parent:
+            setattr(sys.modules[parent], child, module)
+        return module
+
+
+def lazy_exports(
+    package: str, exports: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]], List[str]]:
+    """Build ``(__getattr__, __dir__, __all__)`` for a package's ``__init__``.
+
+    ``exports`` maps each public name to the module defining it. A name is
+    imported on first access and then cached on the package, so importing
+    one submodule doesn't load its siblings::
+
+        __getattr__, __dir__, __all__ = lazy_exports(__name__, {...})
+    """
+
+    def __getattr__(name: str) -> Any:
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted([*vars(sys.modules[package]), *exports])
+
+    return __getattr__, __dir__, list(exports)
+
+
+__all__ = ["lazy_exports", "lazy_module"]
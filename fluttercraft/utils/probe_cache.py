@@ -0,0 +1,163 @@
+"""Persistent cache for toolchain probe results.
+
+Stores the outcome of ``flutter upgrade --verify-only`` and ``fvm --version``
+under ~/.fluttercraft so warm starts don't need to spawn any subprocesses.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# Default time-to-live for cached probe results, in seconds (6 hours)
+DEFAULT_PROBE_TTL = 6 * 60 * 60
+
+# Environment variable that overrides the TTL; 0 disables the cache
+PROBE_TTL_ENV = "FLUTTERCRAFT_PROBE_TTL"
+
+
+class ProbeCache:
+    """Caches probe results keyed on the tool's binary and the PATH."""
+
+    def __init__(
+        self, config_dir: Optional[Path] = None, ttl: Optional[float] = None
+    ):
+        """Initialize the probe cache.
+
+        Args:
+            config_dir: Directory to store the cache file.
+                       Defaults to ~/.fluttercraft/
+            ttl: Seconds a cached result stays valid. Defaults to the
+                 FLUTTERCRAFT_PROBE_TTL environment variable, or 6 hours.
+        """
+        if config_dir is None:
+            config_dir = Path.home() / ".fluttercraft"
+
+        self.config_dir = config_dir
+        self.cache_file = self.config_dir / "probe_cache.json"
+        self.ttl = self._resolve_ttl(ttl)
+        self._lock = threading.Lock()
+
+        # Ensure config directory exists
+        self.config_dir.mkdir(parents=True, exist_ok=True)
+
+    def get(self, tool: str, path_env: Optional[str] = None) -> Optional[dict]:
+        """Return the cached result for ``tool`` if it is still valid.
+
+        Args:
+            tool: Executable name, e.g. "flutter" or "fvm"
+            path_env: PATH used to resolve the executable. Defaults to the
+                      current PATH, as reported by get_platform_info().
+
+        Returns:
+            The cached result dictionary, or None on a miss
+        """
+        if self.ttl <= 0:
+            return None
+
+        with self._lock:
+            entry = self._read().get(tool)
+
+        if not entry:
+            return None
+        if time.time() - entry.get("checked_at", 0) > self.ttl:
+            return None
+        if entry.get("key") != self._fingerprint(tool, path_env):
+            return None
+
+        return entry.get("result")
+
+    def set(self, tool: str, result: dict, path_env: Optional[str] = None) -> None:
+        """Store a fresh probe result for ``tool``."""
+        entry = {
+            "key": self._fingerprint(tool, path_env),
+            "checked_at": time.time(),
+            "result": result,
+        }
+        with self._lock:
+            entries = self._read()
+            entries[tool] = entry
+            self._write(entries)
+
+    def invalidate(self, tool: Optional[str] = None) -> None:
+        """Drop the cached result for ``tool``, or for every tool if None."""
+        with self._lock:
+            entries = self._read()
+            if tool is None:
+                entries.clear()
+            else:
+                entries.pop(tool, None)
+            self._write(entries)
+
+    @staticmethod
+    def _fingerprint(tool: str, path_env: Optional[str]) -> Dict[str, Any]:
+        if path_env is None:
+            path_env = os.environ.get("PATH", "")
+
+        binary = shutil.which(tool, path=path_env)
+        mtime = None
+        if binary:
+            binary = os.path.realpath(binary)
+            try:
+                mtime = os.stat(binary).st_mtime
+            except OSError:
+                mtime = None
+
+        return {
+            "binary": binary,
+            "mtime": mtime,
+            "path": hashlib.sha1(path_env.encode("utf-8")).hexdigest(),
+        }
+
+    @staticmethod
+    def _resolve_ttl(ttl: Optional[float]) -> float:
+        if ttl is not None:
+            return ttl
+        try:
+            return float(os.environ.get(PROBE_TTL_ENV, DEFAULT_PROBE_TTL))
+        except ValueError:
+            return DEFAULT_PROBE_TTL
+
+    def _read(self) -> Dict[str, Any]:
+        if not self.cache_file.exists():
+            return {}
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+                return data if isinstance(data, dict) else {}
+        except (json.JSONDecodeError, OSError):
+            return {}
+
+    def _write(self, entries: Dict[str, Any]) -> None:
+        try:
+            temp_file = self.cache_file.with_suffix(".tmp")
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(entries, f, indent=2)
+            os.replace(temp_file, self.cache_file)
+        except OSError:
+            # Silently fail if we can't save the cache
+            pass
+
+
+# Global probe cache instance
+_probe_cache: Optional[ProbeCache] = None
+_probe_cache_lock = threading.Lock()
+
+
+def get_probe_cache() -> ProbeCache:
+    """Get the global probe cache instance.
+
+    Returns:
+        Global ProbeCache instance
+    """
+    global _probe_cache
+    if _probe_cache is None:
+        # Startup probes ask for it from several threads at once
+        with _probe_cache_lock:
+            if _probe_cache is None:
+                _probe_cache = ProbeCache()
+    return _probe_cache
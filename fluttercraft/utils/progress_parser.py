@@ -0,0 +1,289 @@
+"""Recognize progress reports in FVM, git and Flutter tool output.
+
+Turns lines such as git's ``Receiving objects:  45% (1234/2742), 12.34 MiB |
+5.67 MiB/s``, curl's transfer meter from the Dart SDK download and FVM's
+install stages into ProgressEvents, and renders them as ``rich.progress``
+bars with throughput and ETA.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from rich.progress import (
+    BarColumn,
+    DownloadColumn,
+    Progress,
+    ProgressColumn,
+    TaskID,
+    TaskProgressColumn,
+    TextColumn,
+    TimeRemainingColumn,
+    TransferSpeedColumn,
+)
+from rich.text import Text
+
+# git clone/fetch: "Receiving objects:  45% (1234/2742), 12.34 MiB | 5.67 MiB/s"
+_GIT_PROGRESS = re.compile(
+    r"^(?:remote:\s*)?(?P<task>[A-Z][A-Za-z ]+?):\s+(?P<percent>\d+)%\s+"
+    r"\((?P<done>\d+)/(?P<total>\d+)\)"
+    r"(?:,\s*(?P<size>[\d.]+\s*[KMGT]?i?B))?"
+    r"(?:\s*\|\s*(?P<rate>[\d.]+\s*[KMGT]?i?B/s))?"
+)
+
+# curl's default meter: "% Total  % Received % Xferd  Average Speed ..." rows
+_CURL_METER = re.compile(
+    r"^\s*(?P<percent>\d+)\s+(?P<total>[\d.]+[kMGT]?)\s+\d+\s+"
+    r"(?P<received>[\d.]+[kMGT]?)\s+\d+\s+[\d.]+[kMGT]?\s+"
+    r"(?P<speed>[\d.]+[kMGT]?)\s"
+)
+
+# Header rows curl prints above its meter
+_CURL_HEADER = re.compile(r"^\s*(?:% Total\s+% Received|Dload\s+Upload)")
+
+# curl --progress-bar: "######################                   45.6%"
+_CURL_BAR = re.compile(r"^#+\s*(?P<percent>\d+(?:\.\d+)?)%$")
+
+# Labels FVM, git and the Flutter tool put in front of a bare percentage.
+# Other "Label: NN%" lines (e.g. "Test coverage: 85%") are ordinary output.
+_PERCENT_LABELS = (
+    "Downloading",
+    "Extracting",
+    "Unpacking",
+    "Installing",
+    "Receiving objects",
+    "Resolving deltas",
+    "Counting objects",
+    "Compressing objects",
+    "Checking out files",
+    "Updating files",
+)
+
+# "Downloading: 45%" / "Extracting Dart SDK... 45.6%" reports
+_PERCENT_LINE = re.compile(
+    r"^(?P<task>(?:" + "|".join(_PERCENT_LABELS) + r")(?: [\w .'-]{1,40}?)?)"
+    r"[:.]*\s+(?P<percent>\d+(?:\.\d+)?)%$"
+)
+
+# Install stages printed by FVM and the Flutter tool, in the order they occur
+_STAGES = (
+    (
+        re.compile(r"^(?:Cloning|Installing (?:version|Flutter SDK))", re.I),
+        "Cloning Flutter SDK",
+    ),
+    (re.compile(r"Downloading Dart SDK", re.I), "Downloading Dart SDK"),
+    (re.compile(r"Building flutter tool", re.I), "Building Flutter tool"),
+    (re.compile(r"Setting up Flutter SDK", re.I), "Setting up Flutter SDK"),
+)
+
+_SIZE_UNITS = {"": 1, "k": 1024, "m": 1024**2, "g": 1024**3, "t": 1024**4}
+
+
+@dataclass(slots=True)
+class ProgressEvent:
+    """A progress report parsed from one line of output.
+
+    ``total`` is None for install stages, whose length is unknown.
+    """
+
+    task: str
+    completed: float = 0
+    total: Optional[float] = None
+    unit: str = "items"  # items, bytes, percent or stage
+    rate: Optional[str] = None
+    detail: Optional[str] = None
+
+    @property
+    def is_stage(self) -> bool:
+        return self.total is None
+
+    @property
+    def percent(self) -> Optional[float]:
+        if not self.total:
+            return None
+        return 100.0 * self.completed / self.total
+
+    def describe(self) -> str:
+        """One-line summary, e.g. 'Receiving objects 45% · 5.67 MiB/s'."""
+        parts = [self.task]
+        if self.percent is not None:
+            parts[0] += f" {self.percent:.0f}%"
+        if self.detail:
+            parts.append(self.detail)
+        if self.rate:
+            parts.append(self.rate)
+        return " · ".join(parts)
+
+
+class ProgressParser:
+    """Stateful parser; remembers the current stage to label bare bars."""
+
+    def __init__(self) -> None:
+        self.stage: Optional[str] = None
+
+    @staticmethod
+    def is_meter_header(line: str) -> bool:
+        """Whether ``line`` is one of the column headers of curl's meter."""
+        return bool(_CURL_HEADER.match(line))
+
+    def parse(self, line: str) -> Optional[ProgressEvent]:
+        """Return a ProgressEvent if ``line`` reports progress, else None."""
+        line = line.strip()
+        if not line:
+            return None
+
+        match = _GIT_PROGRESS.match(line)
+        if match:
+            return ProgressEvent(
+                task=match["task"].strip(),
+                completed=int(match["done"]),
+                total=int(match["total"]) or None,
+                unit="items",
+                rate=_normalize_rate(match["rate"]),
+                detail=match["size"],
+            )
+
+        match = _CURL_METER.match(line)
+        if match:
+            total = parse_size(match["total"])
+            return ProgressEvent(
+                task=self.stage or "Downloading",
+                completed=parse_size(match["received"]),
+                total=total or None,
+                unit="bytes",
+            )
+
+        match = _CURL_BAR.match(line)
+        if match:
+            return ProgressEvent(
+                task=self.stage or "Downloading",
+                completed=float(match["percent"]),
+                total=100,
+                unit="percent",
+            )
+
+        match = _PERCENT_LINE.match(line)
+        if match:
+            return ProgressEvent(
+                task=match["task"].strip(),
+                completed=float(match["percent"]),
+                total=100,
+                unit="percent",
+            )
+
+        for pattern, stage in _STAGES:
+            if pattern.search(line):
+                self.stage = stage
+                return ProgressEvent(task=stage, unit="stage")
+
+        return None
+
+
+class ProgressTracker:
+    """Keeps one rich progress bar per task seen in a command's output.
+
+    The Progress instance is never started; its renderable is embedded in
+    the caller's own Live display.
+    """
+
+    def __init__(self) -> None:
+        self.progress = Progress(
+            TextColumn("[cyan]{task.description}"),
+            BarColumn(bar_width=None),
+            TaskProgressColumn(),
+            _AmountColumn(),
+            TimeRemainingColumn(),
+            expand=True,
+        )
+        self._tasks: Dict[str, TaskID] = {}
+        self._stage: Optional[str] = None
+        self._step: Optional[str] = None
+
+    @property
+    def has_tasks(self) -> bool:
+        return bool(self._tasks)
+
+    def update(self, event: ProgressEvent) -> None:
+        """Create or advance the bar for ``event.task``."""
+        # A new stage or step starting means the previous one has finished;
+        # steps such as git's "Receiving objects" run inside a stage
+        if event.is_stage and event.task != self._stage:
+            self._complete(self._stage)
+            self._complete(self._step)
+            self._stage, self._step = event.task, None
+        elif not event.is_stage and event.task != self._step:
+            self._complete(self._step)
+            self._step = event.task
+
+        task_id = self._tasks.get(event.task)
+        if task_id is None:
+            task_id = self.progress.add_task(
+                event.task, total=event.total, unit=event.unit, rate=event.rate
+            )
+            self._tasks[event.task] = task_id
+
+        self.progress.update(
+            task_id,
+            completed=event.completed,
+            total=event.total,
+            unit=event.unit,
+            rate=event.rate,
+        )
+
+    def finish(self) -> None:
+        """Mark every task as complete."""
+        for name in self._tasks:
+            self._complete(name)
+
+    def renderable(self):
+        return self.progress.get_renderable()
+
+    def _complete(self, name: Optional[str]) -> None:
+        task_id = self._tasks.get(name) if name else None
+        if task_id is None:
+            return
+        task = next(t for t in self.progress.tasks if t.id == task_id)
+        total = task.total if task.total is not None else 1
+        self.progress.update(task_id, total=total, completed=total)
+
+
+class _AmountColumn(ProgressColumn):
+    """Shows bytes and speed for downloads, counts and git's rate otherwise."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._download = DownloadColumn()
+        self._speed = TransferSpeedColumn()
+
+    def render(self, task) -> Text:
+        unit = task.fields.get("unit")
+        if unit == "bytes":
+            return Text.assemble(
+                self._download.render(task), " ", self._speed.render(task)
+            )
+        if unit == "items" and task.total:
+            text = Text(f"{int(task.completed)}/{int(task.total)}", style="green")
+            if task.fields.get("rate"):
+                text.append(f" {task.fields['rate']}", style="progress.data.speed")
+            return text
+        return Text("")
+
+
+def parse_size(value: str) -> float:
+    """Convert sizes such as '90.1M', '12.34 MiB' or '512k' to bytes."""
+    match = re.match(r"^\s*([\d.]+)\s*([kKmMgGtT]?)", value or "")
+    if not match:
+        return 0.0
+    return float(match.group(1)) * _SIZE_UNITS[match.group(2).lower()]
+
+
+def _normalize_rate(rate: Optional[str]) -> Optional[str]:
+    return re.sub(r"\s+", " ", rate) if rate else None
+
+
+__all__ = [
+    "ProgressEvent",
+    "ProgressParser",
+    "ProgressTracker",
+    "parse_size",
+]
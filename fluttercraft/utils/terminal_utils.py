@@ -3,23 +3,311 @@
 from rich.console import Console
 from rich.live import Live
 from rich.panel import Panel
+from rich.console import Group
+from rich.text import Text
+import asyncio
+import codecs
+import contextvars
+import os
+import re
+import shlex
 import subprocess
-import threading
 import time
 import shutil
-from queue import Queue, Empty
+import tempfile
+from collections import deque
+
+from fluttercraft.utils.progress_parser import ProgressParser, ProgressTracker
 
 console = Console()
 
+# Number of output lines kept visible in the live panel
+VISIBLE_OUTPUT_LINES = 15
+
+# Seconds between spinner frames
+SPINNER_INTERVAL = 0.1
+
+# Minimum seconds between redraws, so bursts of output are coalesced
+MIN_REDRAW_INTERVAL = 1 / 30
+
+LOADING_FRAMES = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
+
+# Bytes of captured output kept in memory before spilling to a temp file
+DEFAULT_SPOOL_SIZE = 1024 * 1024
+
+# Set while a command runs as a background job; called with each child
+# process spawned so the job can kill it
+process_observer = contextvars.ContextVar("process_observer", default=None)
+
+
+class SpooledOutput:
+    """Append-only line store that spills to a temporary file past a size limit.
+
+    Lets long-running commands capture arbitrarily large output while keeping
+    at most ``max_memory`` bytes resident in the CLI process.
+    """
+
+    def __init__(self, max_memory=DEFAULT_SPOOL_SIZE):
+        self._file = tempfile.SpooledTemporaryFile(
+            max_size=max_memory, mode="w+", encoding="utf-8", newline="\n"
+        )
+        self._line_count = 0
+
+    def append(self, line):
+        """Append a single line (without its trailing newline)."""
+        self._file.write(line)
+        self._file.write("\n")
+        self._line_count += 1
+
+    def __len__(self):
+        return self._line_count
+
+    def __iter__(self):
+        """Iterate over the stored lines without loading them all at once."""
+        self._file.seek(0)
+        try:
+            for line in self._file:
+                yield line[:-1] if line.endswith("\n") else line
+        finally:
+            self._file.seek(0, os.SEEK_END)
+
+    def open(self):
+        """Return a file-like handle positioned at the start of the output."""
+        self._file.seek(0)
+        return self._file
+
+    def getvalue(self):
+        """Return all lines joined into one string."""
+        return "\n".join(self)
+
+    @property
+    def spilled(self):
+        """Whether the output has been moved from memory to a temp file."""
+        return bool(getattr(self._file, "_rolled", False))
+
+    def close(self):
+        self._file.close()
+
+
+class CompletedProcessLike:
+    """Result of run_with_loading with spooled stdout and stderr.
+
+    ``stdout``/``stderr`` join the captured lines on demand for callers that
+    need a string; large outputs should be consumed through ``iter_stdout()``,
+    ``iter_stderr()`` or the file-like ``stdout_stream``/``stderr_stream``.
+    """
+
+    def __init__(self, returncode, stdout, stderr):
+        self.returncode = returncode
+        self._stdout = stdout
+        self._stderr = stderr
+
+    @property
+    def stdout(self):
+        return self._stdout.getvalue()
+
+    @property
+    def stderr(self):
+        return self._stderr.getvalue()
+
+    @property
+    def stdout_stream(self):
+        return self._stdout.open()
+
+    @property
+    def stderr_stream(self):
+        return self._stderr.open()
+
+    def iter_stdout(self):
+        return iter(self._stdout)
+
+    def iter_stderr(self):
+        return iter(self._stderr)
+
+
+_LINE_BREAK = re.compile(r"\r\n|\r|\n")
+
+
+class _LineDecoder:
+    """Incrementally decode raw pipe chunks into complete text lines.
+
+    A bare carriage return also ends a line, so progress reports that git
+    and curl redraw in place arrive one update at a time.
+    """
+
+    def __init__(self):
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._pending = ""
+        self._after_cr = False
+
+    def feed(self, chunk):
+        """Decode ``chunk`` and return the lines it completes."""
+        text = self._decoder.decode(chunk)
+        if not text:
+            return []
+        if self._after_cr and text.startswith("\n"):
+            # Second half of a \r\n pair split across chunks
+            text = text[1:]
+        self._after_cr = text.endswith("\r")
+
+        self._pending += text
+        if "\n" not in self._pending and "\r" not in self._pending:
+            return []
+        *lines, self._pending = _LINE_BREAK.split(self._pending)
+        return [line.rstrip() for line in lines]
+
+    def flush(self):
+        """Return whatever partial line remains once the stream has ended."""
+        tail = (self._pending + self._decoder.decode(b"", final=True)).rstrip()
+        self._pending = ""
+        return [tail] if tail else []
+
+
+def _shell_command(cmd):
+    """Join an argument list into one command line for the shell."""
+    if isinstance(cmd, str):
+        return cmd
+    if os.name == "nt":
+        return subprocess.list2cmdline(cmd)
+    return shlex.join(cmd)
+
+
+async def _spawn(cmd, shell):
+    """Start ``cmd`` with piped stdout/stderr on the running event loop."""
+    observer = process_observer.get()
+    # Background jobs get their own session, so Ctrl+C at the prompt doesn't
+    # reach them and killing the job can take down the whole process group
+    detached = observer is not None and os.name == "posix"
+    # A job has no terminal to read from
+    stdin = asyncio.subprocess.DEVNULL if observer is not None else None
+
+    if shell:
+        process = await asyncio.create_subprocess_shell(
+            _shell_command(cmd),
+            stdin=stdin,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            start_new_session=detached,
+        )
+    else:
+        args = [cmd] if isinstance(cmd, str) else list(cmd)
+        process = await asyncio.create_subprocess_exec(
+            *args,
+            stdin=stdin,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            start_new_session=detached,
+        )
+
+    if observer is not None:
+        observer(process)
+    return process
+
+
+def live_console():
+    """Console for a Live display started by the calling command.
+
+    rich allows one Live per console, so background jobs get their own
+    console, which writes to the job's output through sys.stdout.
+    """
+    return console if process_observer.get() is None else Console()
 
-def _read_stream_output(stream, queue):
-    """Read output from stream and put it in queue."""
-    for line in iter(stream.readline, b""):
-        queue.put(line.decode("utf-8", errors="replace").rstrip())
-    stream.close()
 
+async def _communicate(process, on_line):
+    """Feed every output line to ``on_line(stream_name, line)``.
+
+    Both pipes are read concurrently on the event loop, so no reader threads
+    are needed. Returns the exit code once both pipes are closed.
+    """
 
-def run_with_loading(
+    async def pump(name, stream):
+        decoder = _LineDecoder()
+        while True:
+            chunk = await stream.read(65536)
+            if not chunk:
+                break
+            for line in decoder.feed(chunk):
+                on_line(name, line)
+        for line in decoder.flush():
+            on_line(name, line)
+
+    try:
+        await asyncio.gather(
+            pump("stdout", process.stdout), pump("stderr", process.stderr)
+        )
+        return await process.wait()
+    except asyncio.CancelledError:
+        # Don't leave the child running when the caller gives up on it
+        if process.returncode is None:
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
+        raise
+
+
+def _render_loading_panel(
+    frame, status_message, output_lines, panel_width, progress=None
+):
+    """Build the live panel shown while a command runs."""
+    if output_lines:
+        # Show output with loading indicator at top
+        content = f"[cyan]{frame}[/cyan] {status_message}\n\n" + "\n".join(
+            output_lines
+        )
+    else:
+        # Show just loading indicator
+        content = f"[cyan]{frame}[/cyan] {status_message}"
+
+    if progress is not None and progress.has_tasks:
+        header, _, lines = content.partition("\n\n")
+        content = Group(
+            Text.from_markup(header),
+            Text(""),
+            progress.renderable(),
+            *([Text(""), Text.from_markup(lines)] if lines else []),
+        )
+
+    return Panel(content, title="Command Output", width=panel_width)
+
+
+def _track_progress(parser, tracker, line):
+    """Feed ``line`` to the progress bars; True if it was a progress report.
+
+    Stage announcements still return False so they stay in the output.
+    """
+    if parser.is_meter_header(line):
+        return True
+    event = parser.parse(line)
+    if event is None:
+        return False
+    tracker.update(event)
+    return not event.is_stage
+
+
+def run_with_loading(*args, **kwargs):
+    """Run a command with a loading indicator and real-time output.
+
+    Synchronous wrapper around run_with_loading_async() for callers that are
+    not running an event loop; it accepts the same arguments.
+
+    Returns:
+        CompletedProcessLike instance with stdout and stderr
+
+    Raises:
+        RuntimeError: If called from a running event loop
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(run_with_loading_async(*args, **kwargs))
+    raise RuntimeError(
+        "run_with_loading() can't be called from a running event loop; "
+        "await run_with_loading_async() instead"
+    )
+
+
+async def run_with_loading_async(
     cmd,
     status_message=None,
     shell=True,
@@ -27,9 +315,15 @@ def run_with_loading(
     clear_on_success=True,
     show_output_on_failure=False,  # Don't show output panel on failure by default
     show_status_message=False,  # Don't show status messages by default
+    spool_size=DEFAULT_SPOOL_SIZE,
 ):
     """Run a command with a loading indicator and real-time output.
 
+    The display is redrawn only when new output arrives or the spinner advances,
+    and the call returns as soon as the process closes its output streams.
+    Captured output is held in memory up to ``spool_size`` bytes per stream and
+    spills to a temporary file beyond that.
+
     Args:
         cmd: Command to run (list or string)
         status_message: Custom status message (defaults to "Running command...")
@@ -38,9 +332,10 @@ def run_with_loading(
         clear_on_success: Whether to clear the command output on success
         show_output_on_failure: Whether to keep the output panel visible on failure
         show_status_message: Whether to show status messages after command completes
+        spool_size: Bytes of output per stream kept in memory before spilling
 
     Returns:
-        CompletedProcess instance with stdout and stderr
+        CompletedProcessLike instance with stdout and stderr
     """
     if isinstance(cmd, list):
         cmd_str = " ".join(cmd)
@@ -53,151 +348,102 @@ def run_with_loading(
     if not status_message:
         status_message = f"[bold yellow]Running {cmd_str}, please wait...[/]"
 
-    # Create queues for output
-    stdout_queue = Queue()
-    stderr_queue = Queue()
-
-    # Combined output to preserve
-    all_output = []
+    # Get terminal width for the panel
+    terminal_width = shutil.get_terminal_size().columns
+    panel_width = min(terminal_width - 4, 100)  # Keep some margin
 
-    # Start the process
-    process = subprocess.Popen(
-        cmd,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        shell=shell,
-        text=False,  # We'll handle encoding manually
-    )
+    # Only the most recent lines are displayed
+    output_lines = deque(maxlen=VISIBLE_OUTPUT_LINES)
 
-    # Start threads to read stdout and stderr
-    stdout_thread = threading.Thread(
-        target=_read_stream_output, args=(process.stdout, stdout_queue)
-    )
-    stderr_thread = threading.Thread(
-        target=_read_stream_output, args=(process.stderr, stderr_queue)
-    )
+    # Collect stdout and stderr as they arrive
+    stdout_content = SpooledOutput(spool_size)
+    stderr_content = SpooledOutput(spool_size)
 
-    stdout_thread.daemon = True
-    stderr_thread.daemon = True
-    stdout_thread.start()
-    stderr_thread.start()
+    # Progress reports become bars instead of scrolling output lines
+    progress_parser = ProgressParser()
+    progress = ProgressTracker()
 
-    # Get terminal width for the panel
-    terminal_width = shutil.get_terminal_size().columns
-    panel_width = min(terminal_width - 4, 100)  # Keep some margin
+    # Output state shared with the line callback
+    state = {"has_output": False, "has_errors": False}
+    output_arrived = asyncio.Event()
 
-    # Start a Live display
-    output_lines = []
+    def on_line(name, line):
+        state["has_output"] = True
+        output_arrived.set()
+        if name == "stdout":
+            stdout_content.append(line)
+            if not _track_progress(progress_parser, progress, line):
+                output_lines.append(f"[dim]{line}[/dim]")
+        else:
+            # git and curl report progress on stderr
+            stderr_content.append(line)
+            if not _track_progress(progress_parser, progress, line):
+                state["has_errors"] = True
+                output_lines.append(f"[red]{line}[/red]")
 
-    # Track if we've collected any output at all
-    has_output = False
+    process = await _spawn(cmd, shell)
+    communicate = asyncio.ensure_future(_communicate(process, on_line))
 
-    # Loading animation frames
-    loading_frames = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
-    frame_index = [0]  # Use list to make it mutable
+    frame_index = 0
 
-    # Use Live display with transient=True to allow removing the panel completely
-    # We'll manually manage when to show/hide it
+    # The panel is redrawn explicitly, never on a timer
     live = Live(
-        Panel(
-            f"{loading_frames[0]} {status_message}\n",
-            title="Command Output",
-            width=panel_width,
-        ),
-        console=console,
-        refresh_per_second=10,
+        _render_loading_panel(LOADING_FRAMES[0], status_message, (), panel_width),
+        console=live_console(),
+        auto_refresh=False,
         transient=True,  # This allows the panel to be removed completely when stopped
     )
-    live.start()
+    live.start(refresh=True)
 
     try:
-        # Keep track of whether we've seen any error output
-        has_errors = False
-
-        # Collect stdout and stderr as they arrive
-        stdout_content = []
-        stderr_content = []
-
-        # Process still running
-        while process.poll() is None:
-            # Update loading animation frame
-            frame_index[0] = (frame_index[0] + 1) % len(loading_frames)
-            current_frame = loading_frames[frame_index[0]]
-
-            # Check for output from stdout
-            try:
-                while not stdout_queue.empty():
-                    line = stdout_queue.get_nowait()
-                    has_output = True
-                    stdout_content.append(line)
-                    output_lines.append(f"[dim]{line}[/dim]")
-                    all_output.append(line)
-                    # Keep only the last 15 lines in the display to avoid overwhelming the terminal
-                    if len(output_lines) > 15:
-                        output_lines.pop(0)
-            except Empty:
-                pass
-
-            # Check for output from stderr
-            try:
-                while not stderr_queue.empty():
-                    line = stderr_queue.get_nowait()
-                    has_output = True
-                    stderr_content.append(line)
-                    output_lines.append(f"[red]{line}[/red]")
-                    all_output.append(line)
-                    has_errors = True
-                    # Keep only the last 15 lines in the display
-                    if len(output_lines) > 15:
-                        output_lines.pop(0)
-            except Empty:
-                pass
-
-            # Update the panel with loading indicator
-            if output_lines:
-                # Show output with loading indicator at top
-                content = (
-                    f"[cyan]{current_frame}[/cyan] {status_message}\n\n"
-                    + "\n".join(output_lines)
-                )
-            else:
-                # Show just loading indicator
-                content = f"[cyan]{current_frame}[/cyan] {status_message}"
-
-            live.update(
-                Panel(
-                    content,
-                    title="Command Output",
-                    width=panel_width,
-                )
+        next_frame_at = time.monotonic() + SPINNER_INTERVAL
+        last_redraw_at = 0.0
+        needs_redraw = False
+
+        while not communicate.done():
+            # Sleep until output arrives or the next redraw is due
+            deadline = next_frame_at
+            if needs_redraw:
+                deadline = min(deadline, last_redraw_at + MIN_REDRAW_INTERVAL)
+
+            waiter = asyncio.ensure_future(output_arrived.wait())
+            await asyncio.wait(
+                {communicate, waiter},
+                timeout=max(0, deadline - time.monotonic()),
+                return_when=asyncio.FIRST_COMPLETED,
             )
+            waiter.cancel()
+
+            if output_arrived.is_set():
+                output_arrived.clear()
+                needs_redraw = True
+
+            now = time.monotonic()
+            if now >= next_frame_at:
+                frame_index = (frame_index + 1) % len(LOADING_FRAMES)
+                next_frame_at = now + SPINNER_INTERVAL
+                needs_redraw = True
+
+            if needs_redraw and now - last_redraw_at >= MIN_REDRAW_INTERVAL:
+                live.update(
+                    _render_loading_panel(
+                        LOADING_FRAMES[frame_index],
+                        status_message,
+                        output_lines,
+                        panel_width,
+                        progress,
+                    ),
+                    refresh=True,
+                )
+                last_redraw_at = now
+                needs_redraw = False
 
-            # Small sleep to prevent CPU spinning
-            time.sleep(0.1)
-
-        # Final check for any remaining output
-        for queue, content, color in [
-            (stdout_queue, stdout_content, "dim"),
-            (stderr_queue, stderr_content, "red"),
-        ]:
-            try:
-                while not queue.empty():
-                    line = queue.get_nowait()
-                    has_output = True
-                    content.append(line)
-                    output_lines.append(f"[{color}]{line}[/{color}]")
-                    all_output.append(line)
-                    if queue == stderr_queue:
-                        has_errors = True
-                    # Keep only the last 15 lines
-                    if len(output_lines) > 15:
-                        output_lines.pop(0)
-            except Empty:
-                pass
+        # Both streams are closed and the process has exited
+        returncode = communicate.result()
+        has_output = state["has_output"]
 
         # Determine if we should keep the panel based on success, failure, and configuration
-        success = process.returncode == 0 and not has_errors
-
+        success = returncode == 0 and not state["has_errors"]
         # Logic for whether to show output panel:
         # - Always show on failure (to help user debug)
         # - Hide on success if clear_on_success is True
@@ -220,7 +466,7 @@ def run_with_loading(
             if not success:
                 # On failure, always show error message
                 error_msg = (
-                    f"[bold red]✗ Command failed with exit code {process.returncode}[/]"
+                    f"[bold red]✗ Command failed with exit code {returncode}[/]"
                 )
                 final_output.append("")
                 final_output.append(error_msg)
@@ -269,31 +515,22 @@ def run_with_loading(
         # Ensure live display is stopped if not already
         if live.is_started:
             live.stop()
+        # Kills the process if we are leaving early (e.g. cancelled)
+        if not communicate.done():
+            communicate.cancel()
 
-    # Join threads
-    stdout_thread.join()
-    stderr_thread.join()
-
-    # We no longer show any automatic status messages
-
-    # Create a CompletedProcess-like object to return
-    stdout_str = "\n".join(stdout_content)
-    stderr_str = "\n".join(stderr_content)
-
-    class CompletedProcessLike:
-        def __init__(self, returncode, stdout, stderr):
-            self.returncode = returncode
-            self.stdout = stdout
-            self.stderr = stderr
-
-    return CompletedProcessLike(process.returncode, stdout_str, stderr_str)
+    return CompletedProcessLike(returncode, stdout_content, stderr_content)
 
 
 class OutputCapture:
-    """A context manager to capture console output."""
+    """A context manager to capture console output.
 
-    def __init__(self):
-        self.output = []
+    Captured strings are spooled like command output, so only ``spool_size``
+    bytes stay in memory however much a command prints.
+    """
+
+    def __init__(self, spool_size=DEFAULT_SPOOL_SIZE):
+        self.output = SpooledOutput(spool_size)
         self._original_print = console.print
 
     def __enter__(self):
@@ -314,6 +551,10 @@ class OutputCapture:
         # Restore original print
         console.print = self._original_print
 
+    def iter_output(self):
+        """Iterate over the captured output line by line."""
+        return iter(self.output)
+
     def get_output(self):
         """Return the captured output as a string."""
-        return "\n".join(self.output)
+        return self.output.getvalue()
@@ -1,13 +1,35 @@
 """Gradient text utilities for FlutterCraft CLI.
 
 Provides functions to create gradient text effects using Rich library.
+
+Renders are memoized on (text, colors, bold, italic, color system), together
+with the parsed color stops, the per-column color table for each line width
+and the Style for each color, so redrawing the header is a cache hit.
+
+Colors are quantized to the console's color system before spans are built,
+so characters that end up the same terminal color share one span, and
+whitespace gets no span at all. On a 256-color terminal the full-width logo
+needs a few dozen spans instead of one per character.
 """
 
+from functools import lru_cache
 from typing import List, Optional
-from rich.text import Text
-from rich.color import Color
+from rich.text import Span, Text
+from rich.color import Color, ColorSystem
 from rich.style import Style
 
+# Distinct (text, colors, bold, italic) renders kept; the header only ever
+# needs a handful (one per logo size and theme)
+_RENDER_CACHE_SIZE = 64
+
+# Console.color_system names; None (no color) maps to no color at all
+_COLOR_SYSTEMS = {
+    "truecolor": ColorSystem.TRUECOLOR,
+    "256": ColorSystem.EIGHT_BIT,
+    "standard": ColorSystem.STANDARD,
+    "windows": ColorSystem.WINDOWS,
+}
+
 
 def hex_to_rgb(hex_color: str) -> tuple[int, ...]:
     """Convert hex color to RGB tuple.
@@ -43,6 +65,7 @@ def create_gradient_text(
     colors: List[str],
     bold: bool = False,
     italic: bool = False,
+    color_system: Optional[str] = "truecolor",
 ) -> Text:
     """Create gradient text using Rich library.
 
@@ -51,68 +74,14 @@ def create_gradient_text(
         colors: List of hex colors for gradient (minimum 2)
         bold: Whether to make text bold
         italic: Whether to make text italic
+        color_system: Console color system to quantize colors to
+                      ("truecolor", "256", "standard", "windows" or None)
 
     Returns:
         Rich Text object with gradient applied
     """
-    if len(colors) < 2:
-        colors = colors * 2  # Duplicate if only one color
-
-    # Convert hex colors to RGB
-    rgb_colors = []
-    for color in colors:
-        try:
-            if color.startswith("#"):
-                rgb_colors.append(hex_to_rgb(color))
-            else:
-                # Try to parse as named color
-                c = Color.parse(color)
-                rgb_colors.append((c.triplet.red, c.triplet.green, c.triplet.blue))
-        except Exception:
-            # Fallback to white if color parsing fails
-            rgb_colors.append((255, 255, 255))
-
-    if len(rgb_colors) < 2:
-        rgb_colors.append(rgb_colors[0])
-
-    result = Text()
-    text_length = len(text)
-
-    if text_length == 0:
-        return result
-
-    # Calculate color for each character
-    for i, char in enumerate(text):
-        # Calculate position in gradient (0.0 to 1.0)
-        position = i / max(text_length - 1, 1)
-
-        # Find which color segment we're in
-        segment_count = len(rgb_colors) - 1
-        segment_position = position * segment_count
-        segment_index = min(int(segment_position), segment_count - 1)
-        local_position = segment_position - segment_index
-
-        # Interpolate between colors
-        color1 = rgb_colors[segment_index]
-        color2 = rgb_colors[min(segment_index + 1, len(rgb_colors) - 1)]
-        interpolated = interpolate_color(color1, color2, local_position)
-
-        # Create style with interpolated color
-        style_attrs = []
-        if bold:
-            style_attrs.append("bold")
-        if italic:
-            style_attrs.append("italic")
-
-        style = Style(
-            color=Color.from_rgb(*interpolated),
-            bold=bold,
-            italic=italic,
-        )
-
-        result.append(char, style=style)
-
-    return result
+    # Rendered Text is cached; hand out copies since Text is mutable
+    return _render(text, tuple(colors), bold, italic, color_system).copy()
 
 
 def create_gradient_multiline(
@@ -120,6 +89,7 @@ def create_gradient_multiline(
     colors: List[str],
     bold: bool = False,
     italic: bool = False,
+    color_system: Optional[str] = "truecolor",
 ) -> Text:
     """Create gradient text that works across multiple lines.
 
@@ -128,29 +98,149 @@ def create_gradient_multiline(
         colors: List of hex colors for gradient
         bold: Whether to make text bold
         italic: Whether to make text italic
+        color_system: Console color system to quantize colors to
 
     Returns:
         Rich Text object with gradient applied
     """
-    lines = text.split("\n")
-    result = Text()
-
-    for i, line in enumerate(lines):
-        if i > 0:
-            result.append("\n")
-        result.append(create_gradient_text(line, colors, bold, italic))
+    # Each line gets the full gradient across its own width
+    return _render(text, tuple(colors), bold, italic, color_system).copy()
 
-    return result
 
-
-def apply_gradient_to_ascii(ascii_art: str, colors: List[str]) -> Text:
+def apply_gradient_to_ascii(
+    ascii_art: str, colors: List[str], color_system: Optional[str] = "truecolor"
+) -> Text:
     """Apply gradient to ASCII art.
 
     Args:
         ascii_art: ASCII art string
         colors: List of hex colors for gradient
+        color_system: Console color system to quantize colors to
 
     Returns:
         Rich Text object with gradient applied to ASCII art
     """
-    return create_gradient_multiline(ascii_art, colors, bold=True)
+    return create_gradient_multiline(
+        ascii_art, colors, bold=True, color_system=color_system
+    )
+
+
+@lru_cache(maxsize=_RENDER_CACHE_SIZE)
+def _render(
+    text: str, colors: tuple, bold: bool, italic: bool, color_system: Optional[str]
+) -> Text:
+    """Build the gradient Text with one span per run of same-colored cells.
+
+    Whitespace never starts or ends a span; a run continues across it when
+    the next visible character has the same color.
+    """
+    stops = _color_stops(colors)
+    spans = []
+    offset = 0
+
+    for line in text.split("\n"):
+        styles = _style_table(stops, len(line), bold, italic, color_system)
+        run_style = None
+        run_start = run_end = 0
+        for column, char in enumerate(line):
+            if char.isspace():
+                continue
+            style = styles[column]
+            if style is not run_style:
+                if run_style is not None:
+                    spans.append(Span(offset + run_start, offset + run_end, run_style))
+                run_style, run_start = style, column
+            run_end = column + 1
+        if run_style is not None:
+            spans.append(Span(offset + run_start, offset + run_end, run_style))
+        offset += len(line) + 1
+
+    return Text(text, spans=spans)
+
+
+@lru_cache(maxsize=_RENDER_CACHE_SIZE)
+def _color_stops(colors: tuple) -> tuple:
+    """Parse gradient colors to RGB stops (at least two)."""
+    if len(colors) < 2:
+        colors = colors * 2  # Duplicate if only one color
+
+    # Convert hex colors to RGB
+    rgb_colors = []
+    for color in colors:
+        try:
+            if color.startswith("#"):
+                rgb_colors.append(hex_to_rgb(color))
+            else:
+                # Try to parse as named color
+                c = Color.parse(color)
+                rgb_colors.append((c.triplet.red, c.triplet.green, c.triplet.blue))
+        except Exception:
+            # Fallback to white if color parsing fails
+            rgb_colors.append((255, 255, 255))
+
+    if len(rgb_colors) < 2:
+        rgb_colors.append(rgb_colors[0])
+
+    return tuple(rgb_colors)
+
+
+@lru_cache(maxsize=_RENDER_CACHE_SIZE)
+def _color_table(stops: tuple, width: int) -> tuple:
+    """RGB color of each column of a ``width``-character gradient."""
+    if width == 0:
+        return ()
+
+    segment_count = len(stops) - 1
+    denominator = max(width - 1, 1)
+    table = []
+    for i in range(width):
+        # Position in the gradient (0.0 to 1.0), scaled to segments
+        segment_position = i / denominator * segment_count
+        segment_index = min(int(segment_position), segment_count - 1)
+        table.append(
+            interpolate_color(
+                stops[segment_index],
+                stops[segment_index + 1],
+                segment_position - segment_index,
+            )
+        )
+    return tuple(table)
+
+
+@lru_cache(maxsize=_RENDER_CACHE_SIZE)
+def _style_table(
+    stops: tuple, width: int, bold: bool, italic: bool, color_system: Optional[str]
+) -> tuple:
+    """Style of each column, with colors quantized to ``color_system``.
+
+    Columns that quantize to the same terminal color share one Style object,
+    which is what lets _render() merge them into a single span.
+    """
+    return tuple(
+        _style(rgb, bold, italic, color_system) for rgb in _color_table(stops, width)
+    )
+
+
+@lru_cache(maxsize=4096)
+def _style(
+    rgb: tuple, bold: bool, italic: bool, color_system: Optional[str]
+) -> Style:
+    return _quantized_style(_quantize(rgb, color_system), bold, italic)
+
+
+@lru_cache(maxsize=4096)
+def _quantized_style(color: Optional[Color], bold: bool, italic: bool) -> Style:
+    # Style objects are immutable, so one per color is shared by every render
+    return Style(color=color, bold=bold, italic=italic)
+
+
+def _quantize(rgb: tuple, color_system: Optional[str]) -> Optional[Color]:
+    """The color the terminal will actually show for ``rgb``."""
+    system = _COLOR_SYSTEMS.get(color_system)
+    if system is None:
+        return None
+    color = Color.from_rgb(*rgb)
+    if system == ColorSystem.TRUECOLOR:
+        return color
+    # Drop the original RGB so colors sharing a palette entry compare equal
+    return Color.from_ansi(color.downgrade(system).number)
@@ -40,10 +40,14 @@ class ThemeDisplayService:
         theme = self.theme_manager.get_current_theme()
 
         if FLUTTERCRAFT_ASCII_GRADIENT:
-            return apply_gradient_to_ascii(ascii_art, FLUTTERCRAFT_ASCII_GRADIENT)
+            return apply_gradient_to_ascii(
+                ascii_art, FLUTTERCRAFT_ASCII_GRADIENT, self.console.color_system
+            )
 
         if theme.gradient_colors:
-            return apply_gradient_to_ascii(ascii_art, theme.gradient_colors)
+            return apply_gradient_to_ascii(
+                ascii_art, theme.gradient_colors, self.console.color_system
+            )
 
         return Text(ascii_art, style=f"bold {theme.accent_cyan}")
 
@@ -84,7 +88,9 @@ class ThemeDisplayService:
         fvm_version = fvm_info.get("version") or "Not installed"
 
         flutter_version = flutter_info.get("current_version")
-        if flutter_version:
+        if flutter_info.get("pending"):
+            flutter_display = f"[{theme.semantic.text_secondary}]checking...[/]"
+        elif flutter_version:
             if flutter_info.get("update_available"):
                 latest = flutter_info.get("latest_version", "unknown")
                 flutter_display = (
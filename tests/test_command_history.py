@@ -0,0 +1,68 @@
+import json
+import subprocess
+import sys
+import time
+
+from fluttercraft.utils.command_history import PersistentHistory
+
+
+def _lines(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def _fill(path, count):
+    path.write_text("".join(json.dumps(f"cmd{i % 30}") + "\n" for i in range(count)))
+
+
+def test_compaction_keeps_commands_appended_by_another_handle(tmp_path):
+    _fill(tmp_path / "history", 100)
+    history = PersistentHistory(config_dir=tmp_path, max_entries=10)
+    other = PersistentHistory(config_dir=tmp_path, max_entries=10)
+
+    read = history._read
+
+    def read_then_append(offset=0):
+        result = read(offset)
+        if offset == 0:
+            # Lands between the first read and the locked replace
+            other.store_string("from the other handle")
+        return result
+
+    history._read = read_then_append
+    history.start_loading()
+    assert history.wait_loaded(5)
+
+    lines = _lines(tmp_path / "history")
+    assert len(lines) == 10
+    assert lines[-1] == "from the other handle"
+
+
+def test_other_sessions_wait_for_the_compaction_to_finish(tmp_path):
+    _fill(tmp_path / "history", 100)
+    history = PersistentHistory(config_dir=tmp_path, max_entries=10)
+    appender = (
+        "import sys, pathlib\n"
+        "from fluttercraft.utils.command_history import PersistentHistory\n"
+        "PersistentHistory(config_dir=pathlib.Path(sys.argv[1]))"
+        ".store_string('from another session')\n"
+    )
+
+    write = history._write
+    processes = []
+
+    def write_while_another_session_appends(entries):
+        process = subprocess.Popen([sys.executable, "-c", appender, str(tmp_path)])
+        processes.append(process)
+        time.sleep(1)
+        # Still blocked on the history lock
+        assert process.poll() is None
+        write(entries)
+
+    history._write = write_while_another_session_appends
+    history.start_loading()
+    assert history.wait_loaded(10)
+    assert processes[0].wait(10) == 0
+
+    lines = _lines(tmp_path / "history")
+    assert len(lines) == 11
+    assert lines[-1] == "from another session"
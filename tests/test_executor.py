@@ -0,0 +1,58 @@
+import asyncio
+import sys
+import threading
+
+from rich.console import Console
+
+from fluttercraft.commands.core import CommandExecutor, CommandMetadata, CommandRegistry
+from fluttercraft.commands.core.base import Command
+from fluttercraft.commands.core.jobs import get_job_manager
+from fluttercraft.commands.core.models import CommandContext, CommandResult
+
+
+class _EchoCommand(Command):
+    def __init__(self):
+        super().__init__(CommandMetadata(name="echo", help_text="", category="test"))
+        self.calls = []
+
+    def execute(self, context, args):
+        self.calls.append(("sync", args))
+        return CommandResult(success=True)
+
+    async def execute_async(self, context, args):
+        await asyncio.sleep(0)
+        self.calls.append(("async", args))
+        return CommandResult(success=True)
+
+
+def _executor():
+    registry = CommandRegistry()
+    command = _EchoCommand()
+    registry.register(command)
+    return CommandExecutor(registry=registry, console=Console()), command
+
+
+def _context():
+    return CommandContext(
+        platform_info={}, flutter_info={}, fvm_info={}, console=Console(),
+        prompt_history=[],
+    )
+
+
+def test_dispatch_async_awaits_execute_async():
+    executor, command = _executor()
+    result = asyncio.run(executor.dispatch_async('echo "a b" c', _context()))
+    assert result.success
+    assert command.calls == [("async", ["a b", "c"])]
+
+
+def test_background_jobs_run_through_dispatch_async(monkeypatch):
+    # Jobs reroute sys.stdout and report through notify when they finish
+    monkeypatch.setattr(sys, "stdout", sys.stdout)
+    finished = threading.Event()
+    monkeypatch.setattr(get_job_manager(), "notify", lambda _: finished.set())
+
+    executor, command = _executor()
+    executor.dispatch('echo ">=3.16 <3.22" &', _context())
+    assert finished.wait(5)
+    assert command.calls == [("async", [">=3.16 <3.22"])]
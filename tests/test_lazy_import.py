@@ -0,0 +1,31 @@
+import subprocess
+import sys
+
+
+def _run(code):
+    return subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout.split()
+
+
+def test_package_exports_load_on_first_access():
+    loaded = _run(
+        "import sys, fluttercraft.commands.fvm as fvm\n"
+        "print('fluttercraft.commands.fvm.releases' in sys.modules)\n"
+        "fvm.fvm_releases_command\n"
+        "print('fluttercraft.commands.fvm.releases' in sys.modules)\n"
+        "print('fvm_list_command' in dir(fvm))\n"
+        "print('fluttercraft.commands.fvm.list' in sys.modules)"
+    )
+    assert loaded == ["False", "True", "True", "False"]
+
+
+def test_unknown_export_raises_attribute_error():
+    import fluttercraft.utils as utils
+
+    try:
+        utils.not_a_real_name
+    except AttributeError as exc:
+        assert "not_a_real_name" in str(exc)
+    else:
+        raise AssertionError("expected AttributeError")
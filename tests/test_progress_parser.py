@@ -0,0 +1,28 @@
+from fluttercraft.utils.progress_parser import ProgressParser, ProgressTracker
+from fluttercraft.utils.terminal_utils import _track_progress
+
+
+def test_known_progress_labels_are_parsed():
+    parser = ProgressParser()
+    for line in ("Downloading: 45%", "Extracting Dart SDK... 45.6%"):
+        event = parser.parse(line)
+        assert event is not None and event.unit == "percent"
+
+    event = parser.parse("Receiving objects:  45% (1234/2742), 12.34 MiB | 5.67 MiB/s")
+    assert event.task == "Receiving objects"
+    assert event.total == 2742
+
+
+def test_ordinary_percentage_line_stays_in_the_output():
+    parser, tracker = ProgressParser(), ProgressTracker()
+    line = "Test coverage: 85%"
+    assert parser.parse(line) is None
+    assert _track_progress(parser, tracker, line) is False
+    assert not tracker.has_tasks
+
+
+def test_stage_patterns_are_anchored_to_the_line_start():
+    parser = ProgressParser()
+    assert parser.parse("Installing version 3.24.0...").is_stage
+    assert parser.parse("Cloning into 'flutter'...").is_stage
+    assert parser.parse("Error while Installing version 3.24.0") is None
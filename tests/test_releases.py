@@ -0,0 +1,20 @@
+from fluttercraft.commands.fvm.releases import _page_footer
+
+
+def test_footer_is_omitted_when_every_release_is_shown():
+    assert _page_footer(0, 10, 10, 0, 50) is None
+
+
+def test_footer_pages_back_from_the_newest():
+    footer = _page_footer(40, 90, 100, 10, 50)
+    assert footer.startswith("Showing 41-90 of 100")
+    assert "Older: --offset 60." in footer
+    assert "Newer: --offset 0." in footer
+
+
+def test_footer_without_limit_points_newer_at_offset_zero():
+    # --limit 0 --offset 30 shows everything older than the 30 newest
+    footer = _page_footer(0, 70, 100, 30, 0)
+    assert footer.startswith("Showing 1-70 of 100")
+    assert "Older:" not in footer
+    assert "Newer: --offset 0." in footer